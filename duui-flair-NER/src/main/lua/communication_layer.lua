@@ -15,9 +15,12 @@ function serialize(inputCas, outputStream, parameters)
 
     local language = nil
     local optional_tag_map = nil
+    local pos_language = nil
     if parameters then
         language = parameters["language"]
         optional_tag_map = parameters["optional_tag_map"]
+        -- Optional, also run the POS tagger of this language, sharing the embeddings
+        pos_language = parameters["pos_language"]
     else
         print("No parameters were given, inferring language from CAS")
     end
@@ -28,24 +31,25 @@ function serialize(inputCas, outputStream, parameters)
         error("Document language was not given and could not be inferred", 2)
     end
     
-    local sentences = {}
+    -- Only send the sentence offsets, the sentence texts are sliced from the document text by the annotator
+    local sentence_begins = {}
+    local sentence_ends = {}
     local sent_counter = 1
     local sents = JCasUtil:select(inputCas, Sentence):iterator()
     while sents:hasNext() do
         local sent = sents:next()
-        local sent_begin = sent:getBegin()
-        local sent_text = sent:getCoveredText()
-        sentences[sent_counter] = {}
-        sentences[sent_counter]["offset"] = sent_begin
-        sentences[sent_counter]["coveredText"] = sent_text
+        sentence_begins[sent_counter] = sent:getBegin()
+        sentence_ends[sent_counter] = sent:getEnd()
         sent_counter = sent_counter + 1
     end
     -- Encode data as JSON object and write to stream
     outputStream:write(json.encode({
         text = document_text,
         language = language,
-        sentences = sentences,
-        optional_tag_map = optional_tag_map
+        sentence_begins = sentence_begins,
+        sentence_ends = sentence_ends,
+        optional_tag_map = optional_tag_map,
+        pos_language = pos_language
     }))
 end
 
@@ -76,4 +80,15 @@ function deserialize(inputCas, inputStream)
         annotation:addToIndexes()
     end
 
+    -- Add POS, only in combined POS+NER mode
+    if results["pos_tags"] ~= nil then
+        for i, tag in ipairs(results["pos_tags"]) do
+            local pos = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.lexmorph.type.pos.POS", inputCas)
+            pos:setBegin(tag["begin"])
+            pos:setEnd(tag["end"])
+            pos:setPosValue(tag["pos_value"])
+            pos:addToIndexes()
+        end
+    end
+
 end
@@ -1,9 +1,9 @@
 import logging
-import math
 import os
 import sys
 from functools import lru_cache
-from typing import Final, Dict, List, Optional, Iterable, Callable, TypeVar
+from itertools import accumulate
+from typing import Final, Dict, List, Optional, Iterable, Callable, TypeVar, Union
 
 import flair
 from fastapi import FastAPI, Response
@@ -20,6 +20,10 @@ MODEL_CACHE_SIZE: Final[int] = int(os.environ.get("MODEL_CACHE_SIZE", 1))
 logger.info(f"MODEL_CACHE_SIZE={MODEL_CACHE_SIZE}")
 BATCH_SIZE: Final[int] = int(os.environ.get("FLAIR_BATCH_SIZE", 128))
 logger.info(f"BATCH_SIZE={BATCH_SIZE}")
+BATCH_TOKENS: Final[int] = int(os.environ.get("FLAIR_BATCH_TOKENS", 4096))
+logger.info(f"BATCH_TOKENS={BATCH_TOKENS}")
+MINI_BATCH_SIZE: Final[int] = int(os.environ.get("FLAIR_MINI_BATCH_SIZE", 32))
+logger.info(f"MINI_BATCH_SIZE={MINI_BATCH_SIZE}")
 
 app = FastAPI(
     openapi_url="/openapi.json",
@@ -106,6 +110,26 @@ lang_code_to_model_map: Final[Dict[str, str]] = {
 supported_languages: Final[List[str]] = list(
     sorted(lang_code_to_model_map.keys()))
 
+# POS taggers for the combined POS+NER mode, same as in duui-flair-POS
+pos_lang_code_to_model_map: Final[Dict[str, str]] = {
+    "en": "pos",  # English
+    "en-fast": "pos-fast",  # English Fast
+    "en-upos": "upos",  # English UPOS
+    "en-upos-fast": "upos-fast",  # English UPOS Fast
+    "multi": "pos-multi",  # Multilingual
+    "multi-fast": "pos-multi-fast",  # Multilingual Fast
+    "ar": "ar-pos",  # Arabic
+    "de": "de-pos",  # German
+    "de-twitter": "de-pos-tweets",  # German Tweets
+    "da": "da-pos",  # Danish
+    "ms": "ml-pos",  # Malay
+    "ms-upos": "ml-upos",  # Malay UPOS
+    "pt": "pt-pos-clinical",  # Portuguese
+    "uk": "pos-ukrainian",  # Ukrainian
+}
+pos_supported_languages: Final[List[str]] = list(
+    sorted(pos_lang_code_to_model_map.keys()))
+
 
 # Return Lua communication script
 @app.get("/v1/communication_layer", response_class=PlainTextResponse)
@@ -208,6 +232,21 @@ class DkproNer(BaseModel):
     ner_type: str = ner_base_type
 
 
+class DkproPos(BaseModel):
+    """
+    Models the DKPRO POS type, de.tudarmstadt.ukp.dkpro.core.api.lexmorph.type.pos.POS
+    """
+
+    # Inherited from uima.tcas.Annotation
+    begin: int
+    # Inherited from uima.tcas.Annotation
+    end: int
+    # Fine-grained POS tag. This is the tag as produced by a POS tagger or obtained from a reader.
+    pos_value: str
+    # Coarse-grained POS tag. This may be produced by a POS tagger or reader in addition to the fine-grained tag.
+    coarse_value: str
+
+
 def get_ner_type(o_tag: str) -> str:
     if o_tag in ner_tag_map:
         return ner_types[ner_tag_map[o_tag]]
@@ -242,6 +281,8 @@ def get_documentation() -> TextImagerDocumentation:
         docker_container_id="docker.texttechnologylab.org/flair/pos:latest",
         parameters={
             "language": "de",
+            # optional, runs the POS tagger of this language on the same sentences
+            "pos_language": None,
         },
         capability=capabilities,
         implementation_specific=None,
@@ -257,12 +298,53 @@ class Message(BaseModel):
 class TextImagerRequest(BaseModel):
     text: str
     language: str
-    sentences: List[DkproSentence]
+    # Either the sentences with their text, or only their offsets (compact format), the text is sliced server-side
+    sentences: Optional[List[DkproSentence]] = None
+    sentence_begins: Optional[List[int]] = None
+    sentence_ends: Optional[List[int]] = None
     optional_tag_map: Optional[Dict[str, str]]
+    # Language of a POS tagger to run on the same sentences, sharing the embeddings with the NER tagger
+    pos_language: Optional[str] = None
 
 
 class TextImagerResponse(BaseModel):
     tags: List[DkproNer]
+    # Only in combined POS+NER mode
+    pos_tags: Optional[List[DkproPos]] = None
+
+
+def get_text_slicer(text: str) -> Callable[[int, int], str]:
+    """
+    Slice the text by UTF-16 offsets as used in UIMA, these only differ from Python offsets after astral characters.
+    """
+    if not text or max(text) <= "\uffff":
+        return lambda begin, end: text[begin:end]
+
+    text_utf16 = text.encode("utf-16-le", "surrogatepass")
+    return lambda begin, end: text_utf16[2 * begin:2 * end].decode("utf-16-le", "surrogatepass")
+
+
+def get_utf16_offsets(text: str) -> Callable[[int], int]:
+    """
+    Convert Python offsets in the text to UTF-16 offsets as used in UIMA, these only differ after astral characters.
+    """
+    if not text or max(text) <= "\uffff":
+        return lambda offset: offset
+
+    astral_before = list(accumulate((character > "\uffff" for character in text), initial=0))
+    return lambda offset: offset + astral_before[offset]
+
+
+def get_sentences(request: TextImagerRequest) -> Optional[List[DkproSentence]]:
+    if request.sentence_begins is None:
+        return request.sentences
+
+    # the offsets are already validated and the slices are strings, skip validating every sentence
+    slice_text = get_text_slicer(request.text)
+    return [
+        DkproSentence.construct(offset=begin, coveredText=slice_text(begin, end))
+        for begin, end in zip(request.sentence_begins, request.sentence_ends)
+    ]
 
 
 @lru_cache(maxsize=MODEL_CACHE_SIZE)
@@ -270,10 +352,31 @@ def load_model(lang: str) -> SequenceTagger:
     return SequenceTagger.load(lang)
 
 
-def batcher(iterable: List[T], batch_size=BATCH_SIZE) -> Iterable[List[T]]:
-    _len = len(iterable)
-    for start in range(0, _len, batch_size):
-        yield list(iterable[start:start + batch_size])
+# Separate cache, so the POS tagger of the combined mode does not evict the NER tagger
+@lru_cache(maxsize=MODEL_CACHE_SIZE)
+def load_pos_model(lang: str) -> SequenceTagger:
+    return SequenceTagger.load(lang)
+
+
+def length_batcher(
+        sentences: List[DkproSentence],
+        batch_size=BATCH_SIZE,
+        batch_tokens=BATCH_TOKENS
+) -> Iterable[List[int]]:
+    """
+    Batch the indices of the sentences sorted by length, with at most batch_size sentences and batch_tokens tokens
+    per batch, a sentence longer than batch_tokens gets its own batch. Tokens are estimated by whitespace.
+    """
+    lengths = [len(sentence.coveredText.split()) for sentence in sentences]
+    batch, batch_len = [], 0
+    for idx in sorted(range(len(sentences)), key=lengths.__getitem__):
+        if batch and (len(batch) >= batch_size or batch_len + lengths[idx] > batch_tokens):
+            yield batch
+            batch, batch_len = [], 0
+        batch.append(idx)
+        batch_len += lengths[idx]
+    if batch:
+        yield batch
 
 
 def flatten(iterable: Iterable[Iterable[T]]) -> Iterable[T]:
@@ -304,7 +407,30 @@ def post_process(request: TextImagerRequest):
                 )
             },
         )
+    pos_language = request.pos_language
+    if pos_language is not None and pos_language not in pos_supported_languages:
+        supported_lang_string = ", ".join(pos_supported_languages)
+        return JSONResponse(
+            status_code=400,
+            content={
+                "message": (
+                    f"The selected POS language '{pos_language}' is not supported. "
+                    f"Supported POS languages: {supported_lang_string}"
+                )
+            },
+        )
+    if request.sentence_begins is not None and (
+            request.sentence_ends is None or len(request.sentence_begins) != len(request.sentence_ends)
+    ):
+        return JSONResponse(
+            status_code=400,
+            content={
+                "message": "The sentence_begins and sentence_ends MUST have the same length."
+            },
+        )
+    sentences = get_sentences(request)
     model = load_model(lang_code_to_model_map[language])
+    pos_model = load_pos_model(pos_lang_code_to_model_map[pos_language]) if pos_language is not None else None
     text = request.text
     if request.optional_tag_map:
         tag_map = request.optional_tag_map
@@ -315,18 +441,24 @@ def post_process(request: TextImagerRequest):
     else:
         tag_lookup = get_ner_type
 
-    if request.sentences:
-        total_batches = math.ceil(len(request.sentences) / BATCH_SIZE * 1.)
+    if sentences:
+        batches = list(length_batcher(sentences))
+        total_batches = len(batches)
 
-        def process_verbose(idx, batch: List[T]) -> Iterable[T]:
+        # annotations per sentence, to restore the order of the sentences
+        sentence_annotations: List[List[Union[DkproNer, DkproPos]]] = [[] for _ in sentences]
+        for idx, batch in enumerate(batches, start=1):
             logger.info(f"Processing batch {idx}/{total_batches}")
-            return process_batch(model, text, batch, tag_lookup)
-
-        tags = list(flatten(
-            process_verbose(idx, batch)
-            for idx, batch in enumerate(batcher(request.sentences, BATCH_SIZE), start=1)
-        ))
-        return TextImagerResponse(tags=tags)
+            batch_annotations = process_batch(model, text, [sentences[i] for i in batch], tag_lookup, pos_model)
+            for i, annotations in zip(batch, batch_annotations):
+                sentence_annotations[i] = annotations
+
+        annotations = list(flatten(sentence_annotations))
+        tags = [annotation for annotation in annotations if isinstance(annotation, DkproNer)]
+        if pos_model is None:
+            return TextImagerResponse(tags=tags)
+        pos_tags = [annotation for annotation in annotations if isinstance(annotation, DkproPos)]
+        return TextImagerResponse(tags=tags, pos_tags=pos_tags)
     else:
         return JSONResponse(
             status_code=400,
@@ -340,8 +472,9 @@ def process_batch(
         model: SequenceTagger,
         text: str,
         batch: List[DkproSentence],
-        tag_lookup: Callable[[str], str]
-) -> Iterable[DkproNer]:
+        tag_lookup: Callable[[str], str],
+        pos_model: Optional[SequenceTagger] = None,
+) -> List[List[Union[DkproNer, DkproPos]]]:
     sentences: List[Sentence] = [
         Sentence(
             dkpro_sentence.coveredText,
@@ -349,16 +482,48 @@ def process_batch(
         )
         for dkpro_sentence in batch
     ]
-    model.predict(sentences)
-    for sentence in sentences:
-        for label in sentence.get_labels("ner"):
-            begin = label.data_point.start_position + sentence.start_position
-            end = label.data_point.end_position + sentence.start_position
-            tag_type = tag_lookup(label.value)
-            yield DkproNer(
-                begin=begin,
-                end=end,
-                value=label.value,
-                identifier=None,
-                ner_type=tag_type,
-            )
+    if pos_model is not None:
+        # Keep the embeddings on the sentences, the NER tagger does not compute embeddings with the same name again,
+        # e.g. the Flair embeddings of the same language model. Flair stores or releases the embeddings of all
+        # sentences after each mini batch, so the NER tagger keeps them too and they are released afterwards.
+        embedding_storage_mode = "gpu" if flair.device.type == "cuda" else "cpu"
+        pos_model.predict(sentences, mini_batch_size=MINI_BATCH_SIZE, embedding_storage_mode=embedding_storage_mode)
+        model.predict(sentences, mini_batch_size=MINI_BATCH_SIZE, embedding_storage_mode=embedding_storage_mode)
+        for sentence in sentences:
+            sentence.clear_embeddings()
+    else:
+        # flair's mini batches bound the memory of the embeddings, release them right after each mini batch
+        model.predict(sentences, mini_batch_size=MINI_BATCH_SIZE, embedding_storage_mode="none")
+    return [
+        process_sentence(sentence, dkpro_sentence.coveredText, tag_lookup, pos_model)
+        for sentence, dkpro_sentence in zip(sentences, batch)
+    ]
+
+
+def process_sentence(
+        sentence: Sentence,
+        sentence_text: str,
+        tag_lookup: Callable[[str], str],
+        pos_model: Optional[SequenceTagger] = None,
+) -> List[Union[DkproNer, DkproPos]]:
+    # the token offsets in the sentence are Python offsets, the sentence offset is a UTF-16 offset
+    to_utf16 = get_utf16_offsets(sentence_text)
+    annotations = []
+    if pos_model is not None:
+        for label in sentence.get_labels(pos_model.tag_type):
+            begin = to_utf16(label.data_point.start_position) + sentence.start_position
+            end = to_utf16(label.data_point.end_position) + sentence.start_position
+            annotations.append(DkproPos(begin=begin, end=end,
+                                        pos_value=label.value, coarse_value=""))
+    for label in sentence.get_labels("ner"):
+        begin = to_utf16(label.data_point.start_position) + sentence.start_position
+        end = to_utf16(label.data_point.end_position) + sentence.start_position
+        tag_type = tag_lookup(label.value)
+        annotations.append(DkproNer(
+            begin=begin,
+            end=end,
+            value=label.value,
+            identifier=None,
+            ner_type=tag_type,
+        ))
+    return annotations
@@ -1,5 +1,6 @@
 package org.texttechnologylab.duui.test;
 
+import de.tudarmstadt.ukp.dkpro.core.api.lexmorph.type.pos.POS;
 import de.tudarmstadt.ukp.dkpro.core.api.ner.type.NamedEntity;
 import de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence;
 import org.apache.uima.fit.factory.JCasFactory;
@@ -103,6 +104,52 @@ class TestSuccessNer {
 }
 
 
+@TestInstance(TestInstance.Lifecycle.PER_CLASS)
+class TestSuccessPosNer {
+    private DUUIComposer composer;
+
+    @BeforeAll
+    void initialize() throws Exception {
+        this.composer = new DUUIComposer()
+                .withLuaContext(
+                        new DUUILuaContext()
+                                .withJsonLibrary()
+                )
+                .withSkipVerification(true);
+
+        this.composer.addDriver(new DUUIRemoteDriver(100));
+        this.composer.add(
+                new DUUIRemoteDriver.Component("http://localhost:9714")
+                        .withParameter("language", "de")
+                        .withParameter("pos_language", "de")
+        );
+    }
+
+    @AfterAll
+    void shutdown() throws UnknownHostException {
+        this.composer.shutdown();
+    }
+
+    @Test
+    void test_washington() throws Exception {
+        JCas jCas = JCasFactory.createJCas();
+        jCas.setDocumentText(
+                "George Washington ging nach Washington."
+        );
+        jCas.setDocumentLanguage("de");
+
+        Sentence sentence = new Sentence(jCas, 0, 39);
+        sentence.addToIndexes(jCas);
+
+        composer.run(jCas);
+
+        assert JCasUtil.select(jCas, NamedEntity.class).size() > 0;
+        // one POS tag per token
+        assert JCasUtil.select(jCas, POS.class).size() == 6;
+    }
+}
+
+
 class TestFailureNer {
     @Test
     public void test_no_lang_param() throws Exception {
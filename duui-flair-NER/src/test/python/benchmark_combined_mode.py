@@ -0,0 +1,91 @@
+"""
+Throughput of the combined POS+NER mode compared to the two-service setup, the Flair POS service and this service
+each tagging the same document, using taggers that share the Flair embeddings of a randomly initialised character
+language model.
+
+Run from the component root: python src/test/python/benchmark_combined_mode.py
+"""
+import os
+import random
+import sys
+import tempfile
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_taggers, import_service
+
+SENTENCES = 2000
+LM_HIDDEN_SIZE = 512
+POS_SERVICE = Path(__file__).parents[4] / "duui-flair-POS" / "src" / "main" / "python" / "wsgi.py"
+
+WORDS = ["Anna", "wohnt", "in", "Berlin", "und", "arbeitet", "bei", "Siemens", "seit", "dem", "Sommer", "mit", "Bob"]
+
+
+def synthetic_document():
+    text, begins, ends = "", [], []
+    for _ in range(SENTENCES):
+        sentence = " ".join(random.choice(WORDS) for _ in range(random.randint(5, 20))) + "."
+        begins.append(len(text))
+        text += sentence
+        ends.append(len(text))
+        text += " "
+    return text, begins, ends
+
+
+def import_pos_service(work_dir):
+    # the POS service module is also named "wsgi", load it under another name
+    spec = spec_from_file_location("flair_pos_wsgi", POS_SERVICE)
+    module = module_from_spec(spec)
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+def main():
+    random.seed(0)
+    text, begins, ends = synthetic_document()
+    request = {"text": text, "language": "de", "sentence_begins": begins, "sentence_ends": ends}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        paths = build_test_taggers(tmp_dir, lm_hidden_size=LM_HIDDEN_SIZE)
+        ner_service = import_service(tmp_dir)
+        pos_service = import_pos_service(tmp_dir)
+        ner_service.lang_code_to_model_map["de"] = paths["ner"]
+        ner_service.pos_lang_code_to_model_map["de"] = paths["pos"]
+        pos_service.lang_code_to_model_map["de"] = paths["pos"]
+        ner_client = TestClient(ner_service.app)
+        pos_client = TestClient(pos_service.app)
+
+        # load the models before measuring
+        short_request = {**request, "sentence_begins": begins[:1], "sentence_ends": ends[:1]}
+        pos_client.post("/v1/process", json=short_request)
+        ner_client.post("/v1/process", json={**short_request, "pos_language": "de"})
+
+        start = perf_counter()
+        pos_tags = pos_client.post("/v1/process", json=request).json()["tags"]
+        tags = ner_client.post("/v1/process", json=request).json()["tags"]
+        two_services = perf_counter() - start
+        print(f"POS service + NER service: {two_services:.2f} s, {SENTENCES / two_services:.0f} sentences/s")
+
+        start = perf_counter()
+        combined = ner_client.post("/v1/process", json={**request, "pos_language": "de"}).json()
+        duration = perf_counter() - start
+        print(f"combined POS+NER: {duration:.2f} s, {SENTENCES / duration:.0f} sentences/s")
+
+        assert combined["tags"] == tags
+        assert [(t["begin"], t["end"], t["pos_value"]) for t in combined["pos_tags"]] == [
+            (t["begin"], t["end"], t["pos_value"]) for t in pos_tags
+        ]
+
+
+if __name__ == "__main__":
+    main()
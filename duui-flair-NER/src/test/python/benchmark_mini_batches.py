@@ -0,0 +1,85 @@
+"""
+Peak RSS and throughput of tagging 2000 sentences with flair mini batches of 32 sentences compared to predicting
+each length batch of up to 128 sentences at once, for the NER tagger alone and the combined POS+NER mode, using
+taggers with the Flair embeddings of a randomly initialised character language model. Each configuration runs in
+its own process, so the peak RSS is not shared between them.
+
+Run from the component root: python src/test/python/benchmark_mini_batches.py
+"""
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_taggers, import_service
+
+SENTENCES = 2000
+LM_HIDDEN_SIZE = 1024
+MINI_BATCH_SIZES = [32, 128]
+
+WORDS = ["Anna", "wohnt", "in", "Berlin", "und", "arbeitet", "bei", "Siemens", "seit", "dem", "Sommer", "mit", "Bob"]
+
+
+def synthetic_document():
+    random.seed(0)
+    text, begins, ends = "", [], []
+    for _ in range(SENTENCES):
+        sentence = " ".join(random.choice(WORDS) for _ in range(random.randint(5, 40))) + "."
+        begins.append(len(text))
+        text += sentence
+        ends.append(len(text))
+        text += " "
+    return {"text": text, "language": "de", "sentence_begins": begins, "sentence_ends": ends}
+
+
+def run(model_dir, mode):
+    # runs in a new process, with FLAIR_MINI_BATCH_SIZE set
+    from fastapi.testclient import TestClient
+
+    model_dir = Path(model_dir)
+    service = import_service(model_dir)
+    service.lang_code_to_model_map["de"] = str(model_dir / "ner.pt")
+    service.pos_lang_code_to_model_map["de"] = str(model_dir / "pos.pt")
+    client = TestClient(service.app)
+
+    request = synthetic_document()
+    if mode == "combined":
+        request["pos_language"] = "de"
+    # load the models before measuring
+    client.post("/v1/process", json={**request, "sentence_begins": [0], "sentence_ends": [request["sentence_ends"][0]]})
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    start = perf_counter()
+    assert client.post("/v1/process", json=request).status_code == 200
+    duration = perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{mode}, mini batch {service.MINI_BATCH_SIZE}: {duration:.2f} s, {SENTENCES / duration:.0f} sentences/s, "
+        f"peak RSS {peak_rss:.0f} MB (+{peak_rss - rss_before:.0f} MB while tagging)",
+        flush=True
+    )
+
+
+def main():
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_taggers(Path(model_dir), lm_hidden_size=LM_HIDDEN_SIZE)
+        for mode in ["ner", "combined"]:
+            for mini_batch_size in MINI_BATCH_SIZES:
+                subprocess.run(
+                    [sys.executable, __file__, model_dir, mode],
+                    env={**os.environ, "FLAIR_MINI_BATCH_SIZE": str(mini_batch_size)},
+                    check=True
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run(*sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,80 @@
+"""
+JSON size and parse time of a request with the sentences and their text compared to the compact format with only
+the sentence offsets, for large synthetic documents with and without astral characters. The parse time includes
+validating the request and getting the sentences with get_sentences, which slices the text for the compact format.
+
+Run from the component root: python src/test/python/benchmark_sentence_offsets.py
+"""
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import import_service
+
+SENTENCES = [10000, 100000]
+REPEAT = 5
+
+WORDS = ["Anna", "wohnt", "in", "Berlin", "und", "arbeitet", "bei", "Siemens", "seit", "dem", "Sommer", "mit", "Bob"]
+
+
+def synthetic_document(sentences_count, astral):
+    # offsets are UTF-16 code units, like in UIMA
+    random.seed(0)
+    text, begins, ends, length = "", [], [], 0
+    for _ in range(sentences_count):
+        words = [random.choice(WORDS) for _ in range(random.randint(5, 40))]
+        if astral:
+            words.append("\U0001F600")
+        sentence = " ".join(words) + "."
+        begins.append(length)
+        text += sentence + " "
+        length += len(sentence.encode("utf-16-le")) // 2
+        ends.append(length)
+        length += 1
+    return text, begins, ends
+
+
+def requests(sentences_count, astral):
+    text, begins, ends = synthetic_document(sentences_count, astral)
+    text_utf16 = text.encode("utf-16-le")
+    sentences = [
+        {"offset": begin, "coveredText": text_utf16[2 * begin:2 * end].decode("utf-16-le")}
+        for begin, end in zip(begins, ends)
+    ]
+    common = {"text": text, "language": "de", "optional_tag_map": None}
+    return {
+        "sentences": json.dumps({**common, "sentences": sentences}, ensure_ascii=False).encode("utf-8"),
+        "sentence offsets": json.dumps({**common, "sentence_begins": begins, "sentence_ends": ends}, ensure_ascii=False).encode("utf-8"),
+    }
+
+
+def parse(service, payload):
+    return service.get_sentences(service.TextImagerRequest.parse_raw(payload))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as work_dir:
+        service = import_service(Path(work_dir))
+
+    for sentences_count in SENTENCES:
+        for astral in [False, True]:
+            parsed = {}
+            for request_format, payload in requests(sentences_count, astral).items():
+                durations = []
+                for _ in range(REPEAT):
+                    start = perf_counter()
+                    parsed[request_format] = parse(service, payload)
+                    durations.append(perf_counter() - start)
+                print(
+                    f"{sentences_count} sentences{', astral' if astral else ''}, {request_format}: "
+                    f"{len(payload) / 1024 / 1024:.1f} MB, parse {min(durations) * 1000:.0f} ms"
+                )
+            assert parsed["sentences"] == parsed["sentence offsets"]
+
+
+if __name__ == "__main__":
+    main()
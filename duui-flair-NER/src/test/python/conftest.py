@@ -0,0 +1,98 @@
+import os
+import shutil
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+MAIN_DIR = Path(__file__).parents[2] / "main"
+
+CHARACTERS = "abcdefghijklmnopqrstuvwxyzäöüßABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜ0123456789 .,!?-\U0001F600"
+
+
+def build_test_taggers(model_dir: Path, seed: int = 0, lm_hidden_size: int = 16) -> dict:
+    """
+    Save a tiny randomly initialised NER and POS tagger to model_dir, both use the Flair embeddings of the same
+    character language model, like the German NER and POS models. Returns the paths by tag type.
+    """
+    import flair
+    import torch
+    from flair.data import Dictionary
+    from flair.embeddings import FlairEmbeddings
+    from flair.models import LanguageModel, SequenceTagger
+
+    torch.manual_seed(seed)
+    characters = Dictionary()
+    for character in CHARACTERS:
+        characters.add_item(character)
+    embeddings = FlairEmbeddings(LanguageModel(characters, True, lm_hidden_size, 1, embedding_size=8))
+
+    paths = {}
+    for tag_type, tags in [("ner", ["PER", "LOC", "ORG"]), ("pos", ["NN", "NE", "VVFIN", "ART", "$."])]:
+        tag_dictionary = Dictionary(add_unk=False)
+        for tag in tags:
+            tag_dictionary.add_item(tag)
+        tagger = SequenceTagger(hidden_size=8, embeddings=embeddings, tag_dictionary=tag_dictionary, tag_type=tag_type)
+        paths[tag_type] = str(model_dir / f"{tag_type}.pt")
+        tagger.save(paths[tag_type])
+    flair.device = torch.device("cpu")
+    return paths
+
+
+def import_service(work_dir: Path):
+    # the service reads its resources from the working directory, like in the Docker image
+    shutil.copy(MAIN_DIR / "lua" / "communication_layer.lua", work_dir / "communication_layer.lua")
+    shutil.copy(MAIN_DIR / "resources" / "dkpro-core-types.xml", work_dir / "dkpro-core-types.xml")
+    sys.path.insert(0, str(MAIN_DIR / "python"))
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        return import_module("wsgi")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def tagger_paths(tmp_path_factory):
+    pytest.importorskip("flair")
+    return build_test_taggers(tmp_path_factory.mktemp("taggers"))
+
+
+@pytest.fixture(scope="session")
+def service(tmp_path_factory, tagger_paths):
+    return import_service(tmp_path_factory.mktemp("service"))
+
+
+@pytest.fixture
+def test_service(service, tagger_paths, monkeypatch):
+    """
+    The service with the German NER and POS models replaced by the tiny test taggers.
+    """
+    monkeypatch.setitem(service.lang_code_to_model_map, "de", tagger_paths["ner"])
+    monkeypatch.setitem(service.pos_lang_code_to_model_map, "de", tagger_paths["pos"])
+    return service
+
+
+@pytest.fixture
+def client(test_service):
+    from fastapi.testclient import TestClient
+    return TestClient(test_service.app)
+
+
+@pytest.fixture
+def embedding_calls(monkeypatch):
+    """
+    Record the number of sentences of each call of the Flair embeddings.
+    """
+    from flair.embeddings import FlairEmbeddings
+
+    calls = []
+    add_embeddings_internal = FlairEmbeddings._add_embeddings_internal
+
+    def spy(self, sentences):
+        calls.append(len(sentences))
+        return add_embeddings_internal(self, sentences)
+
+    monkeypatch.setattr(FlairEmbeddings, "_add_embeddings_internal", spy)
+    return calls
@@ -0,0 +1,65 @@
+TEXT = "Anna wohnt in Berlin. Bob arbeitet bei Siemens in München."
+
+
+def request(**parameters):
+    return {
+        "text": TEXT,
+        "language": "de",
+        "sentence_begins": [0, 22],
+        "sentence_ends": [21, len(TEXT)],
+        **parameters,
+    }
+
+
+def test_documentation_lists_pos_language(service):
+    parameters = service.get_documentation().parameters
+    assert "language" in parameters
+    assert "pos_language" in parameters
+
+
+def test_pos_model_is_only_loaded_with_pos_language(client, test_service):
+    test_service.load_model.cache_clear()
+    test_service.load_pos_model.cache_clear()
+
+    response = client.post("/v1/process", json=request())
+    assert response.status_code == 200
+    assert response.json()["pos_tags"] is None
+    assert test_service.load_pos_model.cache_info().currsize == 0
+
+    response = client.post("/v1/process", json=request(pos_language="de"))
+    assert response.status_code == 200
+    assert test_service.load_pos_model.cache_info().currsize == 1
+    # the POS tagger does not evict the NER tagger from its cache
+    assert test_service.load_model.cache_info().misses == 1
+
+
+def test_combined_mode_matches_ner_only(client):
+    ner_only = client.post("/v1/process", json=request()).json()
+    combined = client.post("/v1/process", json=request(pos_language="de")).json()
+
+    assert combined["tags"] == ner_only["tags"]
+    assert [(tag["begin"], tag["end"]) for tag in combined["pos_tags"]] == [
+        (0, 4), (5, 10), (11, 13), (14, 20), (20, 21),
+        (22, 25), (26, 34), (35, 38), (39, 46), (47, 49), (50, 57), (57, 58),
+    ]
+
+
+def test_combined_mode_computes_embeddings_once(client, test_service, tagger_paths, embedding_calls):
+    # loading a model embeds a test sentence
+    test_service.load_model(tagger_paths["ner"])
+    test_service.load_pos_model(tagger_paths["pos"])
+    embedding_calls.clear()
+
+    client.post("/v1/process", json=request())
+    ner_only_calls = list(embedding_calls)
+    embedding_calls.clear()
+
+    client.post("/v1/process", json=request(pos_language="de"))
+
+    # the NER tagger uses the embeddings the POS tagger computed for the same sentences
+    assert sum(embedding_calls) == sum(ner_only_calls) == 2
+
+
+def test_unsupported_pos_language(client):
+    response = client.post("/v1/process", json=request(pos_language="xx"))
+    assert response.status_code == 400
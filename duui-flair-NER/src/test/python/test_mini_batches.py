@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+WORDS = ["Anna", "wohnt", "in", "Berlin", "und", "arbeitet", "bei", "Siemens", "seit", "dem", "Sommer"]
+
+
+def document_request(sentence_count, **parameters):
+    random.seed(0)
+    text, begins, ends = "", [], []
+    for _ in range(sentence_count):
+        begins.append(len(text))
+        text += " ".join(random.choice(WORDS) for _ in range(random.randint(3, 12))) + "."
+        ends.append(len(text))
+        text += " "
+    return {"text": text, "language": "de", "sentence_begins": begins, "sentence_ends": ends, **parameters}
+
+
+@pytest.mark.parametrize("parameters", [{}, {"pos_language": "de"}])
+def test_batch_is_predicted_in_mini_batches(client, test_service, tagger_paths, embedding_calls, parameters):
+    # loading a model embeds a test sentence
+    test_service.load_model(tagger_paths["ner"])
+    test_service.load_pos_model(tagger_paths["pos"])
+    embedding_calls.clear()
+
+    response = client.post("/v1/process", json=document_request(100, **parameters))
+    assert response.status_code == 200
+
+    # one length batch of 100 sentences, embedded once in mini batches, also in the combined mode
+    assert embedding_calls == [32, 32, 32, 4]
+
+
+def test_mini_batches_do_not_change_the_tags(client, test_service, monkeypatch):
+    request = document_request(100, pos_language="de")
+    response = client.post("/v1/process", json=request).json()
+
+    monkeypatch.setattr(test_service, "MINI_BATCH_SIZE", 1000)
+    assert client.post("/v1/process", json=request).json() == response
@@ -0,0 +1,43 @@
+TEXT = "Grüße \U0001F600 aus Köln. Anna \U0001F600\U0001F600 wohnt in Berlin \U0001F600 ."
+
+TOKENS = [
+    "Grüße", "\U0001F600", "aus", "Köln", ".",
+    "Anna", "\U0001F600\U0001F600", "wohnt", "in", "Berlin", "\U0001F600", ".",
+]
+
+
+def utf16_length(text):
+    return len(text.encode("utf-16-le")) // 2
+
+
+def covered(text, begin, end):
+    return text.encode("utf-16-le")[2 * begin:2 * end].decode("utf-16-le")
+
+
+def request():
+    # UTF-16 offsets of the sentences, as sent by DUUI
+    second = TEXT.index("Anna")
+    return {
+        "text": TEXT,
+        "language": "de",
+        "sentence_begins": [0, utf16_length(TEXT[:second])],
+        "sentence_ends": [utf16_length(TEXT[:second - 1]), utf16_length(TEXT)],
+        "pos_language": "de",
+    }
+
+
+def test_get_utf16_offsets(service):
+    to_utf16 = service.get_utf16_offsets(TEXT)
+    assert [to_utf16(i) for i in range(len(TEXT) + 1)] == [utf16_length(TEXT[:i]) for i in range(len(TEXT) + 1)]
+    assert service.get_utf16_offsets("Köln")(4) == 4
+
+
+def test_offsets_after_astral_characters(client):
+    response = client.post("/v1/process", json=request()).json()
+
+    pos_tags = response["pos_tags"]
+    assert [covered(TEXT, tag["begin"], tag["end"]) for tag in pos_tags] == TOKENS
+    # the entities start and end at the tokens
+    assert response["tags"]
+    assert {tag["begin"] for tag in response["tags"]} <= {tag["begin"] for tag in pos_tags}
+    assert {tag["end"] for tag in response["tags"]} <= {tag["end"] for tag in pos_tags}
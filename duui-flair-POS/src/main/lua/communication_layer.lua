@@ -26,23 +26,23 @@ function serialize(inputCas, outputStream, parameters)
         error("Document language was not given and could not be inferred", 2)
     end
 
-    local sentences = {}
+    -- Only send the sentence offsets, the sentence texts are sliced from the document text by the annotator
+    local sentence_begins = {}
+    local sentence_ends = {}
     local sent_counter = 1
     local sents = JCasUtil:select(inputCas, Sentence):iterator()
     while sents:hasNext() do
         local sent = sents:next()
-        local sent_begin = sent:getBegin()
-        local sent_text = sent:getCoveredText()
-        sentences[sent_counter] = {}
-        sentences[sent_counter]["offset"] = sent_begin
-        sentences[sent_counter]["coveredText"] = sent_text
+        sentence_begins[sent_counter] = sent:getBegin()
+        sentence_ends[sent_counter] = sent:getEnd()
         sent_counter = sent_counter + 1
     end
     -- Encode data as JSON object and write to stream
     outputStream:write(json.encode({
         text = document_text,
         language = language,
-        sentences = sentences
+        sentence_begins = sentence_begins,
+        sentence_ends = sentence_ends
     }))
 end
 
@@ -1,9 +1,9 @@
 import logging
-import math
 import os
 import sys
 from functools import lru_cache
-from typing import Final, Dict, List, Optional, Iterable, TypeVar
+from itertools import accumulate
+from typing import Final, Dict, List, Optional, Iterable, Callable, TypeVar
 
 import flair
 from fastapi import FastAPI, Response
@@ -21,6 +21,10 @@ MODEL_CACHE_SIZE: Final[int] = int(os.environ.get("MODEL_CACHE_SIZE", 1))
 logger.info(f"MODEL_CACHE_SIZE={MODEL_CACHE_SIZE}")
 BATCH_SIZE: Final[int] = int(os.environ.get("FLAIR_BATCH_SIZE", 128))
 logger.info(f"BATCH_SIZE={BATCH_SIZE}")
+BATCH_TOKENS: Final[int] = int(os.environ.get("FLAIR_BATCH_TOKENS", 4096))
+logger.info(f"BATCH_TOKENS={BATCH_TOKENS}")
+MINI_BATCH_SIZE: Final[int] = int(os.environ.get("FLAIR_MINI_BATCH_SIZE", 32))
+logger.info(f"MINI_BATCH_SIZE={MINI_BATCH_SIZE}")
 
 app = FastAPI(
     openapi_url="/openapi.json",
@@ -167,13 +171,50 @@ class Message(BaseModel):
 class TextImagerRequest(BaseModel):
     text: str
     language: str
-    sentences: List[DkproSentence]
+    # Either the sentences with their text, or only their offsets (compact format), the text is sliced server-side
+    sentences: Optional[List[DkproSentence]] = None
+    sentence_begins: Optional[List[int]] = None
+    sentence_ends: Optional[List[int]] = None
 
 
 class TextImagerResponse(BaseModel):
     tags: List[DkproPos]
 
 
+def get_text_slicer(text: str) -> Callable[[int, int], str]:
+    """
+    Slice the text by UTF-16 offsets as used in UIMA, these only differ from Python offsets after astral characters.
+    """
+    if not text or max(text) <= "\uffff":
+        return lambda begin, end: text[begin:end]
+
+    text_utf16 = text.encode("utf-16-le", "surrogatepass")
+    return lambda begin, end: text_utf16[2 * begin:2 * end].decode("utf-16-le", "surrogatepass")
+
+
+def get_utf16_offsets(text: str) -> Callable[[int], int]:
+    """
+    Convert Python offsets in the text to UTF-16 offsets as used in UIMA, these only differ after astral characters.
+    """
+    if not text or max(text) <= "\uffff":
+        return lambda offset: offset
+
+    astral_before = list(accumulate((character > "\uffff" for character in text), initial=0))
+    return lambda offset: offset + astral_before[offset]
+
+
+def get_sentences(request: TextImagerRequest) -> Optional[List[DkproSentence]]:
+    if request.sentence_begins is None:
+        return request.sentences
+
+    # the offsets are already validated and the slices are strings, skip validating every sentence
+    slice_text = get_text_slicer(request.text)
+    return [
+        DkproSentence.construct(offset=begin, coveredText=slice_text(begin, end))
+        for begin, end in zip(request.sentence_begins, request.sentence_ends)
+    ]
+
+
 @lru_cache(maxsize=MODEL_CACHE_SIZE)
 def load_model(lang: str) -> SequenceTagger:
     return SequenceTagger.load(lang)
@@ -184,10 +225,25 @@ async def validation_exception_handler(request, exc):
     return PlainTextResponse(str(exc), status_code=400)
 
 
-def batcher(iterable: List[T], batch_size=BATCH_SIZE) -> Iterable[List[T]]:
-    _len = len(iterable)
-    for start in range(0, _len, batch_size):
-        yield list(iterable[start:start + batch_size])
+def length_batcher(
+        sentences: List[DkproSentence],
+        batch_size=BATCH_SIZE,
+        batch_tokens=BATCH_TOKENS
+) -> Iterable[List[int]]:
+    """
+    Batch the indices of the sentences sorted by length, with at most batch_size sentences and batch_tokens tokens
+    per batch, a sentence longer than batch_tokens gets its own batch. Tokens are estimated by whitespace.
+    """
+    lengths = [len(sentence.coveredText.split()) for sentence in sentences]
+    batch, batch_len = [], 0
+    for idx in sorted(range(len(sentences)), key=lengths.__getitem__):
+        if batch and (len(batch) >= batch_size or batch_len + lengths[idx] > batch_tokens):
+            yield batch
+            batch, batch_len = [], 0
+        batch.append(idx)
+        batch_len += lengths[idx]
+    if batch:
+        yield batch
 
 
 def flatten(iterable: Iterable[Iterable[T]]) -> Iterable[T]:
@@ -216,18 +272,30 @@ def post_process(request: TextImagerRequest):
                            f"Supported languages: {supported_lang_string}"
             },
         )
+    if request.sentence_begins is not None and (
+            request.sentence_ends is None or len(request.sentence_begins) != len(request.sentence_ends)
+    ):
+        return JSONResponse(
+            status_code=400,
+            content={
+                "message": "The sentence_begins and sentence_ends MUST have the same length."
+            },
+        )
+    sentences = get_sentences(request)
     model = load_model(lang_code_to_model_map[language])
-    if request.sentences:
-        total_batches = math.ceil(len(request.sentences) / BATCH_SIZE * 1.)
+    if sentences:
+        batches = list(length_batcher(sentences))
+        total_batches = len(batches)
 
-        def process_verbose(idx, batch: List[T]) -> Iterable[T]:
+        # tags per sentence, to restore the order of the sentences
+        sentence_tags: List[List[DkproPos]] = [[] for _ in sentences]
+        for idx, batch in enumerate(batches, start=1):
             logger.info(f"Processing batch {idx}/{total_batches}")
-            return process_batch(model, request.text, batch)
+            batch_tags = process_batch(model, request.text, [sentences[i] for i in batch])
+            for i, tags in zip(batch, batch_tags):
+                sentence_tags[i] = tags
 
-        pos_tags = list(flatten(
-            process_verbose(idx, batch)
-            for idx, batch in enumerate(batcher(request.sentences, BATCH_SIZE), start=1)
-        ))
+        pos_tags = list(flatten(sentence_tags))
         return TextImagerResponse(tags=pos_tags)
     else:
         return JSONResponse(
@@ -238,8 +306,7 @@ def post_process(request: TextImagerRequest):
         )
 
 
-def process_batch(model: SequenceTagger, text: str, batch: List[DkproSentence]) -> Iterable[DkproPos]:
-    text_len = len(text)
+def process_batch(model: SequenceTagger, text: str, batch: List[DkproSentence]) -> List[List[DkproPos]]:
     sentences: List[Sentence] = []
     for dkpro_sentence in batch:
         sentences.append(
@@ -248,11 +315,22 @@ def process_batch(model: SequenceTagger, text: str, batch: List[DkproSentence])
                 start_position=dkpro_sentence.offset,
             )
         )
-    model.predict(sentences)
-    for sentence in sentences:
-        for label in sentence.get_labels():
-            begin = label.data_point.start_position + sentence.start_position
-            end = label.data_point.end_position + sentence.start_position
-            value = label.value
-            yield DkproPos(begin=begin, end=end,
-                           pos_value=value, coarse_value="")
+    # flair's mini batches bound the memory of the embeddings, release them right after each mini batch
+    model.predict(sentences, mini_batch_size=MINI_BATCH_SIZE, embedding_storage_mode="none")
+    return [
+        process_sentence(sentence, dkpro_sentence.coveredText)
+        for sentence, dkpro_sentence in zip(sentences, batch)
+    ]
+
+
+def process_sentence(sentence: Sentence, sentence_text: str) -> List[DkproPos]:
+    # the token offsets in the sentence are Python offsets, the sentence offset is a UTF-16 offset
+    to_utf16 = get_utf16_offsets(sentence_text)
+    tags = []
+    for label in sentence.get_labels():
+        begin = to_utf16(label.data_point.start_position) + sentence.start_position
+        end = to_utf16(label.data_point.end_position) + sentence.start_position
+        value = label.value
+        tags.append(DkproPos(begin=begin, end=end,
+                             pos_value=value, coarse_value=""))
+    return tags
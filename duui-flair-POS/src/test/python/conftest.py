@@ -0,0 +1,77 @@
+import os
+import shutil
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+MAIN_DIR = Path(__file__).parents[2] / "main"
+
+CHARACTERS = "abcdefghijklmnopqrstuvwxyzäöüßABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜ0123456789 .,!?-\U0001F600"
+
+
+def build_test_tagger(model_dir: Path, seed: int = 0, lm_hidden_size: int = 16) -> str:
+    """
+    Save a tiny randomly initialised POS tagger with the Flair embeddings of a character language model, like the
+    German POS model, to model_dir. Returns the path of the tagger.
+    """
+    import flair
+    import torch
+    from flair.data import Dictionary
+    from flair.embeddings import FlairEmbeddings
+    from flair.models import LanguageModel, SequenceTagger
+
+    torch.manual_seed(seed)
+    characters = Dictionary()
+    for character in CHARACTERS:
+        characters.add_item(character)
+    embeddings = FlairEmbeddings(LanguageModel(characters, True, lm_hidden_size, 1, embedding_size=8))
+
+    tag_dictionary = Dictionary(add_unk=False)
+    for tag in ["NN", "NE", "VVFIN", "ART", "$."]:
+        tag_dictionary.add_item(tag)
+    tagger = SequenceTagger(hidden_size=8, embeddings=embeddings, tag_dictionary=tag_dictionary, tag_type="pos")
+    path = str(model_dir / "pos.pt")
+    tagger.save(path)
+    flair.device = torch.device("cpu")
+    return path
+
+
+def import_service(work_dir: Path):
+    # the service reads its resources from the working directory, like in the Docker image
+    shutil.copy(MAIN_DIR / "lua" / "communication_layer.lua", work_dir / "communication_layer.lua")
+    shutil.copy(MAIN_DIR / "resources" / "dkpro-core-types.xml", work_dir / "dkpro-core-types.xml")
+    sys.path.insert(0, str(MAIN_DIR / "python"))
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        return import_module("wsgi")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def tagger_path(tmp_path_factory):
+    pytest.importorskip("flair")
+    return build_test_tagger(tmp_path_factory.mktemp("tagger"))
+
+
+@pytest.fixture(scope="session")
+def service(tmp_path_factory, tagger_path):
+    return import_service(tmp_path_factory.mktemp("service"))
+
+
+@pytest.fixture
+def test_service(service, tagger_path, monkeypatch):
+    """
+    The service with the German POS model replaced by the tiny test tagger.
+    """
+    monkeypatch.setitem(service.lang_code_to_model_map, "de", tagger_path)
+    return service
+
+
+@pytest.fixture
+def client(test_service):
+    from fastapi.testclient import TestClient
+    return TestClient(test_service.app)
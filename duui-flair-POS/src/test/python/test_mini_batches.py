@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+WORDS = ["Anna", "wohnt", "in", "Berlin", "und", "arbeitet", "bei", "Siemens", "seit", "dem", "Sommer"]
+
+
+@pytest.fixture
+def embedding_calls(monkeypatch):
+    """
+    Record the number of sentences of each call of the Flair embeddings.
+    """
+    from flair.embeddings import FlairEmbeddings
+
+    calls = []
+    add_embeddings_internal = FlairEmbeddings._add_embeddings_internal
+
+    def spy(self, sentences):
+        calls.append(len(sentences))
+        return add_embeddings_internal(self, sentences)
+
+    monkeypatch.setattr(FlairEmbeddings, "_add_embeddings_internal", spy)
+    return calls
+
+
+def document_request(sentence_count):
+    random.seed(0)
+    text, begins, ends = "", [], []
+    for _ in range(sentence_count):
+        begins.append(len(text))
+        text += " ".join(random.choice(WORDS) for _ in range(random.randint(3, 12))) + "."
+        ends.append(len(text))
+        text += " "
+    return {"text": text, "language": "de", "sentence_begins": begins, "sentence_ends": ends}
+
+
+def test_batch_is_predicted_in_mini_batches(client, test_service, tagger_path, embedding_calls):
+    request = document_request(100)
+    # loading the model embeds a test sentence
+    test_service.load_model(tagger_path)
+    embedding_calls.clear()
+
+    response = client.post("/v1/process", json=request)
+    assert response.status_code == 200
+
+    # one length batch of 100 sentences, embedded in mini batches
+    assert embedding_calls == [32, 32, 32, 4]
+    assert len(response.json()["tags"]) == sum(len(request["text"][b:e].replace(".", " .").split())
+                                               for b, e in zip(request["sentence_begins"], request["sentence_ends"]))
+
+
+def test_mini_batches_do_not_change_the_tags(client, test_service, monkeypatch):
+    request = document_request(100)
+    tags = client.post("/v1/process", json=request).json()["tags"]
+
+    monkeypatch.setattr(test_service, "MINI_BATCH_SIZE", 1000)
+    assert client.post("/v1/process", json=request).json()["tags"] == tags
@@ -0,0 +1,48 @@
+import pytest
+
+TEXT = "Grüße \U0001F600 aus Köln. Anna \U0001F600\U0001F600 wohnt in Berlin \U0001F600 ."
+
+
+def utf16_length(text):
+    return len(text.encode("utf-16-le")) // 2
+
+
+def covered(text, begin, end):
+    return text.encode("utf-16-le")[2 * begin:2 * end].decode("utf-16-le")
+
+
+@pytest.fixture
+def sentences():
+    # UTF-16 offsets of the sentences, as sent by DUUI
+    second = TEXT.index("Anna")
+    return [(0, utf16_length(TEXT[:second - 1])), (utf16_length(TEXT[:second]), utf16_length(TEXT))]
+
+
+def test_get_utf16_offsets(service):
+    to_utf16 = service.get_utf16_offsets(TEXT)
+    assert [to_utf16(i) for i in range(len(TEXT) + 1)] == [utf16_length(TEXT[:i]) for i in range(len(TEXT) + 1)]
+    assert service.get_utf16_offsets("Köln")(4) == 4
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_tag_offsets_after_astral_characters(client, sentences, compact):
+    if compact:
+        request = {
+            "text": TEXT,
+            "language": "de",
+            "sentence_begins": [begin for begin, _ in sentences],
+            "sentence_ends": [end for _, end in sentences],
+        }
+    else:
+        request = {
+            "text": TEXT,
+            "language": "de",
+            "sentences": [{"offset": begin, "coveredText": covered(TEXT, begin, end)} for begin, end in sentences],
+        }
+
+    tags = client.post("/v1/process", json=request).json()["tags"]
+
+    assert [covered(TEXT, tag["begin"], tag["end"]) for tag in tags] == [
+        "Grüße", "\U0001F600", "aus", "Köln", ".",
+        "Anna", "\U0001F600\U0001F600", "wohnt", "in", "Berlin", "\U0001F600", ".",
+    ]
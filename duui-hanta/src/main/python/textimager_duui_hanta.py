@@ -1,11 +1,14 @@
 import logging
+import multiprocessing
 import os
 
 from cassis import load_typesystem
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from fastapi import FastAPI, Response
 from fastapi.responses import PlainTextResponse
-from functools import lru_cache
+from functools import lru_cache, partial
 from HanTa import HanoverTagger as ht
 from platform import python_version
 from pydantic import BaseSettings, BaseModel
@@ -25,6 +28,10 @@ class Settings(BaseSettings):
     textimager_hanta_log_level: str
     # Model name
     textimager_hanta_model_name: str
+    # Number of processes to tag the sentences in, 1 to disable
+    textimager_hanta_processes: int = 1
+    # Min number of sentences to tag them in processes
+    textimager_hanta_processes_min_sentences: int = 100
 
 
 # Load settings from env vars
@@ -163,6 +170,67 @@ def get_tagger_model_name():
 #     logger.debug("Mapped model name from document language \"%s\": \"%s\"", document_lang, model_name)
     return model_name
 
+def tag_sentences(model_name, sentences):
+    # Lemmas of the tokens of each sentence, in a forked process the tagger is already in the cache
+    tagger = load_cache_tagger(model_name)
+    lemmas = []
+    for sentence in sentences:
+        hanta = tagger.tag_sent(sentence)
+        assert len(hanta) == len(sentence)
+        lemmas.append([h[1] for h in hanta])
+    return lemmas
+
+
+tagger_pool = None
+tagger_pool_lock = Lock()
+
+
+def get_tagger_pool():
+    # Started after the tagger is loaded, the forked processes share the loaded model
+    global tagger_pool
+    with tagger_pool_lock:
+        if tagger_pool is None:
+            logger.info("Starting %d processes for tagging", settings.textimager_hanta_processes)
+            tagger_pool = ProcessPoolExecutor(settings.textimager_hanta_processes, mp_context=multiprocessing.get_context("fork"))
+        return tagger_pool
+
+
+def reset_tagger_pool(pool):
+    # Drop a broken pool, e.g. after a process was killed by the OOM killer, the next request starts a new one
+    global tagger_pool
+    with tagger_pool_lock:
+        if tagger_pool is pool:
+            tagger_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_tagger_pool():
+    global tagger_pool
+    with tagger_pool_lock:
+        if tagger_pool is not None:
+            logger.info("Stopping the tagging processes")
+            tagger_pool.shutdown(wait=True)
+            tagger_pool = None
+
+
+def tag_sentences_parallel(model_name, sentences):
+    # Tag in processes for many sentences, each process gets one contiguous chunk, results are in order of the sentences
+    if settings.textimager_hanta_processes > 1 and len(sentences) >= settings.textimager_hanta_processes_min_sentences:
+        chunk_size = -(-len(sentences) // settings.textimager_hanta_processes)
+        chunks = [sentences[i:i+chunk_size] for i in range(0, len(sentences), chunk_size)]
+        pool = get_tagger_pool()
+        try:
+            lemmas = []
+            for chunk_lemmas in pool.map(partial(tag_sentences, model_name), chunks):
+                lemmas.extend(chunk_lemmas)
+            return lemmas
+        except BrokenProcessPool:
+            logger.exception("Tagging processes failed, tagging %d sentences in this process", len(sentences))
+            reset_tagger_pool(pool)
+
+    return tag_sentences(model_name, sentences)
+
+
 # Load the predefined typesystem that is needed for this annotator to work
 typesystem_filename = 'TypeSystemHANTA.xml'
 # logger.debug("Loading typesystem from \"%s\"", typesystem_filename)
@@ -203,6 +271,11 @@ app = FastAPI(
 )
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    shutdown_tagger_pool()
+
+
 # Return Lua communication script
 @app.get("/v1/communication_layer", response_class=PlainTextResponse)
 def get_communication_layer() -> str:
@@ -263,20 +336,22 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
     tokens = request.tokens
     text = request.text
 
-    tagger = load_cache_tagger(settings.textimager_hanta_model_name)
+    # load the tagger before the processes are forked
+    load_cache_tagger(settings.textimager_hanta_model_name)
     lemmas = []
 
     print(dt, f'Processing {len(tokens)} sentences', end=' ')
 
-
-    for sentence in tokens:
-        hanta = tagger.tag_sent([t["text"] for t in sentence])
-        assert len(hanta) == len(sentence)
-        for i, l in enumerate(hanta):
+    sentences_lemmas = tag_sentences_parallel(
+        settings.textimager_hanta_model_name,
+        [[t["text"] for t in sentence] for sentence in tokens]
+    )
+    for sentence, sentence_lemmas in zip(tokens, sentences_lemmas):
+        for i, l in enumerate(sentence_lemmas):
             current_lemma = Lemma(
                 begin=sentence[i]["begin"],
                 end=sentence[i]["end"],
-                lemma=hanta[i][1],
+                lemma=l,
                 write=True
             )
             lemmas.append(current_lemma)
@@ -0,0 +1,45 @@
+"""
+Time to lemmatize 20k German sentences with 1, 2 and 4 tagging processes, compared to the number of available cores.
+
+Run from the component root: python src/test/python/benchmark_processes.py
+"""
+import os
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import SENTENCES, import_service
+
+SENTENCE_COUNT = 20000
+PROCESSES = [1, 2, 4]
+
+
+def main():
+    service = import_service(TEXTIMAGER_HANTA_PROCESSES_MIN_SENTENCES="1")
+    model_name = service.settings.textimager_hanta_model_name
+    service.load_cache_tagger(model_name)
+
+    random.seed(0)
+    sentences = [random.choice(SENTENCES) for _ in range(SENTENCE_COUNT)]
+    print(f"{len(os.sched_getaffinity(0))} cores available")
+
+    expected = None
+    for processes in PROCESSES:
+        service.settings.textimager_hanta_processes = processes
+        # start the pool before measuring
+        service.tag_sentences_parallel(model_name, SENTENCES * processes)
+
+        start = perf_counter()
+        lemmas = service.tag_sentences_parallel(model_name, sentences)
+        duration = perf_counter() - start
+        service.shutdown_tagger_pool()
+
+        expected = expected or lemmas
+        assert lemmas == expected
+        print(f"{processes} processes: {duration:.2f} s, {SENTENCE_COUNT / duration:.0f} sentences/s")
+
+
+if __name__ == "__main__":
+    main()
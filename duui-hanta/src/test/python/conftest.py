@@ -0,0 +1,46 @@
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+SERVICE_DIR = Path(__file__).parents[2] / "main" / "python"
+
+SENTENCES = [
+    ["Die", "Kinder", "spielten", "gestern", "im", "Garten", "."],
+    ["Wir", "haben", "die", "Bücher", "gelesen", "."],
+    ["Anna", "ging", "mit", "ihren", "Freunden", "ins", "Kino", "."],
+]
+
+
+def import_service(**env):
+    os.environ.update({
+        "TEXTIMAGER_HANTA_ANNOTATOR_NAME": "test",
+        "TEXTIMAGER_HANTA_ANNOTATOR_VERSION": "test",
+        "TEXTIMAGER_HANTA_LOG_LEVEL": "WARNING",
+        "TEXTIMAGER_HANTA_MODEL_NAME": "morphmodel_ger.pgz",
+        **env,
+    })
+    # the service reads the Lua script and type system from the working directory
+    sys.path.insert(0, str(SERVICE_DIR))
+    cwd = os.getcwd()
+    os.chdir(SERVICE_DIR)
+    try:
+        return import_module("textimager_duui_hanta")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def service():
+    pytest.importorskip("HanTa")
+    return import_service(TEXTIMAGER_HANTA_PROCESSES="2", TEXTIMAGER_HANTA_PROCESSES_MIN_SENTENCES="1")
+
+
+@pytest.fixture
+def model_name(service):
+    # load the tagger before the processes are forked, like in post_process
+    service.load_cache_tagger(service.settings.textimager_hanta_model_name)
+    yield service.settings.textimager_hanta_model_name
+    service.shutdown_tagger_pool()
@@ -0,0 +1,44 @@
+import os
+import signal
+
+from conftest import SENTENCES
+
+
+def test_processes_match_sequential_tagging(service, model_name):
+    sentences = SENTENCES * 10
+
+    assert service.tag_sentences_parallel(model_name, sentences) == service.tag_sentences(model_name, sentences)
+    assert service.tagger_pool is not None
+
+
+def test_broken_pool_falls_back_to_sequential_tagging(service, model_name):
+    expected = service.tag_sentences(model_name, SENTENCES)
+    pool = service.get_tagger_pool()
+    # start the processes and kill one, like the OOM killer would
+    pid = pool.submit(os.getpid).result()
+    os.kill(pid, signal.SIGKILL)
+
+    assert service.tag_sentences_parallel(model_name, SENTENCES) == expected
+    assert service.tagger_pool is None
+
+    # the next request starts a new pool
+    assert service.tag_sentences_parallel(model_name, SENTENCES) == expected
+    assert service.tagger_pool is not None and service.tagger_pool is not pool
+
+
+def test_pool_is_shut_down_with_the_app(service, model_name):
+    from fastapi.testclient import TestClient
+
+    request = {
+        "text": " ".join(" ".join(sentence) for sentence in SENTENCES),
+        "lang": "de",
+        "tokens": [[{"text": token, "begin": 0, "end": 0} for token in sentence] for sentence in SENTENCES],
+    }
+    with TestClient(service.app) as client:
+        response = client.post("/v1/process", json=request)
+        assert response.status_code == 200
+        assert service.tagger_pool is not None
+        processes = list(service.tagger_pool._processes.values())
+
+    assert service.tagger_pool is None
+    assert processes and not any(process.is_alive() for process in processes)
@@ -11,15 +11,32 @@ function serialize(inputCas, outputStream, parameters)
     outputStream:write(json.encode({
         text = doc_text,
         len = doc_len,
-        lang = doc_lang
+        lang = doc_lang,
+        parameters = parameters
     }))
 end
 
+function add_sentence(inputCas, meta, sentence)
+    local sent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence", inputCas)
+    sent_anno:setBegin(sentence["begin"])
+    sent_anno:setEnd(sentence["end"])
+    sent_anno:addToIndexes()
+
+    local meta_anno = luajava.newInstance("org.texttechnologylab.annotation.AnnotatorMetaData", inputCas)
+    meta_anno:setReference(sent_anno)
+    meta_anno:setName(meta["name"])
+    meta_anno:setVersion(meta["version"])
+    meta_anno:setModelName(meta["modelName"])
+    meta_anno:setModelVersion(meta["modelVersion"])
+    meta_anno:addToIndexes()
+end
+
 function deserialize(inputCas, inputStream)
-    local inputString = luajava.newInstance("java.lang.String", inputStream:readAllBytes(), StandardCharsets.UTF_8)
-    local results = json.decode(inputString)
+    -- the response is a single JSON object, or a header followed by one sentence per line if streamed
+    local reader = luajava.newInstance("java.io.BufferedReader", luajava.newInstance("java.io.InputStreamReader", inputStream, StandardCharsets.UTF_8))
+    local results = json.decode(reader:readLine())
 
-    if results["modification_meta"] ~= nil and results["meta"] ~= nil and results["sentences"] ~= nil then
+    if results["modification_meta"] ~= nil and results["meta"] ~= nil and (results["sentences"] ~= nil or results["stream"]) then
         local modification_meta = results["modification_meta"]
         local modification_anno = luajava.newInstance("org.texttechnologylab.annotation.DocumentModification", inputCas)
         modification_anno:setUser(modification_meta["user"])
@@ -28,19 +45,16 @@ function deserialize(inputCas, inputStream)
         modification_anno:addToIndexes()
 
         local meta = results["meta"]
-        for j, sentence in ipairs(results["sentences"]) do
-            local sent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence", inputCas)
-            sent_anno:setBegin(sentence["begin"])
-            sent_anno:setEnd(sentence["end"])
-            sent_anno:addToIndexes()
-
-            local meta_anno = luajava.newInstance("org.texttechnologylab.annotation.AnnotatorMetaData", inputCas)
-            meta_anno:setReference(sent_anno)
-            meta_anno:setName(meta["name"])
-            meta_anno:setVersion(meta["version"])
-            meta_anno:setModelName(meta["modelName"])
-            meta_anno:setModelVersion(meta["modelVersion"])
-            meta_anno:addToIndexes()
+        if results["stream"] then
+            local line = reader:readLine()
+            while line ~= nil do
+                add_sentence(inputCas, meta, json.decode(line))
+                line = reader:readLine()
+            end
+        else
+            for j, sentence in ipairs(results["sentences"]) do
+                add_sentence(inputCas, meta, sentence)
+            end
         end
     end
 end
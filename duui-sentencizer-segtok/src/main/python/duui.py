@@ -7,7 +7,7 @@ from typing import List, Optional
 import segtok.segmenter as segtok_segmenter
 from cassis import load_typesystem
 from fastapi import FastAPI, Response
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
@@ -55,6 +55,7 @@ class TextImagerRequest(BaseModel):
     text: str
     len: int
     lang: str
+    parameters: Optional[dict] = None
 
 
 class AnnotationMeta(BaseModel):
@@ -81,6 +82,13 @@ class TextImagerResponse(BaseModel):
     modification_meta: Optional[DocumentModification]
 
 
+# First line of a streamed response, followed by one Sentence per line
+class TextImagerStreamHeader(BaseModel):
+    stream: bool = True
+    meta: AnnotationMeta
+    modification_meta: DocumentModification
+
+
 class TextImagerCapability(BaseModel):
     supported_languages: List[str]
     reproducible: bool
@@ -180,35 +188,85 @@ def get_input_output() -> TextImagerInputOutput:
     )
 
 
+# Offsets of the segmented sentences, each sentence is searched from the end of the previous one
+def find_sentences(text, sents):
+    cursor = 0
+    for sent in sents:
+        # empty sentences are kept at 0,0 as before, see TODO in "post_process"
+        if not sent:
+            yield 0, 0
+            continue
+
+        begin = text.find(sent, cursor)
+        if begin < 0:
+            logger.warning("Sentence not found in text after offset %d, skipping: %s", cursor, sent)
+            continue
+        end = begin + len(sent)
+        cursor = end
+        yield begin, end
+
+
+def create_meta() -> AnnotationMeta:
+    return AnnotationMeta(
+        name=settings.annotator_name,
+        version=settings.annotator_version,
+        modelName="segtok",
+        modelVersion=SEGTOK_VERSION
+    )
+
+
+def create_modification_meta(modification_timestamp_seconds) -> DocumentModification:
+    return DocumentModification(
+        user=settings.annotator_name,
+        timestamp=modification_timestamp_seconds,
+        comment=f"{settings.annotator_name} ({settings.annotator_version}), segtok ({SEGTOK_VERSION})"
+    )
+
+
+# Stream sentences as newline-delimited JSON while segmenting, without collecting them first
+def stream_sentences(text, modification_timestamp_seconds):
+    yield TextImagerStreamHeader(
+        meta=create_meta(),
+        modification_meta=create_modification_meta(modification_timestamp_seconds)
+    ).model_dump_json() + "\n"
+
+    try:
+        for begin, end in find_sentences(text, segtok_segmenter.split_single(text)):
+            yield Sentence(begin=begin, end=end).model_dump_json() + "\n"
+    except Exception as ex:
+        # the response is already started, the client notices the broken stream
+        logger.exception(ex)
+        raise
+
+
 @app.post("/v1/process")
 def post_process(request: TextImagerRequest) -> TextImagerResponse:
     modification_timestamp_seconds = int(time())
 
+    stream = request.parameters is not None and str(request.parameters.get("stream", "false")).lower() == "true"
+    if stream:
+        logger.info("Streaming sentences")
+        return StreamingResponse(
+            stream_sentences(request.text, modification_timestamp_seconds),
+            media_type="application/x-ndjson"
+        )
+
     sentences = []
     meta = None
     modification_meta = None
 
     try:
         doc = segtok_segmenter.split_single(request.text)
-        for sent in doc:
-            # TODO adds empty sentence at 0,0 on empty document or space at end? keep for now to be consistent with non duui implementation
+        # TODO adds empty sentence at 0,0 on empty document or space at end? keep for now to be consistent with non duui implementation
+        for begin, end in find_sentences(request.text, doc):
             sentences.append(Sentence(
-                begin=request.text.index(sent),
-                end=request.text.index(sent) + len(sent),
+                begin=begin,
+                end=end,
             ))
 
-        meta = AnnotationMeta(
-            name=settings.annotator_name,
-            version=settings.annotator_version,
-            modelName="segtok",
-            modelVersion=SEGTOK_VERSION
-        )
+        meta = create_meta()
 
-        modification_meta = DocumentModification(
-            user=settings.annotator_name,
-            timestamp=modification_timestamp_seconds,
-            comment=f"{settings.annotator_name} ({settings.annotator_version}), segtok ({SEGTOK_VERSION})"
-        )
+        modification_meta = create_modification_meta(modification_timestamp_seconds)
 
     except Exception as ex:
         logger.exception(ex)
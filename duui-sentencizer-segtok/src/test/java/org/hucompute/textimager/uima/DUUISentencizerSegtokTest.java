@@ -107,6 +107,37 @@ public class DUUISentencizerSegtokTest {
         assertArrayEquals(expectedSentenceSpansEnd, actualSenttencesSpansEnd);
     }
 
+    @Test
+    public void streamRepeatedSentencesTest() throws Exception {
+        composer.add(
+                new DUUIDockerDriver.Component(dockerImage)
+                        .withImageFetching()
+                        .withParameter("stream", "true")
+        );
+
+        List<String> expectedSentences = Arrays.asList(
+                "This is an example.",
+                "This is an example."
+        );
+        Integer[] expectedSentenceSpansBegin = new Integer[]{ 0, 0, 20 };
+        Integer[] expectedSentenceSpansEnd = new Integer[]{ 19, 0, 39 };
+
+        createCas("en", expectedSentences);
+        composer.run(cas);
+
+        Collection<DocumentModification> actualDocumentModifications = new ArrayList<>(JCasUtil.select(cas, DocumentModification.class));
+        assertEquals(1, actualDocumentModifications.size());
+
+        Collection<Sentence> actualSentences = new ArrayList<>(JCasUtil.select(cas, Sentence.class));
+        assertEquals(expectedSentences.size()+1, actualSentences.size());
+
+        Integer[] actualSenttencesSpansBegin = actualSentences.stream().map(Sentence::getBegin).toArray(Integer[]::new);
+        assertArrayEquals(expectedSentenceSpansBegin, actualSenttencesSpansBegin);
+
+        Integer[] actualSenttencesSpansEnd = actualSentences.stream().map(Sentence::getEnd).toArray(Integer[]::new);
+        assertArrayEquals(expectedSentenceSpansEnd, actualSenttencesSpansEnd);
+    }
+
     @Test
     public void emptyTest() throws Exception {
         composer.add(
@@ -0,0 +1,65 @@
+"""
+Time to segment synthetic texts of increasing size and find the sentence offsets, with the search from the
+start of the text used before compared to "find_sentences", to show the linear scaling.
+
+Run from the component root: python src/test/python/benchmark_find_sentences.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import import_service
+
+SIZES_MB = [1, 2, 4, 8, 16]
+# the search from the start is quadratic, only run it on the small texts
+LEGACY_MAX_MB = 2
+
+WORDS = ["the", "cat", "sat", "on", "a", "mat", "while", "Dr.", "Smith", "read", "42", "books", "about", "U.S.", "history"]
+
+
+def synthetic_text(size):
+    random.seed(0)
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = " ".join(random.choice(WORDS) for _ in range(random.randint(5, 25))).capitalize() + "."
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def legacy_find_sentences(text, sents):
+    for sent in sents:
+        begin = text.index(sent)
+        yield begin, begin + len(sent)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as work_dir:
+        service = import_service(work_dir)
+
+        for size_mb in SIZES_MB:
+            text = synthetic_text(size_mb * 1024 * 1024)
+            sents = list(service.segtok_segmenter.split_single(text))
+
+            start = perf_counter()
+            offsets = list(service.find_sentences(text, sents))
+            duration = perf_counter() - start
+
+            start = perf_counter()
+            list(service.find_sentences(text, service.segtok_segmenter.split_single(text)))
+            total_duration = perf_counter() - start
+
+            line = f"{size_mb} MB, {len(offsets)} sentences: find_sentences {duration:.2f} s, with segmentation {total_duration:.2f} s ({total_duration / size_mb:.2f} s/MB)"
+            if size_mb <= LEGACY_MAX_MB:
+                start = perf_counter()
+                list(legacy_find_sentences(text, sents))
+                line += f", search from start {perf_counter() - start:.2f} s"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
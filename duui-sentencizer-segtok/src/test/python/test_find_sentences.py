@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def client(service):
+    from fastapi.testclient import TestClient
+    return TestClient(service.app)
+
+
+def covered(text, offsets):
+    return [text[begin:end] for begin, end in offsets]
+
+
+def test_repeated_sentences_get_their_own_offsets(service):
+    text = "Hello there. Hello there. Goodbye now. Hello there."
+    offsets = list(service.find_sentences(text, service.segtok_segmenter.split_single(text)))
+
+    assert offsets == [(0, 12), (13, 25), (26, 38), (39, 51)]
+    assert covered(text, offsets) == ["Hello there.", "Hello there.", "Goodbye now.", "Hello there."]
+
+
+def test_sentence_repeated_inside_a_later_sentence(service):
+    # the second sentence must not be found inside the first one
+    text = "Yes. Yes. I said yes."
+    offsets = list(service.find_sentences(text, ["Yes.", "Yes.", "I said yes."]))
+    assert offsets == [(0, 4), (5, 9), (10, 21)]
+
+
+def test_empty_sentences_are_kept_at_zero(service):
+    offsets = list(service.find_sentences("A. B.", ["A.", "", "B.", ""]))
+    assert offsets == [(0, 2), (0, 0), (3, 5), (0, 0)]
+
+
+def test_empty_document(service, client):
+    response = client.post("/v1/process", json={"text": "", "len": 0, "lang": "en"})
+    assert [(s["begin"], s["end"]) for s in response.json()["sentences"]] == list(
+        service.find_sentences("", service.segtok_segmenter.split_single(""))
+    )
+
+
+def test_missing_sentence_is_skipped(service):
+    offsets = list(service.find_sentences("First one. Second one.", ["First one.", "Missing.", "Second one."]))
+    assert offsets == [(0, 10), (11, 22)]
+
+
+def test_stream_matches_response(client):
+    text = "Hello there. Hello there.\n\nGoodbye now. Hello there."
+    request = {"text": text, "len": len(text), "lang": "en"}
+
+    sentences = client.post("/v1/process", json=request).json()["sentences"]
+    lines = client.post("/v1/process", json={**request, "parameters": {"stream": "true"}}).text.splitlines()
+
+    assert json.loads(lines[0])["stream"] is True
+    assert [json.loads(line) for line in lines[1:]] == sentences
+    assert len(sentences) == 4
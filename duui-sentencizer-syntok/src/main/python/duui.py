@@ -1,10 +1,13 @@
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from platform import python_version
 from sys import version as sys_version
+from threading import Lock
 from time import time
 from typing import List, Optional
 
 import syntok.segmenter as syntok_segmenter
+from syntok.tokenizer import Tokenizer
 from cassis import load_typesystem
 from fastapi import FastAPI, Response
 from fastapi.responses import PlainTextResponse
@@ -21,6 +24,10 @@ class Settings(BaseSettings):
     annotator_name: str
     annotator_version: str
     log_level: str
+    # Number of processes to segment the paragraphs of large texts in, 1 to disable
+    paragraph_processes: int = 1
+    # Min text length to segment the paragraphs in processes
+    paragraph_processes_min_length: int = 1000000
 
     class Config:
         env_prefix = 'duui_sentencizer_syntok_'
@@ -134,6 +141,42 @@ app = FastAPI(
 )
 
 
+# Keeps the text as is, to keep the offsets
+paragraph_tokenizer = Tokenizer(replace_not_contraction=False)
+
+
+# Sentence begins of a paragraph, relative to the paragraph start
+def segment_paragraph(paragraph: str) -> List[int]:
+    return [
+        sentence[0].offset
+        for sentence in syntok_segmenter.segment(paragraph_tokenizer.tokenize(paragraph))
+    ]
+
+
+paragraph_pool = None
+paragraph_pool_lock = Lock()
+
+
+def get_paragraph_pool() -> ProcessPoolExecutor:
+    global paragraph_pool
+    with paragraph_pool_lock:
+        if paragraph_pool is None:
+            logger.info("Starting %d processes for paragraph segmentation", settings.paragraph_processes)
+            paragraph_pool = ProcessPoolExecutor(settings.paragraph_processes)
+        return paragraph_pool
+
+
+# Segment paragraphs independently, in processes for large texts, results are in order of the paragraphs
+def segment_paragraphs(paragraphs: List[str], text_len: int):
+    if settings.paragraph_processes > 1 and len(paragraphs) > 1 and text_len >= settings.paragraph_processes_min_length:
+        # several chunks per process, to balance paragraphs of different lengths
+        chunksize = max(1, len(paragraphs) // (settings.paragraph_processes * 4))
+        logger.info("Segmenting %d paragraphs in %d processes", len(paragraphs), settings.paragraph_processes)
+        return get_paragraph_pool().map(segment_paragraph, paragraphs, chunksize=chunksize)
+
+    return map(segment_paragraph, paragraphs)
+
+
 @app.get("/v1/communication_layer", response_class=PlainTextResponse)
 def get_communication_layer() -> str:
     return lua_communication_script
@@ -189,20 +232,18 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
     modification_meta = None
 
     try:
-        doc = syntok_segmenter.process(request.text)
-        for paragraph in doc:
-            para = list(paragraph)
-            for i, s in enumerate(para):
-                try:
-                    sentences.append(Sentence(
-                        begin=s[0].offset,
-                        end=para[i + 1][0].offset - 1,
-                    ))
-                except:
-                    sentences.append(Sentence(
-                        begin=s[0].offset,
-                        end=request.len - 1,
-                    ))
+        paragraphs = syntok_segmenter.preprocess_with_offsets(request.text)
+        paragraphs_begins = segment_paragraphs([paragraph for _, paragraph in paragraphs], len(request.text))
+        for (paragraph_offset, paragraph), begins in zip(paragraphs, paragraphs_begins):
+            for i, begin in enumerate(begins):
+                # sentences end before the whitespace to the next sentence, the last one with its paragraph
+                end = begins[i + 1] if i + 1 < len(begins) else len(paragraph)
+                while end > begin and paragraph[end - 1].isspace():
+                    end -= 1
+                sentences.append(Sentence(
+                    begin=paragraph_offset + begin,
+                    end=paragraph_offset + end,
+                ))
 
         meta = AnnotationMeta(
             name=settings.annotator_name,
@@ -107,6 +107,29 @@ public class DUUISentencizerSyntokTest {
         assertArrayEquals(expectedSentenceSpansEnd, actualSenttencesSpansEnd);
     }
 
+    @Test
+    public void paragraphsTest() throws Exception {
+        composer.add(
+                new DUUIDockerDriver.Component(dockerImage)
+                        .withImageFetching()
+        );
+
+        cas.setDocumentLanguage("en");
+        cas.setDocumentText("First para. Second sent.\n\nNew para here. And more.\n\n\nLast one");
+        composer.run(cas);
+
+        Integer[] expectedSentenceSpansBegin = new Integer[]{ 0, 12, 26, 41, 53 };
+        Integer[] expectedSentenceSpansEnd = new Integer[]{ 11, 24, 40, 50, 61 };
+
+        Collection<Sentence> actualSentences = new ArrayList<>(JCasUtil.select(cas, Sentence.class));
+
+        Integer[] actualSenttencesSpansBegin = actualSentences.stream().map(Sentence::getBegin).toArray(Integer[]::new);
+        assertArrayEquals(expectedSentenceSpansBegin, actualSenttencesSpansBegin);
+
+        Integer[] actualSenttencesSpansEnd = actualSentences.stream().map(Sentence::getEnd).toArray(Integer[]::new);
+        assertArrayEquals(expectedSentenceSpansEnd, actualSenttencesSpansEnd);
+    }
+
     @Test
     public void emptyTest() throws Exception {
         composer.add(
@@ -0,0 +1,66 @@
+"""
+Time to segment a 50 MB synthetic book-length text, paragraph by paragraph in the service process compared to
+the paragraph process pool with an increasing number of processes.
+
+Run from the component root: python src/test/python/benchmark_segment_paragraphs.py
+"""
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import import_service
+
+TEXT_MB = 50
+PROCESSES = [1, 2, 4]
+
+WORDS = ["the", "old", "captain", "looked", "at", "Mr.", "Brown", "and", "said", "nothing", "about", "3.5", "miles", "of", "sea"]
+
+
+def synthetic_book(size):
+    random.seed(0)
+    paragraphs = []
+    length = 0
+    while length < size:
+        paragraph = " ".join(
+            " ".join(random.choice(WORDS) for _ in range(random.randint(5, 30))).capitalize() + random.choice([".", "!", "?"])
+            for _ in range(random.randint(1, 12))
+        )
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def main():
+    text = synthetic_book(TEXT_MB * 1024 * 1024)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        service = import_service(work_dir)
+        paragraphs = [paragraph for _, paragraph in service.syntok_segmenter.preprocess_with_offsets(text)]
+        print(f"{len(text)} characters, {len(paragraphs)} paragraphs, {os.cpu_count()} cores")
+
+        service.settings.paragraph_processes_min_length = 0
+        expected = None
+        for processes in PROCESSES:
+            service.settings.paragraph_processes = processes
+            service.paragraph_pool = None
+
+            start = perf_counter()
+            begins = list(service.segment_paragraphs(paragraphs, len(text)))
+            duration = perf_counter() - start
+
+            if expected is None:
+                expected = begins
+            assert begins == expected
+            sentences = sum(len(paragraph_begins) for paragraph_begins in begins)
+            print(f"{processes} processes: {duration:.2f} s, {sentences / duration:.0f} sentences/s")
+
+            if service.paragraph_pool is not None:
+                service.paragraph_pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
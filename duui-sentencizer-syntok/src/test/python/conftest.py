@@ -0,0 +1,39 @@
+import os
+import shutil
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+# the Docker image copies the service, typesystem and Lua script into one directory, they are loaded relative to it
+MAIN_DIR = Path(__file__).parents[2] / "main"
+sys.path.insert(0, str(MAIN_DIR / "python"))
+
+
+def import_service(work_dir):
+    """
+    Import the service with the typesystem and Lua script copied to "work_dir", settings are read once on import.
+    """
+    os.environ.update({
+        "DUUI_SENTENCIZER_SYNTOK_ANNOTATOR_NAME": "test",
+        "DUUI_SENTENCIZER_SYNTOK_ANNOTATOR_VERSION": "test",
+        "DUUI_SENTENCIZER_SYNTOK_LOG_LEVEL": "WARNING",
+    })
+    shutil.copy(MAIN_DIR / "resources" / "TypeSystem.xml", work_dir)
+    shutil.copy(MAIN_DIR / "lua" / "communication.lua", work_dir)
+
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        return import_module("duui")
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="session")
+def service(tmp_path_factory):
+    pytest.importorskip("syntok")
+    pytest.importorskip("fastapi")
+    pytest.importorskip("cassis")
+    return import_service(tmp_path_factory.mktemp("syntok"))
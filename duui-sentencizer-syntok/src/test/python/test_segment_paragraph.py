@@ -0,0 +1,71 @@
+import pytest
+
+TEXT = (
+    "Dr. Smith went to Washington. He arrived at 5 p.m. and left again!\n\n"
+    "  A new paragraph starts here.   It has two sentences.\n\n\n"
+    "Unicode \U0001F600 works too. Last one"
+)
+
+
+@pytest.fixture
+def client(service):
+    from fastapi.testclient import TestClient
+    return TestClient(service.app)
+
+
+def reference_begins(service, text):
+    # sentence begins of the whole text, as segmented by syntok in one call
+    return [
+        sentence[0].offset
+        for paragraph in service.syntok_segmenter.analyze(text)
+        for sentence in paragraph
+    ]
+
+
+def test_segment_paragraph_offsets_are_relative(service):
+    paragraph = "  A new paragraph starts here.   It has two sentences."
+    begins = service.segment_paragraph(paragraph)
+
+    assert begins == [2, 33]
+    assert paragraph[begins[1]:].startswith("It has")
+
+    offset_paragraph = "x" * 10 + paragraph
+    assert [begin - 10 for begin in service.segment_paragraph(offset_paragraph)[1:]] == begins[1:]
+
+
+def test_paragraph_offsets_match_whole_text(service):
+    paragraphs = service.syntok_segmenter.preprocess_with_offsets(TEXT)
+    begins = [
+        paragraph_offset + begin
+        for (paragraph_offset, paragraph), paragraph_begins in zip(paragraphs, service.segment_paragraphs([p for _, p in paragraphs], len(TEXT)))
+        for begin in paragraph_begins
+    ]
+    assert begins == reference_begins(service, TEXT)
+
+
+def test_response_sentences(client):
+    response = client.post("/v1/process", json={"text": TEXT, "len": len(TEXT), "lang": "en"})
+    sentences = [TEXT[s["begin"]:s["end"]] for s in response.json()["sentences"]]
+
+    assert sentences == [
+        "Dr. Smith went to Washington.",
+        "He arrived at 5 p.m. and left again!",
+        "A new paragraph starts here.",
+        "It has two sentences.",
+        "Unicode \U0001F600 works too.",
+        "Last one",
+    ]
+
+
+def test_segment_paragraphs_in_processes(service, monkeypatch):
+    paragraphs = [p for _, p in service.syntok_segmenter.preprocess_with_offsets(TEXT * 20)]
+    expected = list(service.segment_paragraphs(paragraphs, 0))
+
+    monkeypatch.setattr(service.settings, "paragraph_processes", 2)
+    monkeypatch.setattr(service.settings, "paragraph_processes_min_length", 0)
+    try:
+        assert list(service.segment_paragraphs(paragraphs, len(TEXT) * 20)) == expected
+    finally:
+        if service.paragraph_pool is not None:
+            service.paragraph_pool.shutdown()
+            service.paragraph_pool = None
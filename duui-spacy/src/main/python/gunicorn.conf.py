@@ -0,0 +1,17 @@
+# Pre-fork mode: the service is imported once in the master process, loading the configured models,
+# and the workers are forked from it, sharing the memory of the models copy-on-write.
+# The number of workers is set on the command line, e.g. "--workers 4"
+import gc
+
+bind = "0.0.0.0:9714"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = 1
+
+# import the app, and load the models, in the master before forking
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # Move all objects created so far to the permanent generation, the garbage collector of the workers
+    # does not touch them, which would otherwise write to their pages and copy them into each worker
+    gc.freeze()
@@ -2,5 +2,11 @@ TEXTIMAGER_SPACY_ANNOTATOR_NAME="textimager-duui-spacy-debug" \
 TEXTIMAGER_SPACY_ANNOTATOR_VERSION="unset" \
 TEXTIMAGER_SPACY_LOG_LEVEL="DEBUG" \
 TEXTIMAGER_SPACY_MODEL_CACHE_SIZE="3" \
+TEXTIMAGER_SPACY_SPLIT_PROCESSES="1" \
+TEXTIMAGER_SPACY_SPLIT_BATCH_SIZE="32" \
+TEXTIMAGER_SPACY_PROCESS_BATCH_SIZE="256" \
+TEXTIMAGER_SPACY_DOC_CACHE_DIR="" \
+TEXTIMAGER_SPACY_DOC_CACHE_MAX_MB="1024" \
+TEXTIMAGER_SPACY_PRELOAD_LANGS="" \
 TEXTIMAGER_SPACY_VARIANT="" \
 uvicorn textimager_duui_spacy:app --host 0.0.0.0 --port 9714
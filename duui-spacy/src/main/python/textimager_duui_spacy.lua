@@ -79,35 +79,11 @@ function serialize(inputCas, outputStream, parameters)
     }))
 end
 
--- This "deserialize" function is called on receiving the results from the annotator that have to be transformed into a CAS object
--- Inputs:
---  - inputCas: The actual CAS object to deserialize into
---  - inputStream: Stream that is received from to the annotator, can be e.g. a string, JSON payload, ...
-function deserialize(inputCas, inputStream)
-    -- Get string from stream, assume UTF-8 encoding
-    local inputString = luajava.newInstance("java.lang.String", inputStream:readAllBytes(), StandardCharsets.UTF_8)
-
-    -- Parse JSON data from string into object
-    local results = json.decode(inputString)
-
-    -- Add modification annotation
-    local modification_meta = results["modification_meta"]
-    local modification_anno = luajava.newInstance("org.texttechnologylab.annotation.DocumentModification", inputCas)
-    modification_anno:setUser(modification_meta["user"])
-    modification_anno:setTimestamp(modification_meta["timestamp"])
-    modification_anno:setComment(modification_meta["comment"])
-    modification_anno:addToIndexes()
-
-    -- Get meta data, this is the same for every annotation
-    local meta = results["meta"]
-
-    -- If was pretokenized, use existing tokens
-    local is_pretokenized = results["is_pretokenized"]
-
-    -- Add sentences
-    for i, sent in ipairs(results["sentences"]) do
+-- Add sentences
+function add_sentences(inputCas, meta, sentences)
+    for i, sent in ipairs(sentences) do
         -- Writing can be disabled via parameters
-        -- Note: spaCy will still run the full pipeline, and all results are based on these results
+        -- Note: spaCy only runs the pipeline components needed for the written types
         if sent["write_sentence"] then
             -- Create sentence annotation
             local sent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence", inputCas)
@@ -129,25 +105,16 @@ function deserialize(inputCas, inputStream)
             meta_anno:addToIndexes()
         end
     end
+end
 
-    -- Add tokens
-    -- Save all tokens, to allow for retrieval in dependencies
-    local all_tokens = {}
-    if is_pretokenized then
-        local tokens_count = 0
-        local tokens_it = JCasUtil:select(inputCas, Token):iterator()
-        while tokens_it:hasNext() do
-            local token = tokens_it:next()
-            all_tokens[tokens_count] = token
-            tokens_count = tokens_count + 1
-        end
-    end
-    for i, token in ipairs(results["tokens"]) do
+-- Add tokens, "all_tokens" maps the token indices to the token annotations, to allow for retrieval in dependencies
+function add_tokens(inputCas, meta, tokens, all_tokens, is_pretokenized)
+    for i, token in ipairs(tokens) do
         -- Save current token
         local token_anno = nil
         if is_pretokenized then
             -- Use existing token if pretokenized
-            token_anno = all_tokens[i-1]
+            token_anno = all_tokens[token["ind"]]
         elseif token["write_token"] then
             -- Create token annotation
             token_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Token", inputCas)
@@ -176,8 +143,7 @@ function deserialize(inputCas, inputStream)
             end
 
             -- Save current token using its index
-            -- Note: Lua starts counting at 1
-            all_tokens[i-1] = token_anno
+            all_tokens[token["ind"]] = token_anno
 
             -- Create meta data for this token
             local meta_anno = luajava.newInstance("org.texttechnologylab.annotation.SpacyAnnotatorMetaData", inputCas)
@@ -331,9 +297,11 @@ function deserialize(inputCas, inputStream)
             meta_anno:addToIndexes()
         end
     end
+end
 
-    -- Add dependencies
-    for i, dep in ipairs(results["dependencies"]) do
+-- Add dependencies
+function add_dependencies(inputCas, meta, dependencies, all_tokens)
+    for i, dep in ipairs(dependencies) do
         if dep["write_dep"] then
             -- Create specific annotation based on type
             local dep_anno
@@ -379,9 +347,11 @@ function deserialize(inputCas, inputStream)
             meta_anno:addToIndexes()
         end
     end
+end
 
-    -- Add entities
-    for i, ent in ipairs(results["entities"]) do
+-- Add entities
+function add_entities(inputCas, meta, entities)
+    for i, ent in ipairs(entities) do
         if ent["write_entity"] then
             local ent_anno = luajava.newInstance("de.tudarmstadt.ukp.dkpro.core.api.ner.type.NamedEntity", inputCas)
             ent_anno:setBegin(ent["begin"])
@@ -403,3 +373,60 @@ function deserialize(inputCas, inputStream)
         end
     end
 end
+
+-- This "deserialize" function is called on receiving the results from the annotator that have to be transformed into a CAS object
+-- Inputs:
+--  - inputCas: The actual CAS object to deserialize into
+--  - inputStream: Stream that is received from to the annotator, can be e.g. a string, JSON payload, ...
+function deserialize(inputCas, inputStream)
+    -- Read stream line by line, assume UTF-8 encoding
+    -- Note: The response is either a single JSON object, or a header followed by one JSON object per sentence if streamed
+    local reader = luajava.newInstance("java.io.BufferedReader", luajava.newInstance("java.io.InputStreamReader", inputStream, StandardCharsets.UTF_8))
+
+    -- Parse JSON data from first line into object
+    local results = json.decode(reader:readLine())
+
+    -- Add modification annotation
+    local modification_meta = results["modification_meta"]
+    local modification_anno = luajava.newInstance("org.texttechnologylab.annotation.DocumentModification", inputCas)
+    modification_anno:setUser(modification_meta["user"])
+    modification_anno:setTimestamp(modification_meta["timestamp"])
+    modification_anno:setComment(modification_meta["comment"])
+    modification_anno:addToIndexes()
+
+    -- Get meta data, this is the same for every annotation
+    local meta = results["meta"]
+
+    -- If was pretokenized, use existing tokens
+    local is_pretokenized = results["is_pretokenized"]
+
+    -- Save all tokens, to allow for retrieval in dependencies
+    local all_tokens = {}
+    if is_pretokenized then
+        local tokens_count = 0
+        local tokens_it = JCasUtil:select(inputCas, Token):iterator()
+        while tokens_it:hasNext() do
+            local token = tokens_it:next()
+            all_tokens[tokens_count] = token
+            tokens_count = tokens_count + 1
+        end
+    end
+
+    if results["stream"] then
+        -- Add annotations sentence by sentence, only one line is kept in memory at a time
+        local line = reader:readLine()
+        while line ~= nil do
+            local chunk = json.decode(line)
+            add_sentences(inputCas, meta, chunk["sentences"])
+            add_tokens(inputCas, meta, chunk["tokens"], all_tokens, is_pretokenized)
+            add_dependencies(inputCas, meta, chunk["dependencies"], all_tokens)
+            add_entities(inputCas, meta, chunk["entities"])
+            line = reader:readLine()
+        end
+    else
+        add_sentences(inputCas, meta, results["sentences"])
+        add_tokens(inputCas, meta, results["tokens"], all_tokens, is_pretokenized)
+        add_dependencies(inputCas, meta, results["dependencies"], all_tokens)
+        add_entities(inputCas, meta, results["entities"])
+    end
+end
\ No newline at end of file
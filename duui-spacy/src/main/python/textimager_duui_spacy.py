@@ -1,20 +1,24 @@
 import logging
+import os
+import re
 from functools import lru_cache
+from hashlib import sha256
 from platform import python_version
 from sys import version as sys_version
-from threading import Lock
+from threading import Lock, get_ident
 from time import time
 from typing import List, Optional, Union
 from urllib.parse import urlparse
 
+import numpy as np
 import spacy
 from cassis import load_typesystem
-from cassis.cas import Utf16CodepointOffsetConverter
 from fastapi import FastAPI, Response
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
-from spacy.tokens import Doc
+from spacy.attrs import IDX, LENGTH, HEAD, DEP, POS, TAG, LEMMA, MORPH, IS_SPACE, LIKE_URL
+from spacy.tokens import Doc, DocBin, MorphAnalysis
 
 
 # Settings
@@ -34,6 +38,19 @@ class Settings(BaseSettings):
     single_model: Optional[str] = None
     # This is set to the language of the single model
     single_model_lang: Optional[str] = None
+    # Number of processes to run split texts in, forked from the service to share the loaded model, 1 to disable
+    # Note: Only used for models without transformer components, torch is not safe to use in forked processes
+    split_processes: int = 1
+    # Number of split texts sent to a process at once
+    split_batch_size: int = 32
+    # spaCy batch size for documents of the batch endpoint
+    process_batch_size: int = 256
+    # Directory of the processed docs cache, empty to disable the cache
+    doc_cache_dir: Optional[str] = None
+    # Max size of the processed docs cache in MB
+    doc_cache_max_mb: int = 1024
+    # Languages to load the default models of on startup, comma separated, the single model is always loaded
+    preload_langs: Optional[str] = None
 
     class Config:
         env_prefix = 'textimager_spacy_'
@@ -80,6 +97,49 @@ if settings.variant not in VARIANT_SETTINGS.keys():
 # Note: Without any extra meta types or subtypes
 TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES = set(VARIANT_SETTINGS[settings.variant])
 
+# Pipeline components needed for each type, known components are disabled if none of their types are written
+# Note: Components not listed here, e.g. custom ones, always run
+WRITE_TYPE_COMPONENTS = {
+    UIMA_TYPE_SENTENCE: {"parser", "senter", "sentencizer"},
+    UIMA_TYPE_TOKEN: set(),
+    UIMA_TYPE_LEMMA: {"lemmatizer", "trainable_lemmatizer", "tagger", "morphologizer", "attribute_ruler"},
+    UIMA_TYPE_POS: {"tagger", "morphologizer", "attribute_ruler"},
+    UIMA_TYPE_MORPH: {"morphologizer", "tagger", "attribute_ruler"},
+    UIMA_TYPE_DEPENDENCY: {"parser"},
+    UIMA_TYPE_DEPENDENCY_ROOT: {"parser"},
+    UIMA_TYPE_NAMED_ENTITY: {"ner", "entity_ruler", "entity_linker"},
+}
+# Shared embedding components, only disabled if no other component runs
+EMBEDDING_COMPONENTS = {"tok2vec", "transformer"}
+# Components using torch, pipelines containing them are never processed in forked processes
+FORK_UNSAFE_COMPONENTS = {"transformer", "curated_transformer"}
+
+# Morphological features written to the UIMA type
+# TODO check in nlp.meta for missing
+MORPH_FEATURES = {
+    "Gender": "gender",
+    "Number": "number",
+    "Case": "case",
+    "Degree": "degree",
+    "VerbForm": "verbForm",
+    "Tense": "tense",
+    "Mood": "mood",
+    "Voice": "voice",  # ?
+    "Definite": "definiteness",
+    "Person": "person",
+    "Aspect": "aspect",  # ?
+    "Animacy": "animacy",  # ?
+    "Negative": "negative",  # ?
+    "NumType": "numType",  # ?
+    "Possessive": "possessive",  # ?
+    "PronType": "pronType",
+    "Reflex": "reflex",
+    "Transitivity": "transitivity",  # ?
+}
+
+# Token attributes extracted from the doc at once, columns of "Doc.to_array"
+TOKEN_ATTRS = [IDX, LENGTH, HEAD, DEP, POS, TAG, LEMMA, MORPH, IS_SPACE, LIKE_URL]
+
 # TODO this is just a test! add final values for spacy tools
 TEXTIMAGER_ANNOTATOR_INPUT_TYPES = {
     "": [""],
@@ -273,6 +333,24 @@ class TextImagerResponse(BaseModel):
     is_pretokenized: bool
 
 
+# First line of a streamed response, followed by one TextImagerStreamChunk line per sentence
+# Note, this is transformed by the Lua script
+class TextImagerStreamHeader(BaseModel):
+    # Marks the response as streamed
+    stream: bool = True
+    meta: Optional[AnnotationMeta] = None
+    modification_meta: Optional[DocumentModification] = None
+    is_pretokenized: bool
+
+
+# Annotations of one sentence of a streamed response
+class TextImagerStreamChunk(BaseModel):
+    sentences: List[Sentence]
+    tokens: List[Token]
+    dependencies: List[Dependency]
+    entities: List[Entity]
+
+
 # Capabilities
 class TextImagerCapability(BaseModel):
     # List of supported languages by the annotator
@@ -383,22 +461,26 @@ with open(lua_communication_script_filename, 'rb') as f:
     logger.debug(lua_communication_script_filename)
 
 
+# Get the tools to enable when loading a model, None for all
+def get_enabled_tools(variant):
+    if variant:
+        # at the moment, only one tool is supported and no dynamic loading
+        return (variant[1:],)
+    return None
+
+
 # Load/cache spaCy model
 @lru_cache_with_size
 def load_cache_spacy_model(model_name, model_lang, enabled_tools):
-    # What tools to enable in the pipeline?
-    enabled_tools = None
-    if settings.variant:
-        # handle special case for sentencizer
-        if settings.variant == "-sentencizer":
-            return load_cache_spacy_sentencizer_model(model_lang)
+    # handle special case for sentencizer
+    if settings.variant == "-sentencizer":
+        return load_cache_spacy_sentencizer_model(model_lang)
 
-        # at the moment, only one tool is supported and no dynamic loading
-        enabled_tools = [settings.variant[1:]]
+    # What tools to enable in the pipeline?
     logger.info("Enabled tools in pipeline: %s", ", ".join(enabled_tools) if enabled_tools is not None else "all")
 
     logger.info("Loading spaCy model \"%s\"...", model_name)
-    nlp = spacy.load(model_name, enable=enabled_tools)
+    nlp = spacy.load(model_name, enable=list(enabled_tools) if enabled_tools is not None else None)
     logger.info("Finished loading spaCy model \"%s\"", model_name)
     return nlp
 
@@ -451,6 +533,131 @@ def load_spacy_sentencizer_model(model_lang):
     return nlp, err
 
 
+# On-disk cache of processed docs, one DocBin file per text
+# Least recently used files are removed if the cache exceeds its size limit, the modification time of a file is its last use
+# Note: The directory is shared by all workers (see "gunicorn.conf.py"), so there is no index of the files in memory,
+# each worker scans the directory after writing a fraction of the size limit and evicts down to the rest,
+# with n workers the directory can exceed the limit by (n-1) times this fraction
+class DocCache:
+    SCAN_FRACTION = 0.1
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # bytes written by this worker since the last scan
+        self.written_bytes = 0
+
+    @staticmethod
+    def key(spacy_meta, enabled_components, text):
+        key = sha256(f"{spacy_meta['lang']}_{spacy_meta['name']}|{spacy_meta['version']}|{spacy.__version__}|{','.join(enabled_components)}|".encode("utf-8"))
+        # text might contain lone surrogates, see "utf16_to_utf8"
+        key.update(text.encode("utf-8", "surrogatepass"))
+        return key.hexdigest()
+
+    def _filename(self, key):
+        return os.path.join(self.cache_dir, key + ".spacy")
+
+    def get(self, key, vocab):
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            # might have been evicted by another worker in the meantime
+            os.utime(filename)
+        except OSError:
+            pass
+
+        try:
+            return next(DocBin().from_bytes(data).get_docs(vocab))
+        except Exception as ex:
+            logger.exception("Failed to read cached doc: %s", ex)
+            self._remove(filename)
+            return None
+
+    def put(self, key, doc):
+        try:
+            data = DocBin(docs=[doc]).to_bytes()
+        except Exception as ex:
+            logger.exception("Failed to serialize doc for cache: %s", ex)
+            return
+        if len(data) > self.max_bytes:
+            return
+
+        # write to a temporary file first, an interrupted write must not be read later
+        filename = self._filename(key)
+        tmp_filename = f"{filename}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(data)
+        os.replace(tmp_filename, filename)
+
+        with self.lock:
+            self.written_bytes += len(data)
+            if self.written_bytes > self.max_bytes * self.SCAN_FRACTION:
+                self._evict()
+
+    @staticmethod
+    def _remove(filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    # Scan the cache directory and remove the least recently used files down to the size limit minus the scan fraction
+    def _evict(self):
+        files = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".spacy"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        files.sort()
+
+        used_bytes = sum(size for _, _, size in files)
+        logger.debug("Doc cache \"%s\" contains %d docs, %d bytes", self.cache_dir, len(files), used_bytes)
+        for _, filename, size in files:
+            if used_bytes <= self.max_bytes * (1 - self.SCAN_FRACTION):
+                break
+            self._remove(filename)
+            used_bytes -= size
+        self.written_bytes = 0
+
+
+# Cache of processed docs, if enabled
+doc_cache = None
+if settings.doc_cache_dir:
+    doc_cache = DocCache(settings.doc_cache_dir, settings.doc_cache_max_mb * 1024 * 1024)
+
+
+# Load models on startup, using the same cache keys as the requests
+# Note: In pre-fork mode (see "gunicorn.conf.py") this runs in the master process, the forked workers share the models
+def preload_spacy_models():
+    models = []
+    if settings.single_model is not None:
+        models.append((settings.single_model, settings.single_model_lang))
+    elif settings.preload_langs:
+        for lang in settings.preload_langs.split(","):
+            if lang.strip():
+                models.append(get_spacy_model_name(lang.strip(), {}))
+
+    for model_name, model_lang in models:
+        logger.info("Preloading spaCy model \"%s\"", model_name)
+        nlp, nlp_err = load_spacy_model(model_name, model_lang, get_enabled_tools(settings.variant))
+        if nlp is None:
+            logger.error("Failed to preload spaCy model \"%s\": %s", model_name, nlp_err)
+
+
+preload_spacy_models()
+
+
 # Start fastapi
 # TODO openapi types are not shown?
 # TODO self host swagger files: https://fastapi.tiangolo.com/advanced/extending-openapi/#self-hosting-javascript-and-css-for-docs
@@ -554,6 +761,58 @@ def get_input_output() -> TextImagerInputOutput:
     )
 
 
+# Get the pipeline components not needed to write the given types
+def get_disabled_components(nlp, write_types):
+    needed_components = set()
+    for write_type in write_types:
+        needed_components.update(WRITE_TYPE_COMPONENTS.get(write_type, set()))
+    known_components = set().union(*WRITE_TYPE_COMPONENTS.values())
+
+    disabled_components = [
+        name
+        for name in nlp.pipe_names
+        if name in known_components and name not in needed_components
+    ]
+
+    # embeddings are only needed if there is any other component left
+    if all(name in disabled_components or name in EMBEDDING_COMPONENTS for name in nlp.pipe_names):
+        disabled_components.extend(name for name in nlp.pipe_names if name in EMBEDDING_COMPONENTS)
+
+    return disabled_components
+
+
+# Characters outside the BMP, these need two UTF-16 code units in Java
+ASTRAL_CHARACTERS = re.compile("[\U00010000-\U0010FFFF]")
+
+
+# Convert offsets between Python codepoints and UTF-16 code units as used by Java/UIMA
+# Note: Most texts do not contain astral characters, conversion is the identity for these
+class Utf16OffsetConverter:
+    def __init__(self, text):
+        # number of astral characters before each offset, None if there are none
+        self.astral_before = None
+        if not text.isascii() and ASTRAL_CHARACTERS.search(text) is not None:
+            codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+            self.astral_before = np.concatenate(([0], np.cumsum(codepoints > 0xFFFF)))
+
+    def python_to_external(self, idx):
+        if self.astral_before is None:
+            return idx
+        return idx + int(self.astral_before[idx])
+
+    # Convert a numpy array of offsets at once
+    def python_to_external_array(self, idx):
+        if self.astral_before is None:
+            return idx
+        return idx + self.astral_before[idx]
+
+    def external_to_python(self, idx):
+        if self.astral_before is None:
+            return idx
+        external_offsets = np.arange(len(self.astral_before)) + self.astral_before
+        return int(np.searchsorted(external_offsets, idx))
+
+
 def utf16_to_utf8(text):
     # TODO move to separate duui lib
     clean_text = text.encode('utf-16', 'surrogatepass').decode('utf-16', 'surrogateescape')
@@ -581,9 +840,447 @@ def parse_url(url):
         return None
 
 
-# Process request from DUUI
-@app.post("/v1/process")
-def post_process(request: TextImagerRequest) -> TextImagerResponse:
+# Get morph string and details from a morph hash, as in "token.morph"
+def get_morph(vocab, morph_key):
+    if morph_key == 0:
+        return "", {}
+
+    feats = list(MorphAnalysis.from_id(vocab, morph_key))
+
+    # Extract specific morph features
+    morph_details = {}
+    for feat in feats:
+        fields = feat.split("=")
+        if len(fields) != 2:
+            continue
+        feat_key = fields[0].strip()
+        if feat_key in MORPH_FEATURES:
+            morph_details[MORPH_FEATURES[feat_key]] = fields[1].strip()
+
+    return "|".join(feats), morph_details
+
+
+# Get strings of all unique hashes in a column
+def get_strings(strings, column):
+    return {
+        key: strings[key]
+        for key in np.unique(column).tolist()
+    }
+
+
+# Token attributes of a doc, all read at once, tokens and dependencies can be extracted for any token range
+class DocTokens:
+    def __init__(self, doc, doc_begin, utf16_converter, write_types):
+        # "doc.text" joins all tokens on each access
+        self.text = doc.text
+
+        attrs = doc.to_array(TOKEN_ATTRS)
+        self.idx, self.length, _, self.dep, self.pos, self.tag, self.lemma, self.morph, is_space, self.like_url = attrs.T
+        # heads are relative to the token, negative offsets are stored as unsigned
+        self.head = np.arange(len(doc)) + attrs[:, 2].astype(np.int64)
+        self.is_space = is_space.astype(bool)
+
+        # index of each token in the written tokens, spaces are skipped
+        self.token_inds = np.cumsum(~self.is_space) - 1
+        # number of written tokens
+        self.count = int(np.count_nonzero(~self.is_space))
+
+        # convert all offsets at once
+        self.begins = doc_begin + self.idx.astype(np.int64)
+        self.ends = self.begins + self.length.astype(np.int64)
+        if utf16_converter is not None:
+            self.begins = utf16_converter.python_to_external_array(self.begins)
+            self.ends = utf16_converter.python_to_external_array(self.ends)
+
+        strings = doc.vocab.strings
+        self.dep_strings = get_strings(strings, self.dep)
+        self.pos_strings = get_strings(strings, self.pos)
+        self.tag_strings = get_strings(strings, self.tag)
+        self.lemma_strings = get_strings(strings, self.lemma)
+        self.morphs = {
+            key: get_morph(doc.vocab, key)
+            for key in np.unique(self.morph).tolist()
+        }
+
+        self.write_token = UIMA_TYPE_TOKEN in write_types
+        self.write_lemma = UIMA_TYPE_LEMMA in write_types
+        self.write_pos = UIMA_TYPE_POS in write_types
+        self.write_morph = UIMA_TYPE_MORPH in write_types
+        self.write_dep = UIMA_TYPE_DEPENDENCY in write_types
+
+    # Extract tokens and dependencies of the tokens from "start" to "end",
+    # "ind_offset" is added to the token indices, e.g. the number of tokens of previous docs
+    def extract(self, start, end, ind_offset=0):
+        tokens = []
+        dependencies = []
+
+        begins = self.begins[start:end].tolist()
+        ends = self.ends[start:end].tolist()
+
+        for i, (token_begin, token_length, token_dep, token_pos, token_tag, token_lemma, token_morph, token_like_url) \
+                in enumerate(zip(self.idx[start:end].tolist(), self.length[start:end].tolist(), self.dep[start:end].tolist(), self.pos[start:end].tolist(), self.tag[start:end].tolist(), self.lemma[start:end].tolist(), self.morph[start:end].tolist(), self.like_url[start:end].tolist()), start=start):
+            if self.is_space[i]:
+                continue
+
+            token_end = token_begin + token_length
+            morph_value, morph_details = self.morphs[token_morph]
+
+            # Create token data
+            current_token = Token(
+                begin=begins[i-start],
+                end=ends[i-start],
+
+                # Token
+                ind=ind_offset+int(self.token_inds[i]),
+                write_token=self.write_token,
+
+                # Lemma
+                lemma=self.lemma_strings[token_lemma],
+                write_lemma=self.write_lemma,
+
+                # POS
+                # TODO pos mapping?
+                pos=self.tag_strings[token_tag],
+                pos_coarse=self.pos_strings[token_pos],
+                write_pos=self.write_pos,
+
+                # Morph
+                morph=morph_value,
+                morph_details=dict(morph_details),
+                write_morph=self.write_morph,
+
+                # URL
+                like_url=bool(token_like_url),
+                url_parts=parse_url(self.text[token_begin:token_end]) if token_like_url else None
+            )
+            tokens.append(current_token)
+
+            # Dependency, if the head is not a space
+            token_head = self.head[i]
+            if not self.is_space[token_head]:
+                current_dep = Dependency(
+                    begin=current_token.begin,
+                    end=current_token.end,
+                    type=self.dep_strings[token_dep].upper(),
+                    flavor="basic",
+                    dependent_ind=current_token.ind,
+                    governor_ind=ind_offset+int(self.token_inds[token_head]),
+                    write_dep=self.write_dep
+                )
+                dependencies.append(current_dep)
+
+                # Add reference to token
+                current_token.parent_ind = current_dep.governor_ind
+                current_token.write_dep = self.write_dep
+
+        return tokens, dependencies
+
+
+# Extract tokens and dependencies of a whole doc
+def extract_tokens(doc, doc_begin, utf16_converter, write_types, ind_offset=0):
+    return DocTokens(doc, doc_begin, utf16_converter, write_types).extract(0, len(doc), ind_offset)
+
+
+# State of processing one request, shared by the single and batch endpoints
+class ProcessJob:
+    def __init__(self, request: TextImagerRequest):
+        self.request = request
+        # Save modification start time for later
+        self.modification_timestamp_seconds = int(time())
+        self.nlp = None
+        self.spacy_meta = None
+        self.is_pretokenized = False
+        self.has_sentences = False
+        # Inputs for spaCy, texts or pretokenized docs, with their meta data
+        self.inputs = []
+        self.texts_meta = []
+        self.write_types = set()
+        self.disabled_components = []
+
+
+# Load model and prepare the inputs of a request for spaCy
+def prepare_job(request: TextImagerRequest) -> ProcessJob:
+    job = ProcessJob(request)
+
+    # Get CAS from XMI string
+    logger.debug("Received:")
+    logger.debug(request)
+
+    # Params, set here to empty dict to allow easier access later
+    if request.parameters is None:
+        request.parameters = {}
+
+    # Get spaCy model if not in single model mode
+    if settings.single_model is None:
+        # Resolve model name
+        model_name, model_lang = get_spacy_model_name(request.lang, request.parameters)
+    else:
+        # In single mode we always use the single specified model!
+        model_name = settings.single_model
+        model_lang = settings.single_model_lang
+        logger.info("Using single model image: \"%s\"", model_name)
+    logger.info("Using spaCy model: \"%s\"", model_name)
+
+    # Load model, this is cached
+    nlp, nlp_err = load_spacy_model(model_name, model_lang, get_enabled_tools(settings.variant))
+    if nlp is None:
+        raise Exception(f"spaCy model \"{model_name}\" could not be loaded: {nlp_err}")
+    job.nlp = nlp
+
+    # Get meta data on spaCy and used model
+    spacy_meta = nlp.meta
+    job.spacy_meta = spacy_meta
+
+    # Split large texts if needed and allowed
+    # TODO test splitting!
+    texts = None
+    texts_meta = None
+    text_len = len(request.text)
+
+    # only if not pretokenized
+    is_pretokenized = request.tokens is not None and len(request.tokens) > 0 \
+                      and request.spaces is not None and len(request.spaces) > 0 \
+                      and len(request.tokens) == len(request.spaces)
+    job.is_pretokenized = is_pretokenized
+
+    has_sentences = request.sent_starts is not None and len(request.sent_starts) > 0
+    job.has_sentences = has_sentences
+
+    logger.info("Input is pretokenized: %s", "yes" if is_pretokenized else "no")
+    if not is_pretokenized:
+        # TODO add splitting for pretokenized texts?
+        #  or remove completely -> should better be solved by DUUI segmentation
+        logger.debug("spaCy max size: %d", nlp.max_length)
+        logger.debug("Text size: %d", text_len)
+        force_split_text = (request.parameters["force_split_text"].lower() != "false") if ("force_split_text" in request.parameters) else False
+        if force_split_text or nlp.max_length < text_len:
+            # Allow splitting of large texts?
+            split_large_texts = (request.parameters["split_large_texts"].lower() != "false") if ("split_large_texts" in request.parameters) else False
+            if split_large_texts:
+                # Try to split based on sentences first
+                # NOTE this does not support utf16 conversion as this will be removed and handled by duui later!
+                model_lang = spacy_meta["lang"]
+                logger.info(f"Splitting text into sentences using \"{model_lang}\" sentencizer...")
+                try:
+                    # Load cached sentencizer model
+                    nlp_sents, nlp_sents_err = load_spacy_sentencizer_model(model_lang)
+                    if nlp_sents is None:
+                        raise Exception(f"spaCy sentencizer model \"{model_lang}\" could not be loaded: {nlp_sents_err}")
+                    # The sentencizer only tokenizes, the length limit of the model does not apply to it,
+                    # splitting texts larger than this limit is what it is used for
+                    if nlp_sents.max_length < text_len:
+                        nlp_sents.max_length = text_len + 100
+                    doc_sents = nlp_sents(request.text)
+                    texts = []
+                    texts_meta = []
+                    # offsets of all splits are relative to the full text
+                    utf16_converter = Utf16OffsetConverter(request.text)
+                    for sent in doc_sents.sents:
+                        texts.append(sent.text)
+                        texts_meta.append({
+                            "begin": sent.start_char,
+                            "end": sent.end_char,
+                            "utf16_converter": utf16_converter,
+                        })
+                except Exception as ex:
+                    # Splitting sentences failed, fallback to full text
+                    # TODO try to split using "."
+                    texts = None
+                    texts_meta = None
+                    logger.exception("Failed to split sentences: %s", ex)
+            else:
+                logger.warning("Text is too large, but splitting is disabled, this might be slow to process...")
+
+    # Use full text, if not set
+    if texts is None:
+        # note that this will "fail" for pretokenized texts, as we only have access to the tokens,
+        # in this case the conversion is performed after spaCy processing
+
+        # fix utf16 surrogates
+        text = utf16_to_utf8(request.text)
+        logger.info("Text size after utf16 conversion: %d", len(text))
+        #logger.debug("Text after utf16 conversion: %s", text)
+
+        # init converter
+        utf16_converter = Utf16OffsetConverter(text)
+
+        # use full text
+        texts = [text]
+        texts_meta = [{
+            "begin": utf16_converter.external_to_python(0),
+            "end": utf16_converter.external_to_python(len(request.text)),
+            "utf16_converter": utf16_converter,
+        }]
+    logger.info(f"Found {len(texts)} texts to process.")
+
+    # Abort if no texts found
+    if len(texts) == 0 and not is_pretokenized:
+        logger.warning("No texts found and not pretokenized, aborting...")
+        return job
+
+    # What types to write?
+    if request.parameters is not None and "write_types" in request.parameters and len(request.parameters["write_types"]) > 0:
+        write_types = request.parameters["write_types"]
+        # DUUI parameters are strings, allow a comma separated list
+        if isinstance(write_types, str):
+            write_types = [t.strip() for t in write_types.split(",")]
+        write_types = set(write_types)
+        logger.info("Only writing types: %s", ", ".join(write_types))
+    else:
+        write_types = set(TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES)
+
+    # Only run the components needed for the written types
+    job.disabled_components = get_disabled_components(nlp, write_types)
+    logger.info("Disabled components: %s", ", ".join(job.disabled_components) if job.disabled_components else "none")
+
+    # dont write tokens if pretokenized
+    if is_pretokenized:
+        write_types.discard(UIMA_TYPE_TOKEN)
+        if has_sentences:
+            write_types.discard(UIMA_TYPE_SENTENCE)
+    job.write_types = write_types
+
+    # if pretokenized, convert tokens to utf8 before processing
+    if is_pretokenized:
+        logger.debug("Converting %d pretokenized input to UTF-8", len(request.tokens))
+        request_tokens = [utf16_to_utf8(token) for token in request.tokens]
+
+        if has_sentences:
+            logger.debug(" Using pretokenized text with sentences...")
+            tokdoc = Doc(nlp.vocab, words=request_tokens, spaces=request.spaces, sent_starts=request.sent_starts)
+        else:
+            logger.debug(" Using pretokenized text...")
+            tokdoc = Doc(nlp.vocab, words=request_tokens, spaces=request.spaces)
+        job.inputs = [tokdoc]
+    else:
+        logger.debug(" Using full text...")
+        job.inputs = texts
+    job.texts_meta = texts_meta
+
+    return job
+
+
+# Get the number of processes to run the split texts of a request in
+# Note: "nlp.pipe" forks a new pool for each request from the request thread, this is fine for the CPU models,
+# but torch, as used by the transformer models, might deadlock or crash in the forked processes
+def get_split_processes(nlp):
+    if settings.split_processes <= 1:
+        return 1
+    fork_unsafe = [name for name in nlp.pipe_names if name in FORK_UNSAFE_COMPONENTS]
+    if fork_unsafe:
+        logger.warning("Not splitting into processes, not supported with components: %s", ", ".join(fork_unsafe))
+        return 1
+    return settings.split_processes
+
+
+# Process texts or pretokenized docs with spaCy
+def process_inputs(nlp, inputs, disabled_components, n_process=1, batch_size=None):
+    return list(pipe_inputs(nlp, inputs, disabled_components, n_process, batch_size))
+
+
+# Process texts or pretokenized docs with spaCy, the docs are yielded in order of the inputs as soon as they
+# are processed, so a streamed response does not keep all docs of a large split text in memory
+def pipe_inputs(nlp, inputs, disabled_components, n_process=1, batch_size=None):
+    docs = [None] * len(inputs)
+
+    # Get cached docs, only for texts
+    cache_keys = [None] * len(inputs)
+    if doc_cache is not None:
+        enabled_components = [name for name in nlp.pipe_names if name not in disabled_components]
+        for i, text in enumerate(inputs):
+            if isinstance(text, str):
+                cache_keys[i] = DocCache.key(nlp.meta, enabled_components, text)
+                docs[i] = doc_cache.get(cache_keys[i], nlp.vocab)
+        logger.info("Found %d of %d inputs in doc cache", sum(1 for doc in docs if doc is not None), len(inputs))
+
+    missing_inds = [i for i, doc in enumerate(docs) if doc is None]
+    if len(missing_inds) == 0:
+        yield from docs
+        return
+    missing_inputs = [inputs[i] for i in missing_inds]
+
+    # Find max text length, pretokenized docs are not checked
+    max_length_new = None
+    for text in missing_inputs:
+        if isinstance(text, str) and nlp.max_length < len(text):
+            if max_length_new is None:
+                max_length_new = len(text) + 100
+            else:
+                max_length_new = max(max_length_new, len(text)+100)
+
+    # Increase max length, if needed
+    max_length_before = None
+    if max_length_new is not None:
+        logger.info("Increasing spaCy max length %d -> %d", nlp.max_length, max_length_new)
+        max_length_before = nlp.max_length
+        nlp.max_length = max_length_new
+
+    # Process text with spaCy
+    logger.debug("Start processing...")
+    try:
+        if n_process > 1:
+            # workers are forked with the model already loaded, docs are returned in order of the texts
+            logger.debug(" Using %d processes with batch size %d...", n_process, batch_size)
+        missing_docs = nlp.pipe(missing_inputs, disable=disabled_components, n_process=n_process, batch_size=batch_size)
+
+        for i in range(len(inputs)):
+            doc = docs[i]
+            if doc is None:
+                doc = next(missing_docs)
+                if cache_keys[i] is not None:
+                    doc_cache.put(cache_keys[i], doc)
+            else:
+                docs[i] = None
+            yield doc
+        logger.debug("Procesed %d inputs into %d documents.", len(missing_inputs), len(inputs))
+    finally:
+        # Reset max length, if changed
+        if max_length_before is not None:
+            logger.info("Resetting spaCy max length to %d", max_length_before)
+            nlp.max_length = max_length_before
+
+
+# Build a "annotation comment" annotation
+# Can be used for each annotation
+def create_annotation_meta(spacy_meta) -> AnnotationMeta:
+    return AnnotationMeta(
+        name=settings.annotator_name,
+        version=settings.annotator_version,
+        modelName=spacy_meta["name"],
+        modelVersion=spacy_meta["version"],
+        spacyVersion=spacy.__version__,
+        modelLang=spacy_meta["lang"],
+        modelSpacyVersion=spacy_meta["spacy_version"],
+        modelSpacyGitVersion=spacy_meta["spacy_git_version"]
+    )
+
+
+# Add modification info
+def create_modification_meta(job: ProcessJob) -> DocumentModification:
+    spacy_meta = job.spacy_meta
+    modification_meta_comment = f"{settings.annotator_name} ({settings.annotator_version}), spaCy ({spacy.__version__}), {spacy_meta['lang']} {spacy_meta['name']} ({spacy_meta['version']})"
+    return DocumentModification(
+        user=settings.annotator_name,
+        timestamp=job.modification_timestamp_seconds,
+        comment=modification_meta_comment
+    )
+
+
+# Get the utf16 converter of a doc
+def get_utf16_converter(job: ProcessJob, doc_meta, doc):
+    # generate utf16 converter for each doc on the fly if using pretokenized data
+    if job.is_pretokenized:
+        doc_meta["utf16_converter"] = Utf16OffsetConverter(doc.text)
+
+    if "utf16_converter" in doc_meta:
+        return doc_meta["utf16_converter"]
+
+    logger.warning("No utf16 converter found, this should not happen!")
+    return None
+
+
+# Create the response from the processed docs of a request
+def create_response(job: ProcessJob, docs) -> TextImagerResponse:
     # Return data
     sentences = []
     tokens = []
@@ -591,381 +1288,64 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
     entities = []
     meta = None
     modification_meta = None
-    is_pretokenized = False
-
-    # Save modification start time for later
-    modification_timestamp_seconds = int(time())
 
-    try:
-        # Get CAS from XMI string
-        logger.debug("Received:")
-        logger.debug(request)
-
-        # Params, set here to empty dict to allow easier access later
-        if request.parameters is None:
-            request.parameters = {}
-
-        # Get spaCy model if not in single model mode
-        if settings.single_model is None:
-            # Resolve model name
-            model_name, model_lang = get_spacy_model_name(request.lang, request.parameters)
+    spacy_meta = job.spacy_meta
+    write_types = job.write_types
+
+    if len(job.inputs) > 0:
+        meta = create_annotation_meta(spacy_meta)
+
+    # TODO test splitting in multiple texts
+    for doc_meta, doc in zip(job.texts_meta, docs):
+        utf16_converter = get_utf16_converter(job, doc_meta, doc)
+
+        def utf16_to_ext(idx):
+            return utf16_converter.python_to_external(idx) if utf16_converter is not None else idx
+
+        # Get starting position of this sentence
+        doc_begin = doc_meta["begin"]
+
+        # Sentences
+        logger.debug("Writing Sentences...")
+        # No sentences if the parser and senter are disabled, e.g. if only tokens are requested
+        if doc.has_annotation("SENT_START"):
+            try:
+                # Can fail, e.g. with multilang model
+                # TODO add_pipe("sentencizer") seems to work, check later!
+                for sent in doc.sents:
+                    sentences.append(Sentence(
+                        begin=utf16_to_ext(doc_begin+sent.start_char),
+                        end=utf16_to_ext(doc_begin+sent.end_char),
+                        write_sentence=UIMA_TYPE_SENTENCE in write_types,
+                    ))
+            except Exception as ex:
+                logger.exception("Error accessing sentences: %s", ex)
         else:
-            # In single mode we always use the single specified model!
-            model_name = settings.single_model
-            model_lang = settings.single_model_lang
-            logger.info("Using single model image: \"%s\"", model_name)
-        logger.info("Using spaCy model: \"%s\"", model_name)
-
-        # Load model, this is cached
-        nlp, nlp_err = load_spacy_model(model_name, model_lang, settings.variant)
-        if nlp is None:
-            raise Exception(f"spaCy model \"{model_name}\" could not be loaded: {nlp_err}")
-
-        # Get meta data on spaCy and used model
-        spacy_meta = nlp.meta
-
-        # Split large texts if needed and allowed
-        # TODO test splitting!
-        texts = None
-        texts_meta = None
-        text_len = len(request.text)
-
-        # only if not pretokenized
-        is_pretokenized = request.tokens is not None and len(request.tokens) > 0 \
-                          and request.spaces is not None and len(request.spaces) > 0 \
-                          and len(request.tokens) == len(request.spaces)
-
-        has_sentences = request.sent_starts is not None and len(request.sent_starts) > 0
-
-        logger.info("Input is pretokenized: %s", "yes" if is_pretokenized else "no")
-        if not is_pretokenized:
-            # TODO add splitting for pretokenized texts?
-            #  or remove completely -> should better be solved by DUUI segmentation
-            logger.debug("spaCy max size: %d", nlp.max_length)
-            logger.debug("Text size: %d", text_len)
-            force_split_text = (request.parameters["force_split_text"].lower() != "false") if ("force_split_text" in request.parameters) else False
-            if force_split_text or nlp.max_length < text_len:
-                # Allow splitting of large texts?
-                split_large_texts = (request.parameters["split_large_texts"].lower() != "false") if ("split_large_texts" in request.parameters) else False
-                if split_large_texts:
-                    # Try to split based on sentences first
-                    # NOTE this does not support utf16 conversion as this will be removed and handled by duui later!
-                    model_lang = spacy_meta["lang"]
-                    logger.info(f"Splitting text into sentences using \"{model_lang}\" sentencizer...")
-                    try:
-                        # Load cached sentencizer model
-                        nlp_sents, nlp_sents_err = load_spacy_sentencizer_model(model_lang)
-                        if nlp_sents is None:
-                            raise Exception(f"spaCy sentencizer model \"{model_lang}\" could not be loaded: {nlp_sents_err}")
-                        doc_sents = nlp_sents(request.text)
-                        texts = []
-                        texts_meta = []
-                        for sent in doc_sents.sents:
-                            # TODO add fix for utf16 for all splits
-                            texts.append(sent.text)
-                            texts_meta.append({
-                                "begin": sent.start_char,
-                                "end": sent.end_char,
-                            })
-                    except Exception as ex:
-                        # Splitting sentences failed, fallback to full text
-                        # TODO try to split using "."
-                        texts = None
-                        texts_meta = None
-                        logger.exception("Failed to split sentences: %s", ex)
-                else:
-                    logger.warning("Text is too large, but splitting is disabled, this might be slow to process...")
-
-        # Use full text, if not set
-        if texts is None:
-            # note that this will "fail" for pretokenized texts, as we only have access to the tokens,
-            # in this case the conversion is performed after spaCy processing
-
-            # fix utf16 surrogates
-            text = utf16_to_utf8(request.text)
-            logger.info("Text size after utf16 conversion: %d", len(text))
-            #logger.debug("Text after utf16 conversion: %s", text)
-
-            # init converter
-            utf16_converter = Utf16CodepointOffsetConverter()
-            utf16_converter.create_offset_mapping(text)
-
-            # use full text
-            texts = [text]
-            texts_meta = [{
-                "begin": utf16_converter.external_to_python(0),
-                "end": utf16_converter.external_to_python(len(request.text)),
-                "utf16_converter": utf16_converter,
-            }]
-        logger.info(f"Found {len(texts)} texts to process.")
-
-        # Abort if no texts found
-        if len(texts) == 0 and not is_pretokenized:
-            logger.warning("No texts found and not pretokenized, aborting...")
-        else:
-            # Find max text length, if not pretokenized
-            max_length_new = None
-            if not is_pretokenized:
-                for text in texts:
-                    text_len = len(text)
-                    if nlp.max_length < text_len:
-                        if max_length_new is None:
-                            max_length_new = text_len + 100
-                        else:
-                            max_length_new = max(max_length_new, text_len+100)
-
-            # Increase max length, if needed
-            max_length_before = None
-            if max_length_new is not None:
-                logger.info("Increasing spaCy max length %d -> %d", nlp.max_length, max_length_new)
-                max_length_before = nlp.max_length
-                nlp.max_length = max_length_new
-
-            # Process text with spaCy
-            logger.debug("Start processing...")
-
-            # if pretokenized, convert tokens to utf8 before processing
-            if is_pretokenized:
-                logger.debug("Converting %d pretokenized input to UTF-8", len(request.tokens))
-                request_tokens = [utf16_to_utf8(token) for token in request.tokens]
-            else:
-                request_tokens = None
-
-            if is_pretokenized and has_sentences:
-                logger.debug(" Using pretokenized text with sentences...")
-                tokdoc = Doc(nlp.vocab, words=request_tokens, spaces=request.spaces, sent_starts=request.sent_starts)
-                docs = list(nlp.pipe([tokdoc]))
-                logger.debug("Procesed pretokenized %d tokens into %d documents.", len(request.tokens), len(docs))
-            elif is_pretokenized:
-                logger.debug(" Using pretokenized text...")
-                tokdoc = Doc(nlp.vocab, words=request_tokens, spaces=request.spaces)
-                docs = list(nlp.pipe([tokdoc]))
-                logger.debug("Procesed pretokenized %d tokens into %d documents.", len(request.tokens), len(docs))
-            else:
-                logger.debug(" Using full text...")
-                docs = list(nlp.pipe(texts))
-                logger.debug("Procesed %d texts into %d documents.", len(texts), len(docs))
-
-            # Reset max length, if changed
-            if max_length_before is not None:
-                logger.info("Resetting spaCy max length to %d", max_length_before)
-                nlp.max_length = max_length_before
-
-            # Build a "annotation comment" annotation
-            # Can be used for each annotation
-            meta = AnnotationMeta(
-                    name=settings.annotator_name,
-                    version=settings.annotator_version,
-                    modelName=spacy_meta["name"],
-                    modelVersion=spacy_meta["version"],
-                    spacyVersion=spacy.__version__,
-                    modelLang=spacy_meta["lang"],
-                    modelSpacyVersion=spacy_meta["spacy_version"],
-                    modelSpacyGitVersion=spacy_meta["spacy_git_version"]
-                )
-
-            # What types to write?
-            if request.parameters is not None and "write_types" in request.parameters and len(request.parameters["write_types"]) > 0:
-                write_types = set(request.parameters["write_types"])
-                logger.info("Only writing types: %s", ", ".join(write_types))
-            else:
-                write_types = set(TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES)
-
-            # dont write tokens if pretokenized
-            if is_pretokenized:
-                write_types.discard(UIMA_TYPE_TOKEN)
-                if has_sentences:
-                    write_types.discard(UIMA_TYPE_SENTENCE)
-
-            # TODO test splitting in multiple texts
-            for doc_meta, doc in zip(texts_meta, docs):
-                # generate utf16 converter for each doc on the fly if using pretokenized data
-                if is_pretokenized:
-                    utf16_converter = Utf16CodepointOffsetConverter()
-                    utf16_converter.create_offset_mapping(doc.text)
-                    doc_meta["utf16_converter"] = utf16_converter
-
-                if "utf16_converter" in doc_meta:
-                    utf16_converter = doc_meta["utf16_converter"]
-                else:
-                    utf16_converter = None
-                    logger.warning("No utf16 converter found, this should not happen!")
-
-                def utf16_to_ext(idx):
-                    return utf16_converter.python_to_external(idx) if utf16_converter is not None else idx
-
-                # Get starting position of this sentence
-                doc_begin = doc_meta["begin"]
-
-                # Sentences
-                logger.debug("Writing Sentences...")
-                try:
-                    # Can fail, e.g. with multilang model
-                    # or if no sentencizer is requested
-                    # TODO add_pipe("sentencizer") seems to work, check later!
-                    for sent in doc.sents:
-                        sentences.append(Sentence(
-                            begin=utf16_to_ext(doc_begin+sent.start_char),
-                            end=utf16_to_ext(doc_begin+sent.end_char),
-                            write_sentence=UIMA_TYPE_SENTENCE in write_types,
-                        ))
-                except Exception as ex:
-                    logger.exception("Error accessing sentences: %s", ex)
-
-                # Token, Lemma, POS, Morphology
-                cas_tokens = {}
-                token_ind = 0
-                logger.debug("Writing Tokens...")
-                for token in doc:
-                    if not token.is_space:
-                        # Create begin/end
-                        token_begin = token.idx
-                        token_end = token_begin + len(token)
-
-                        # Extract specific morph features
-                        morph_details = {}
-                        for feat in token.morph:
-                            fields = feat.split("=")
-                            if len(fields) != 2:
-                                continue
-                            feat_key = fields[0].strip()
-                            feat_value = fields[1].strip()
-
-                            # TODO check in nlp.meta for missing
-                            if feat_key == "Gender":
-                                morph_details["gender"] = feat_value
-                            elif feat_key == "Number":
-                                morph_details["number"] = feat_value
-                            elif feat_key == "Case":
-                                morph_details["case"] = feat_value
-                            elif feat_key == "Degree":
-                                morph_details["degree"] = feat_value
-                            elif feat_key == "VerbForm":
-                                morph_details["verbForm"] = feat_value
-                            elif feat_key == "Tense":
-                                morph_details["tense"] = feat_value
-                            elif feat_key == "Mood":
-                                morph_details["mood"] = feat_value
-                            elif feat_key == "Voice":  # ?
-                                morph_details["voice"] = feat_value
-                            elif feat_key == "Definite":
-                                morph_details["definiteness"] = feat_value
-                            elif feat_key == "Person":
-                                morph_details["person"] = feat_value
-                            elif feat_key == "Aspect":  # ?
-                                morph_details["aspect"] = feat_value
-                            elif feat_key == "Animacy":  # ?
-                                morph_details["animacy"] = feat_value
-                            elif feat_key == "Negative":  # ?
-                                morph_details["negative"] = feat_value
-                            elif feat_key == "NumType":  # ?
-                                morph_details["numType"] = feat_value
-                            elif feat_key == "Possessive":  # ?
-                                morph_details["possessive"] = feat_value
-                            elif feat_key == "PronType":
-                                morph_details["pronType"] = feat_value
-                            elif feat_key == "Reflex":
-                                morph_details["reflex"] = feat_value
-                            elif feat_key == "Transitivity":  # ?
-                                morph_details["transitivity"] = feat_value
-
-                        # Create token data
-                        current_token = Token(
-                            begin=utf16_to_ext(doc_begin+token_begin),
-                            end=utf16_to_ext(doc_begin+token_end),
-
-                            # Token
-                            ind=token_ind,
-                            write_token=UIMA_TYPE_TOKEN in write_types,
-
-                            # Lemma
-                            lemma=token.lemma_,
-                            write_lemma=UIMA_TYPE_LEMMA in write_types,
-
-                            # POS
-                            # TODO pos mapping?
-                            pos=token.tag_,
-                            pos_coarse=token.pos_,
-                            write_pos=UIMA_TYPE_POS in write_types,
-
-                            # Morph
-                            morph="|".join(token.morph),
-                            morph_details=morph_details,
-                            write_morph=UIMA_TYPE_MORPH in write_types,
-
-                            # URL
-                            like_url=token.like_url,
-                            url_parts=parse_url(token.text) if token.like_url else None
-                        )
-                        tokens.append(current_token)
-                        token_ind += 1
-
-                        # Save token info for deps later
-                        if token_begin not in cas_tokens:
-                            cas_tokens[token_begin] = {}
-                        cas_tokens[token_begin][token_end] = current_token
-
-                # Dependency
-                # Note: This is only supported if tokens are written!
-                logger.debug("Writing Dependencies...")
-                for token in doc:
-                    if not token.is_space:
-                        if not token.head.is_space:
-                            # Get CAS token
-                            token_begin = token.idx
-                            token_end = token_begin + len(token)
-                            if token_begin in cas_tokens and token_end in cas_tokens[token_begin]:
-                                uima_token = cas_tokens[token_begin][token_end]
-                            else:
-                                continue
-
-                            # Get head token
-                            begin_head = token.head.idx
-                            end_head = begin_head + len(token.head)
-                            if begin_head in cas_tokens and end_head in cas_tokens[begin_head]:
-                                uima_head = cas_tokens[begin_head][end_head]
-                            else:
-                                continue
-
-                            # Create dependency
-                            current_dep = Dependency(
-                                begin=utf16_to_ext(doc_begin+token_begin),
-                                end=utf16_to_ext(doc_begin+token_end),
-                                type=token.dep_.upper(),
-                                flavor="basic",
-                                dependent_ind=uima_token.ind,
-                                governor_ind=uima_head.ind,
-                                write_dep=UIMA_TYPE_DEPENDENCY in write_types
-                            )
-                            dependencies.append(current_dep)
-
-                            # Add reference to token
-                            uima_token.parent_ind = uima_head.ind
-                            uima_token.write_dep = UIMA_TYPE_DEPENDENCY in write_types
-
-                # Named entities
-                logger.debug("Writing Named entities...")
-                try:
-                    for ent in doc.ents:
-                        entities.append(Entity(
-                            begin=utf16_to_ext(doc_begin+ent.start_char),
-                            end=utf16_to_ext(doc_begin+ent.end_char),
-                            value=ent.label_,
-                            write_entity=UIMA_TYPE_NAMED_ENTITY in write_types
-                        ))
-                except Exception as ex:
-                    logger.exception("Error accessing named entities: %s", ex)
-
-                # Add modification info
-                modification_meta_comment = f"{settings.annotator_name} ({settings.annotator_version}), spaCy ({spacy.__version__}), {spacy_meta['lang']} {spacy_meta['name']} ({spacy_meta['version']})"
-                modification_meta = DocumentModification(
-                    user=settings.annotator_name,
-                    timestamp=modification_timestamp_seconds,
-                    comment=modification_meta_comment
-                 )
-
-    except Exception as ex:
-        logger.exception(ex)
+            logger.debug("No sentences found")
+
+        # Token, Lemma, POS, Morphology, Dependency
+        # Note: Dependencies are only supported if tokens are written!
+        logger.debug("Writing Tokens and Dependencies...")
+        # Token indices continue over all docs of split texts
+        doc_tokens, doc_dependencies = extract_tokens(doc, doc_begin, utf16_converter, write_types, len(tokens))
+        tokens.extend(doc_tokens)
+        dependencies.extend(doc_dependencies)
+
+        # Named entities
+        logger.debug("Writing Named entities...")
+        try:
+            for ent in doc.ents:
+                entities.append(Entity(
+                    begin=utf16_to_ext(doc_begin+ent.start_char),
+                    end=utf16_to_ext(doc_begin+ent.end_char),
+                    value=ent.label_,
+                    write_entity=UIMA_TYPE_NAMED_ENTITY in write_types
+                ))
+        except Exception as ex:
+            logger.exception("Error accessing named entities: %s", ex)
+
+        # Add modification info
+        modification_meta = create_modification_meta(job)
 
     # Return data as JSON
     return TextImagerResponse(
@@ -975,5 +1355,167 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
         entities=entities,
         meta=meta,
         modification_meta=modification_meta,
-        is_pretokenized=is_pretokenized
+        is_pretokenized=job.is_pretokenized
+    )
+
+
+# Stream the annotations of the processed docs of a request as newline-delimited JSON,
+# only the annotations of the current sentence are kept in memory instead of the whole response
+def stream_response(job: ProcessJob, docs):
+    write_types = job.write_types
+
+    yield TextImagerStreamHeader(
+        meta=create_annotation_meta(job.spacy_meta) if len(job.inputs) > 0 else None,
+        modification_meta=create_modification_meta(job) if len(job.inputs) > 0 else None,
+        is_pretokenized=job.is_pretokenized
+    ).model_dump_json() + "\n"
+
+    try:
+        # Token indices continue over all docs of split texts
+        ind_offset = 0
+        for doc_meta, doc in zip(job.texts_meta, docs):
+            utf16_converter = get_utf16_converter(job, doc_meta, doc)
+
+            def utf16_to_ext(idx):
+                return utf16_converter.python_to_external(idx) if utf16_converter is not None else idx
+
+            doc_begin = doc_meta["begin"]
+            doc_tokens = DocTokens(doc, doc_begin, utf16_converter, write_types)
+
+            # Stream the whole doc at once if there are no sentences
+            has_sents = doc.has_annotation("SENT_START")
+            if not has_sents:
+                logger.warning("No sentences found, streaming the document at once")
+            sents = doc.sents if has_sents else [doc[:]]
+
+            try:
+                ents = doc.ents
+            except Exception as ex:
+                ents = ()
+                logger.exception("Error accessing named entities: %s", ex)
+
+            # Entities are added to the sentence they start in
+            ent_ind = 0
+            for sent in sents:
+                sentences = []
+                if has_sents:
+                    sentences.append(Sentence(
+                        begin=utf16_to_ext(doc_begin+sent.start_char),
+                        end=utf16_to_ext(doc_begin+sent.end_char),
+                        write_sentence=UIMA_TYPE_SENTENCE in write_types,
+                    ))
+
+                entities = []
+                while ent_ind < len(ents) and ents[ent_ind].start < sent.end:
+                    ent = ents[ent_ind]
+                    entities.append(Entity(
+                        begin=utf16_to_ext(doc_begin+ent.start_char),
+                        end=utf16_to_ext(doc_begin+ent.end_char),
+                        value=ent.label_,
+                        write_entity=UIMA_TYPE_NAMED_ENTITY in write_types
+                    ))
+                    ent_ind += 1
+
+                tokens, dependencies = doc_tokens.extract(sent.start, sent.end, ind_offset)
+
+                yield TextImagerStreamChunk(
+                    sentences=sentences,
+                    tokens=tokens,
+                    dependencies=dependencies,
+                    entities=entities
+                ).model_dump_json() + "\n"
+
+            ind_offset += doc_tokens.count
+    except Exception as ex:
+        # The response is already started, the client notices the broken stream
+        logger.exception(ex)
+        raise
+
+
+# Empty response if processing failed
+def create_error_response(job: Optional[ProcessJob]) -> TextImagerResponse:
+    return TextImagerResponse(
+        sentences=[],
+        tokens=[],
+        dependencies=[],
+        entities=[],
+        is_pretokenized=job.is_pretokenized if job is not None else False
     )
+
+
+# Process request from DUUI
+@app.post("/v1/process")
+def post_process(request: TextImagerRequest) -> TextImagerResponse:
+    job = None
+    try:
+        job = prepare_job(request)
+
+        # Stream sentence by sentence for large documents, if requested
+        stream = (str(request.parameters["stream"]).lower() != "false") if ("stream" in request.parameters) else False
+
+        docs = []
+        if len(job.inputs) > 0:
+            split_processes = get_split_processes(job.nlp) if len(job.inputs) > 1 else 1
+            if split_processes > 1:
+                docs = pipe_inputs(job.nlp, job.inputs, job.disabled_components, split_processes, settings.split_batch_size)
+            else:
+                docs = pipe_inputs(job.nlp, job.inputs, job.disabled_components)
+
+        if stream:
+            # The docs are processed while streaming, only the current doc is kept in memory
+            logger.info("Streaming response")
+            return StreamingResponse(stream_response(job, docs), media_type="application/x-ndjson")
+
+        return create_response(job, list(docs))
+    except Exception as ex:
+        logger.exception(ex)
+
+    return create_error_response(job)
+
+
+# Process multiple requests at once, documents using the same model and components are processed in one pipe
+@app.post("/v1/process_batch")
+def post_process_batch(requests: List[TextImagerRequest]) -> List[TextImagerResponse]:
+    logger.info("Received batch of %d requests", len(requests))
+
+    jobs = []
+    for request in requests:
+        try:
+            jobs.append(prepare_job(request))
+        except Exception as ex:
+            logger.exception(ex)
+            jobs.append(None)
+
+    # Group by model and disabled components, keeping the order of the requests
+    job_groups = {}
+    for job in jobs:
+        if job is not None and len(job.inputs) > 0:
+            job_groups.setdefault((id(job.nlp), tuple(job.disabled_components)), []).append(job)
+
+    # Process each group in one pipe and split the docs back to the requests
+    job_docs = {}
+    for group in job_groups.values():
+        inputs = [text for job in group for text in job.inputs]
+        logger.info("Processing %d inputs of %d requests in one batch", len(inputs), len(group))
+        try:
+            docs = process_inputs(group[0].nlp, inputs, group[0].disabled_components, batch_size=settings.process_batch_size)
+        except Exception as ex:
+            logger.exception(ex)
+            continue
+
+        docs_begin = 0
+        for job in group:
+            job_docs[id(job)] = docs[docs_begin:docs_begin+len(job.inputs)]
+            docs_begin += len(job.inputs)
+
+    responses = []
+    for job in jobs:
+        response = None
+        if job is not None and (len(job.inputs) == 0 or id(job) in job_docs):
+            try:
+                response = create_response(job, job_docs.get(id(job), []))
+            except Exception as ex:
+                logger.exception(ex)
+        responses.append(response if response is not None else create_error_response(job))
+
+    return responses
@@ -17,6 +17,8 @@ import org.texttechnologylab.type.id.URL;
 
 import java.io.ByteArrayOutputStream;
 import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.List;
 
 import static org.junit.jupiter.api.Assertions.assertArrayEquals;
 
@@ -172,4 +174,49 @@ public class SpaCySingleTest {
             System.out.println(url.getBegin() + " " + url.getEnd() + " " + url.getCoveredText());
         }
     }
+
+    private String[] runAnnotations(String text, boolean stream) throws Exception {
+        DUUIComposer composer = new DUUIComposer()
+                .withLuaContext(new DUUILuaContext().withJsonLibrary())
+                .withSkipVerification(true);
+
+        DUUIRemoteDriver remote_driver = new DUUIRemoteDriver(10000);
+        composer.addDriver(remote_driver);
+
+        composer.add(
+                new DUUIRemoteDriver.Component("http://127.0.0.1:9714")
+                        .withParameter("stream", String.valueOf(stream))
+        );
+
+        JCas cas = JCasFactory.createJCas();
+        cas.setDocumentText(text);
+        cas.setDocumentLanguage("de");
+        composer.run(cas);
+        composer.shutdown();
+
+        List<String> annotations = new ArrayList<>();
+        for (Sentence sentence : JCasUtil.select(cas, Sentence.class)) {
+            annotations.add("sentence " + sentence.getBegin() + " " + sentence.getEnd());
+        }
+        for (Token token : JCasUtil.select(cas, Token.class)) {
+            annotations.add("token " + token.getBegin() + " " + token.getEnd() + " " + token.getPosValue() + " " + token.getLemmaValue());
+        }
+        for (Dependency dep : JCasUtil.select(cas, Dependency.class)) {
+            annotations.add("dependency " + dep.getDependencyType() + " " + dep.getGovernor().getBegin() + " " + dep.getDependent().getBegin());
+        }
+        for (NamedEntity ent : JCasUtil.select(cas, NamedEntity.class)) {
+            annotations.add("entity " + ent.getBegin() + " " + ent.getEnd() + " " + ent.getValue());
+        }
+        return annotations.toArray(new String[0]);
+    }
+
+    @Test
+    public void streamTestDe() throws Exception {
+        String text = "Das ist ein IPhone von Apple. Und das ist ein iMac aus Cupertino.";
+
+        String[] expected = runAnnotations(text, false);
+        String[] actual = runAnnotations(text, true);
+
+        assertArrayEquals(expected, actual);
+    }
 }
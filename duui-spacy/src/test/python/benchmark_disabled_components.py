@@ -0,0 +1,43 @@
+"""
+Throughput of token-only requests with all components running compared to the components disabled by
+"get_disabled_components", using a randomly initialised tok2vec/tagger/parser/ner pipeline.
+
+Run from the component root: python src/test/python/benchmark_disabled_components.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_pipeline, import_service
+
+TEXTS = 2000
+
+WORDS = ["Anna", "likes", "cats", "and", "Bob", "visited", "Berlin", "in", "the", "summer", "with", "friends"]
+
+
+def main():
+    random.seed(0)
+    texts = [
+        " ".join(random.choice(WORDS) for _ in range(random.randint(20, 60))) + "."
+        for _ in range(TEXTS)
+    ]
+    tokens = sum(len(text.split()) + 1 for text in texts)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+        service = import_service(model_dir)
+        nlp, _ = service.load_spacy_model(service.settings.single_model, "en", None)
+
+        for name, write_types in [("all types", service.VARIANT_SETTINGS[""]), ("token only", [service.UIMA_TYPE_TOKEN])]:
+            disabled_components = service.get_disabled_components(nlp, set(write_types))
+            start = perf_counter()
+            service.process_inputs(nlp, texts, disabled_components)
+            duration = perf_counter() - start
+            print(f"{name}: disabled {disabled_components}, {duration:.2f} s, {tokens / duration:.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
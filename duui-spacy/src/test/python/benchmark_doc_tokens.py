@@ -0,0 +1,65 @@
+"""
+Tokens/sec of the per-token legacy extraction compared to "extract_tokens" on a large doc with hand-set
+tags, lemmas, morphology and dependencies.
+
+Run from the component root: python src/test/python/benchmark_doc_tokens.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import spacy
+from spacy.tokens import Doc
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_pipeline, import_service
+from legacy_extraction import legacy_extract_tokens
+
+TOKENS = 200000
+SENTENCE_LENGTH = 20
+
+VOCAB = [
+    ("Die", "ART", "DET", "der", "Case=Nom|Definite=Def|Gender=Fem|Number=Sing|PronType=Art"),
+    ("Katze", "NN", "NOUN", "Katze", "Case=Nom|Gender=Fem|Number=Sing"),
+    ("schläft", "VVFIN", "VERB", "schlafen", "Mood=Ind|Number=Sing|Person=3|Tense=Pres|VerbForm=Fin"),
+    ("heute", "ADV", "ADV", "heute", ""),
+    ("in", "APPR", "ADP", "in", ""),
+    ("Berlin", "NE", "PROPN", "Berlin", "Case=Dat|Gender=Neut|Number=Sing"),
+    ("www.example.org", "XY", "X", "www.example.org", ""),
+]
+
+
+def main():
+    random.seed(0)
+    entries = [random.choice(VOCAB) for _ in range(TOKENS)]
+    # every sentence is attached to its first token
+    heads = [i - i % SENTENCE_LENGTH for i in range(TOKENS)]
+    doc = Doc(
+        spacy.blank("de").vocab,
+        words=[e[0] for e in entries], tags=[e[1] for e in entries], pos=[e[2] for e in entries],
+        lemmas=[e[3] for e in entries], morphs=[e[4] for e in entries],
+        heads=heads, deps=["ROOT" if i == h else "mo" for i, h in enumerate(heads)]
+    )
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+        service = import_service(model_dir)
+        write_types = service.TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES
+
+        start = perf_counter()
+        legacy_extract_tokens(service, doc, 0, service.Utf16OffsetConverter(doc.text).python_to_external, write_types)
+        legacy_duration = perf_counter() - start
+
+        start = perf_counter()
+        service.extract_tokens(doc, 0, service.Utf16OffsetConverter(doc.text), write_types)
+        duration = perf_counter() - start
+
+    print(f"{TOKENS} tokens")
+    print(f"legacy:         {legacy_duration:.2f} s, {TOKENS / legacy_duration:.0f} tokens/s")
+    print(f"extract_tokens: {duration:.2f} s, {TOKENS / duration:.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
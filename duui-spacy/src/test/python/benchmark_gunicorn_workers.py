@@ -0,0 +1,90 @@
+"""
+Throughput of the service started with gunicorn.conf.py and 1, 2 and 4 workers, with 8 concurrent clients sending
+documents of 200 characters, and the total RSS and PSS of the master and worker processes after the load.
+PSS counts the model pages shared copy-on-write between the workers only once.
+
+Run from the component root: python src/test/python/benchmark_gunicorn_workers.py
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_pipeline, free_port, gunicorn_workers, start_gunicorn
+
+WORKERS = [1, 2, 4]
+CLIENTS = 8
+DOCUMENTS = 2000
+DOCUMENT_LENGTH = 200
+
+WORDS = ["Anna", "likes", "cats", "and", "Bob", "visited", "Berlin", "in", "the", "summer", "with", "friends"]
+
+
+def synthetic_document():
+    text = ""
+    while len(text) < DOCUMENT_LENGTH:
+        text += " ".join(random.choice(WORDS) for _ in range(random.randint(5, 12))) + ". "
+    return text[:DOCUMENT_LENGTH]
+
+
+def post(port, document):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/v1/process",
+        data=json.dumps({"text": document, "lang": "en"}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=300) as response:
+        assert response.status == 200
+        response.read()
+
+
+def memory_mb(pid):
+    # RSS and PSS in MB, from the kernel's summary of the memory mappings
+    memory = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("Rss", "Pss"):
+                memory[key] = int(value.split()[0]) / 1024
+    return memory["Rss"], memory["Pss"]
+
+
+def main():
+    random.seed(0)
+    documents = [synthetic_document() for _ in range(DOCUMENTS)]
+    print(f"{len(os.sched_getaffinity(0))} cores available")
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+
+        for workers in WORKERS:
+            port = free_port()
+            process = start_gunicorn(model_dir, workers, port)
+            try:
+                with ThreadPoolExecutor(CLIENTS) as executor:
+                    # warm up all workers
+                    list(executor.map(lambda document: post(port, document), documents[:CLIENTS * workers]))
+
+                    start = perf_counter()
+                    list(executor.map(lambda document: post(port, document), documents))
+                    duration = perf_counter() - start
+
+                pids = [process.pid] + gunicorn_workers(process.pid)
+                rss, pss = map(sum, zip(*(memory_mb(pid) for pid in pids)))
+                print(
+                    f"{workers} workers: {duration:.2f} s, {DOCUMENTS / duration:.0f} docs/s, "
+                    f"RSS {rss:.0f} MB, PSS {pss:.0f} MB"
+                )
+            finally:
+                process.terminate()
+                process.wait(timeout=60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Load test of 10k documents of 200 characters, sent one by one to "/v1/process" compared to batches sent to
+"/v1/process_batch", through the FastAPI test client, using a randomly initialised tok2vec/tagger/parser/ner
+pipeline.
+
+Run from the component root: python src/test/python/benchmark_process_batch.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_pipeline, import_service
+
+DOCUMENTS = 10000
+DOCUMENT_LENGTH = 200
+BATCH_SIZES = [100, 1000]
+
+WORDS = ["Anna", "likes", "cats", "and", "Bob", "visited", "Berlin", "in", "the", "summer", "with", "friends"]
+
+
+def synthetic_document():
+    text = ""
+    while len(text) < DOCUMENT_LENGTH:
+        text += " ".join(random.choice(WORDS) for _ in range(random.randint(5, 12))) + ". "
+    return text[:DOCUMENT_LENGTH]
+
+
+def main():
+    random.seed(0)
+    requests = [{"text": synthetic_document(), "lang": "en"} for _ in range(DOCUMENTS)]
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+        service = import_service(model_dir)
+        client = TestClient(service.app)
+        # load the model before measuring
+        client.post("/v1/process", json=requests[0])
+
+        start = perf_counter()
+        for request in requests:
+            assert client.post("/v1/process", json=request).status_code == 200
+        duration = perf_counter() - start
+        print(f"/v1/process: {duration:.2f} s, {DOCUMENTS / duration:.0f} docs/s")
+
+        for batch_size in BATCH_SIZES:
+            start = perf_counter()
+            for i in range(0, DOCUMENTS, batch_size):
+                assert client.post("/v1/process_batch", json=requests[i:i+batch_size]).status_code == 200
+            duration = perf_counter() - start
+            print(f"/v1/process_batch, {batch_size} per request: {duration:.2f} s, {DOCUMENTS / duration:.0f} docs/s")
+
+
+if __name__ == "__main__":
+    main()
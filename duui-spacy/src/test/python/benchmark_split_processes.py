@@ -0,0 +1,55 @@
+"""
+Throughput of a multi-megabyte synthetic text split into sentences and processed with an increasing number
+of forked processes, using a randomly initialised tok2vec/tagger/parser/ner pipeline.
+
+Run from the component root: python src/test/python/benchmark_split_processes.py
+"""
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_pipeline, import_service
+
+TEXT_MB = 2
+PROCESSES = [1, 2, 4]
+BATCH_SIZE = 32
+
+WORDS = ["Anna", "likes", "cats", "and", "Bob", "visited", "Berlin", "in", "the", "summer", "with", "friends"]
+
+
+def synthetic_text(size):
+    random.seed(0)
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = " ".join(random.choice(WORDS) for _ in range(random.randint(5, 25))) + "."
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+        service = import_service(model_dir)
+        nlp, _ = service.load_spacy_model(service.settings.single_model, "en", None)
+
+        text = synthetic_text(TEXT_MB * 1024 * 1024)
+        nlp_sents, _ = service.load_spacy_sentencizer_model("en")
+        nlp_sents.max_length = len(text) + 100
+        texts = [sent.text for sent in nlp_sents(text).sents]
+        print(f"{len(text)} characters, {len(texts)} split texts, {os.cpu_count()} cores")
+
+        for n_process in PROCESSES:
+            start = perf_counter()
+            docs = service.process_inputs(nlp, texts, [], n_process=n_process, batch_size=BATCH_SIZE)
+            duration = perf_counter() - start
+            print(f"{n_process} processes: {duration:.2f} s, {len(docs) / duration:.0f} texts/s")
+
+
+if __name__ == "__main__":
+    main()
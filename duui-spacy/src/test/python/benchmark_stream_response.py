@@ -0,0 +1,83 @@
+"""
+Peak RSS of the gunicorn worker while processing a 20 MB synthetic text and returning the regular response
+compared to streaming the response sentence by sentence, using a randomly initialised tok2vec/tagger/parser/ner
+pipeline. The text is split into sentences like texts larger than the model's length limit are in production.
+Each mode runs in a new worker, the client reads the response in blocks without keeping it.
+
+Run from the component root: python src/test/python/benchmark_stream_response.py [text MB] [regular|streamed ...]
+"""
+import json
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from benchmark_split_processes import synthetic_text
+from conftest import build_test_pipeline, free_port, gunicorn_workers, start_gunicorn
+
+TEXT_MB = 20
+MODES = ["regular", "streamed"]
+BLOCK_SIZE = 1024 * 1024
+
+
+def post(port, text, stream):
+    parameters = {"split_large_texts": "true", "force_split_text": "true"}
+    if stream:
+        parameters["stream"] = "true"
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/v1/process",
+        data=json.dumps({"text": text, "lang": "en", "parameters": parameters}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    size = 0
+    with urllib.request.urlopen(request, timeout=3600) as response:
+        assert response.status == 200
+        while block := response.read(BLOCK_SIZE):
+            size += len(block)
+    return size
+
+
+def peak_rss_mb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+
+
+def main():
+    text_mb = float(sys.argv[1]) if len(sys.argv) > 1 else TEXT_MB
+    modes = sys.argv[2:] or MODES
+    text = synthetic_text(int(text_mb * 1024 * 1024))
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+
+        for mode in modes:
+            stream = mode == "streamed"
+            port = free_port()
+            process = start_gunicorn(model_dir, 1, port)
+            try:
+                worker = gunicorn_workers(process.pid)[0]
+                # load the model before measuring
+                post(port, "Anna likes cats.", stream)
+                rss_before = peak_rss_mb(worker)
+
+                start = perf_counter()
+                size = post(port, text, stream)
+                duration = perf_counter() - start
+
+                rss = peak_rss_mb(worker)
+                print(
+                    f"{mode}: {len(text) / 1024 / 1024:.0f} MB text, {duration:.0f} s, "
+                    f"response {size / 1024 / 1024:.0f} MB, peak RSS {rss:.0f} MB (+{rss - rss_before:.0f} MB)",
+                    flush=True
+                )
+            finally:
+                process.terminate()
+                process.wait(timeout=60)
+
+
+if __name__ == "__main__":
+    main()
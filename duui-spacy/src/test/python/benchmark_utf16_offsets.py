@@ -0,0 +1,72 @@
+"""
+Time to build the offset converter of a text and convert the begin/end offsets of all tokens, with the
+cassis converter used before compared to "Utf16OffsetConverter", for a BMP-only text and a text with emojis.
+
+Run from the component root: python src/test/python/benchmark_utf16_offsets.py
+"""
+import random
+import re
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from cassis.cas import Utf16CodepointOffsetConverter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import build_test_pipeline, import_service
+
+TEXT_MB = 5
+
+WORDS = ["Grüße", "aus", "Köln", "und", "Berlin", "heute", "war", "ein", "schöner", "Tag", "."]
+
+
+def synthetic_text(size, astral):
+    random.seed(0)
+    words = WORDS + ["\U0001F600", "\U0001F408"] if astral else WORDS
+    text = []
+    length = 0
+    while length < size:
+        word = random.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return " ".join(text)
+
+
+def run_cassis(text, begins, ends):
+    converter = Utf16CodepointOffsetConverter()
+    converter.create_offset_mapping(text)
+    return [converter.python_to_external(i) for i in begins], [converter.python_to_external(i) for i in ends]
+
+
+def run_service(service, text, begins, ends):
+    converter = service.Utf16OffsetConverter(text)
+    return converter.python_to_external_array(np.array(begins)).tolist(), converter.python_to_external_array(np.array(ends)).tolist()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as model_dir:
+        build_test_pipeline().to_disk(model_dir)
+        service = import_service(model_dir)
+
+        for name, astral in [("BMP only", False), ("with emojis", True)]:
+            text = synthetic_text(TEXT_MB * 1024 * 1024, astral)
+            spans = [m.span() for m in re.finditer(r"\S+", text)]
+            begins = [b for b, _ in spans]
+            ends = [e for _, e in spans]
+
+            start = perf_counter()
+            expected = run_cassis(text, begins, ends)
+            cassis_duration = perf_counter() - start
+
+            start = perf_counter()
+            actual = run_service(service, text, begins, ends)
+            duration = perf_counter() - start
+
+            assert actual == expected
+            print(f"{name}: {len(text)} characters, {len(spans)} tokens, cassis {cassis_duration:.2f} s, Utf16OffsetConverter {duration:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
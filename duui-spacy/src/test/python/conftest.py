@@ -0,0 +1,133 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+# the service is started from its source directory, the typesystem and Lua script are loaded relative to it
+SERVICE_DIR = Path(__file__).parents[2] / "main" / "python"
+sys.path.insert(0, str(SERVICE_DIR))
+
+TRAIN_SENTENCES = [
+    (["Anna", "likes", "cats", "."], ["NNP", "VBZ", "NNS", "."], [1, 1, 1, 1], ["nsubj", "ROOT", "dobj", "punct"], ["U-PER", "O", "O", "O"]),
+    (["Bob", "visited", "Berlin", "."], ["NNP", "VBD", "NNP", "."], [1, 1, 1, 1], ["nsubj", "ROOT", "dobj", "punct"], ["U-PER", "O", "U-LOC", "O"]),
+]
+
+
+def build_test_pipeline(lang="en"):
+    """
+    Randomly initialised pipeline with the components of the spaCy core models, no download needed.
+    """
+    import spacy
+    from spacy.training import Example
+
+    nlp = spacy.blank(lang)
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("tagger")
+    nlp.add_pipe("parser")
+    nlp.add_pipe("ner")
+
+    examples = [
+        Example.from_dict(nlp.make_doc(" ".join(words)), {"tags": tags, "heads": heads, "deps": deps, "entities": ents})
+        for words, tags, heads, deps, ents in TRAIN_SENTENCES
+    ]
+    nlp.initialize(lambda: examples)
+    return nlp
+
+
+def service_env(model_dir, **env):
+    """
+    Environment of the service in single model mode with the given model directory.
+    """
+    return {
+        "TEXTIMAGER_SPACY_VARIANT": "",
+        "TEXTIMAGER_SPACY_ANNOTATOR_NAME": "test",
+        "TEXTIMAGER_SPACY_ANNOTATOR_VERSION": "test",
+        "TEXTIMAGER_SPACY_LOG_LEVEL": "WARNING",
+        "TEXTIMAGER_SPACY_MODEL_CACHE_SIZE": "3",
+        "TEXTIMAGER_SPACY_SINGLE_MODEL": str(model_dir),
+        "TEXTIMAGER_SPACY_SINGLE_MODEL_LANG": "en",
+        **env,
+    }
+
+
+def import_service(model_dir, **env):
+    """
+    Import the service in single model mode with the given model directory, settings are read once on import.
+    """
+    os.environ.update(service_env(model_dir, **env))
+    cwd = os.getcwd()
+    os.chdir(SERVICE_DIR)
+    try:
+        return import_module("textimager_duui_spacy")
+    finally:
+        os.chdir(cwd)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_gunicorn(model_dir, workers, port, timeout=120, **env):
+    """
+    Start the service with gunicorn.conf.py and the given number of workers, like the Docker image, and wait until
+    all workers answer.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "textimager_duui_spacy:app", "--config", "gunicorn.conf.py",
+         "--workers", str(workers), "--bind", f"127.0.0.1:{port}"],
+        cwd=SERVICE_DIR, env={**os.environ, **service_env(model_dir, **env)},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while len(gunicorn_workers(process.pid)) < workers or not server_ready(port):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError(f"gunicorn did not start with {workers} workers")
+        time.sleep(0.2)
+    return process
+
+
+def gunicorn_workers(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except FileNotFoundError:
+        return []
+
+
+def server_ready(port):
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/v1/documentation", timeout=5) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+@pytest.fixture(scope="session")
+def model_dir(tmp_path_factory):
+    pytest.importorskip("spacy")
+    model_dir = tmp_path_factory.mktemp("spacy-model")
+    build_test_pipeline().to_disk(model_dir)
+    return model_dir
+
+
+@pytest.fixture(scope="session")
+def service(model_dir):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("cassis")
+    return import_service(model_dir)
+
+
+@pytest.fixture(scope="session")
+def nlp(service):
+    nlp, nlp_err = service.load_spacy_model(service.settings.single_model, "en", service.get_enabled_tools(""))
+    assert nlp is not None, nlp_err
+    return nlp
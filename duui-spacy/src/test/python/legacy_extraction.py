@@ -0,0 +1,75 @@
+# Per-token extraction of tokens and dependencies as done by the service before "DocTokens",
+# kept as reference for the parity test and the benchmark
+
+
+def legacy_extract_tokens(service, doc, doc_begin, utf16_to_ext, write_types):
+    tokens = []
+    dependencies = []
+
+    # Token, Lemma, POS, Morphology
+    cas_tokens = {}
+    token_ind = 0
+    for token in doc:
+        if not token.is_space:
+            token_begin = token.idx
+            token_end = token_begin + len(token)
+
+            morph_details = {}
+            for feat in token.morph:
+                fields = feat.split("=")
+                if len(fields) != 2:
+                    continue
+                feat_key = fields[0].strip()
+                if feat_key in service.MORPH_FEATURES:
+                    morph_details[service.MORPH_FEATURES[feat_key]] = fields[1].strip()
+
+            current_token = service.Token(
+                begin=utf16_to_ext(doc_begin+token_begin),
+                end=utf16_to_ext(doc_begin+token_end),
+                ind=token_ind,
+                write_token=service.UIMA_TYPE_TOKEN in write_types,
+                lemma=token.lemma_,
+                write_lemma=service.UIMA_TYPE_LEMMA in write_types,
+                pos=token.tag_,
+                pos_coarse=token.pos_,
+                write_pos=service.UIMA_TYPE_POS in write_types,
+                morph="|".join(token.morph),
+                morph_details=morph_details,
+                write_morph=service.UIMA_TYPE_MORPH in write_types,
+                like_url=token.like_url,
+                url_parts=service.parse_url(token.text) if token.like_url else None
+            )
+            tokens.append(current_token)
+            token_ind += 1
+
+            cas_tokens.setdefault(token_begin, {})[token_end] = current_token
+
+    # Dependency
+    for token in doc:
+        if not token.is_space and not token.head.is_space:
+            token_begin = token.idx
+            token_end = token_begin + len(token)
+            uima_token = cas_tokens.get(token_begin, {}).get(token_end)
+            if uima_token is None:
+                continue
+
+            begin_head = token.head.idx
+            end_head = begin_head + len(token.head)
+            uima_head = cas_tokens.get(begin_head, {}).get(end_head)
+            if uima_head is None:
+                continue
+
+            dependencies.append(service.Dependency(
+                begin=utf16_to_ext(doc_begin+token_begin),
+                end=utf16_to_ext(doc_begin+token_end),
+                type=token.dep_.upper(),
+                flavor="basic",
+                dependent_ind=uima_token.ind,
+                governor_ind=uima_head.ind,
+                write_dep=service.UIMA_TYPE_DEPENDENCY in write_types
+            ))
+
+            uima_token.parent_ind = uima_head.ind
+            uima_token.write_dep = service.UIMA_TYPE_DEPENDENCY in write_types
+
+    return tokens, dependencies
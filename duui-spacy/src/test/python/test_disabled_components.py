@@ -0,0 +1,54 @@
+import logging
+from types import SimpleNamespace
+
+CORE_PIPE = ["tok2vec", "tagger", "morphologizer", "parser", "attribute_ruler", "lemmatizer", "ner"]
+TRF_PIPE = ["transformer", "tagger", "parser", "ner"]
+
+
+def disabled(service, pipe_names, *write_types):
+    return set(service.get_disabled_components(SimpleNamespace(pipe_names=pipe_names), set(write_types)))
+
+
+def test_token_only_disables_all_components(service):
+    assert disabled(service, CORE_PIPE, service.UIMA_TYPE_TOKEN) == set(CORE_PIPE)
+    assert disabled(service, TRF_PIPE, service.UIMA_TYPE_TOKEN) == set(TRF_PIPE)
+
+
+def test_all_types_disable_nothing(service):
+    assert disabled(service, CORE_PIPE, *service.VARIANT_SETTINGS[""]) == set()
+
+
+def test_write_types_keep_their_components(service):
+    assert disabled(service, CORE_PIPE, service.UIMA_TYPE_TOKEN, service.UIMA_TYPE_SENTENCE) == \
+        {"tagger", "morphologizer", "attribute_ruler", "lemmatizer", "ner"}
+    assert disabled(service, CORE_PIPE, service.UIMA_TYPE_POS) == {"parser", "lemmatizer", "ner"}
+    assert disabled(service, CORE_PIPE, service.UIMA_TYPE_LEMMA) == {"parser", "ner"}
+    assert disabled(service, CORE_PIPE, service.UIMA_TYPE_NAMED_ENTITY) == \
+        {"tagger", "morphologizer", "parser", "attribute_ruler", "lemmatizer"}
+    assert disabled(service, TRF_PIPE, service.UIMA_TYPE_DEPENDENCY) == {"tagger", "ner"}
+
+
+def test_unknown_components_always_run(service):
+    assert disabled(service, ["tok2vec", "my_component", "ner"], service.UIMA_TYPE_TOKEN) == {"ner"}
+    assert disabled(service, ["sentencizer", "ner"], service.UIMA_TYPE_SENTENCE) == {"ner"}
+
+
+def test_disabled_components_are_skipped(service, nlp):
+    disabled_components = service.get_disabled_components(nlp, {service.UIMA_TYPE_TOKEN})
+    doc = service.process_inputs(nlp, ["Anna likes cats ."], disabled_components)[0]
+
+    assert [t.text for t in doc] == ["Anna", "likes", "cats", "."]
+    assert not doc.has_annotation("TAG")
+    assert not doc.has_annotation("DEP")
+
+
+def test_token_only_request_logs_no_sentence_errors(service, caplog):
+    from fastapi.testclient import TestClient
+
+    request = {"text": "Anna likes cats. Bob visited Berlin.", "lang": "en", "parameters": {"write_types": service.UIMA_TYPE_TOKEN}}
+    response = TestClient(service.app).post("/v1/process", json=request)
+
+    assert response.status_code == 200
+    assert response.json()["sentences"] == []
+    assert len(response.json()["tokens"]) == 8
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+
+def cache_size(cache_dir):
+    return sum(entry.stat().st_size for entry in os.scandir(cache_dir) if entry.name.endswith(".spacy"))
+
+
+def put_docs(cache, nlp, texts, mtime_start=0):
+    # set increasing modification times, the LRU order does not depend on the file system time resolution
+    keys = []
+    for i, text in enumerate(texts):
+        key = cache.key(nlp.meta, nlp.pipe_names, text)
+        cache.put(key, nlp.make_doc(text))
+        os.utime(cache._filename(key), (mtime_start + i, mtime_start + i))
+        keys.append(key)
+    return keys
+
+
+@pytest.fixture
+def doc_size(service, nlp, tmp_path_factory):
+    cache = service.DocCache(str(tmp_path_factory.mktemp("doc-size")), 1024 * 1024)
+    put_docs(cache, nlp, ["Text number 0 about Anna and Berlin ."])
+    return cache_size(cache.cache_dir)
+
+
+def test_cache_roundtrip(service, nlp, tmp_path):
+    cache = service.DocCache(str(tmp_path), 1024 * 1024)
+    doc = service.process_inputs(nlp, ["Anna likes cats ."], [])[0]
+    key = cache.key(nlp.meta, nlp.pipe_names, doc.text)
+
+    assert cache.get(key, nlp.vocab) is None
+    cache.put(key, doc)
+    cached_doc = cache.get(key, nlp.vocab)
+
+    assert [(t.text, t.tag_, t.dep_, t.head.i) for t in cached_doc] == [(t.text, t.tag_, t.dep_, t.head.i) for t in doc]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_existing_files_are_evicted_after_writes(service, nlp, tmp_path, doc_size):
+    keys = put_docs(service.DocCache(str(tmp_path), 1024 * 1024), nlp, [f"Text number {i} about Anna and Berlin ." for i in range(3)])
+
+    # the directory is not scanned on startup, e.g. in the master process before forking the workers
+    cache = service.DocCache(str(tmp_path), doc_size * 2 + doc_size // 2)
+    assert len(os.listdir(tmp_path)) == 3
+
+    keys += put_docs(cache, nlp, ["Text number 3 about Anna and Berlin ."], mtime_start=10)
+    assert cache_size(tmp_path) <= cache.max_bytes
+    assert [cache.get(key, nlp.vocab) is not None for key in keys] == [False, False, True, True]
+
+
+def test_least_recently_used_docs_are_evicted(service, nlp, tmp_path, doc_size):
+    cache = service.DocCache(str(tmp_path), doc_size * 6 + doc_size // 2)
+    keys = put_docs(cache, nlp, [f"Text number {i} about Anna and Berlin ." for i in range(5)])
+
+    # use the first doc again, it is the newest now
+    os.utime(cache._filename(keys[0]), (100, 100))
+    put_docs(cache, nlp, ["Text number 5 about Anna and Berlin ."], mtime_start=200)
+
+    assert cache_size(tmp_path) <= cache.max_bytes
+    assert cache.get(keys[0], nlp.vocab) is not None
+    assert cache.get(keys[1], nlp.vocab) is None
+
+
+def test_workers_share_the_size_limit(service, nlp, tmp_path, doc_size):
+    # two workers of the same service, forked with the same settings
+    max_bytes = doc_size * 20
+    workers = [service.DocCache(str(tmp_path), max_bytes), service.DocCache(str(tmp_path), max_bytes)]
+    # each worker writes up to the scan fraction of the limit before scanning the directory again
+    max_bytes_workers = max_bytes + (len(workers) - 1) * service.DocCache.SCAN_FRACTION * max_bytes
+
+    keys = []
+    for i in range(100):
+        keys += put_docs(workers[i % 2], nlp, [f"Text number {i} about Anna and Berlin ."], mtime_start=i)
+        assert cache_size(tmp_path) <= max_bytes_workers
+
+    # the newest docs are available to both workers, independent of the writing worker
+    for worker in workers:
+        assert worker.get(keys[-1], nlp.vocab) is not None
+        assert worker.get(keys[-2], nlp.vocab) is not None
+        assert worker.get(keys[0], nlp.vocab) is None
+
+
+def test_broken_file_is_removed(service, nlp, tmp_path):
+    cache = service.DocCache(str(tmp_path), 1024 * 1024)
+    key = put_docs(cache, nlp, ["Anna likes cats ."])[0]
+    with open(cache._filename(key), "wb") as f:
+        f.write(b"broken")
+
+    assert cache.get(key, nlp.vocab) is None
+    assert not os.path.exists(cache._filename(key))
@@ -0,0 +1,67 @@
+import pytest
+
+from legacy_extraction import legacy_extract_tokens
+
+spacy = pytest.importorskip("spacy")
+cassis = pytest.importorskip("cassis")
+from spacy.tokens import Doc
+
+WORDS = ["Anna", "liebt", "\U0001F408", "Katzen", "  ", "auf", "https://example.org/katzen?x=1", ".", "Bob", "auch", "\n", "!"]
+SPACES = [True, True, True, False, False, True, False, True, True, False, False, False]
+TAGS = ["NE", "VVFIN", "XY", "NN", "_SP", "APPR", "XY", "$.", "NE", "ADV", "_SP", "$."]
+POS = ["PROPN", "VERB", "SYM", "NOUN", "SPACE", "ADP", "X", "PUNCT", "PROPN", "ADV", "SPACE", "PUNCT"]
+LEMMAS = ["Anna", "lieben", "\U0001F408", "Katze", "  ", "auf", "https://example.org/katzen?x=1", "--", "Bob", "auch", "\n", "--"]
+MORPHS = [
+    "Case=Nom|Gender=Fem|Number=Sing", "Mood=Ind|Number=Sing|Person=3|Tense=Pres|VerbForm=Fin", "", "Case=Acc|Gender=Fem|Number=Plur",
+    "", "", "Foo=Bar", "", "Case=Nom|Number=Sing", "Degree=Pos", "", "",
+]
+# "auch" has the space token as head, its dependency is not written
+HEADS = [1, 1, 3, 1, 4, 1, 5, 1, 8, 10, 10, 8]
+DEPS = ["sb", "ROOT", "nk", "oa", "dep", "mo", "nk", "punct", "ROOT", "mo", "dep", "punct"]
+
+
+@pytest.fixture
+def doc(service):
+    return Doc(spacy.blank("de").vocab, words=WORDS, spaces=SPACES, tags=TAGS, pos=POS, lemmas=LEMMAS, morphs=MORPHS,
+               heads=HEADS, deps=DEPS, sent_starts=[True] + [False] * 7 + [True] + [False] * 3)
+
+
+def dump(tokens, dependencies):
+    return [t.model_dump() for t in tokens], [d.model_dump() for d in dependencies]
+
+
+@pytest.mark.parametrize("doc_begin", [0, 7])
+def test_extract_tokens_matches_legacy_extraction(service, doc, doc_begin):
+    text = "x" * doc_begin + doc.text
+    write_types = service.TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES
+    legacy_converter = cassis.cas.Utf16CodepointOffsetConverter()
+    legacy_converter.create_offset_mapping(text)
+
+    expected = dump(*legacy_extract_tokens(service, doc, doc_begin, legacy_converter.python_to_external, write_types))
+    actual = dump(*service.extract_tokens(doc, doc_begin, service.Utf16OffsetConverter(text), write_types))
+
+    assert actual == expected
+    assert len(actual[0]) == 10
+    assert len(actual[1]) == 9
+
+
+def test_extract_tokens_of_sentences_match_whole_doc(service, doc):
+    write_types = service.TEXTIMAGER_ANNOTATOR_OUTPUT_TYPES
+    doc_tokens = service.DocTokens(doc, 0, service.Utf16OffsetConverter(doc.text), write_types)
+
+    tokens = []
+    dependencies = []
+    for sent in doc.sents:
+        sent_tokens, sent_dependencies = doc_tokens.extract(sent.start, sent.end, 3)
+        tokens.extend(sent_tokens)
+        dependencies.extend(sent_dependencies)
+
+    expected = dump(*service.extract_tokens(doc, 0, service.Utf16OffsetConverter(doc.text), write_types, 3))
+    assert dump(tokens, dependencies) == expected
+    assert tokens[0].ind == 3
+    assert doc_tokens.count == 10
+
+
+def test_extract_tokens_of_empty_doc(service):
+    doc = Doc(spacy.blank("en").vocab, words=[])
+    assert service.extract_tokens(doc, 0, service.Utf16OffsetConverter(""), set()) == ([], [])
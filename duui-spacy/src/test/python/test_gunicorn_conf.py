@@ -0,0 +1,50 @@
+import gc
+import json
+import runpy
+import urllib.request
+
+import pytest
+
+from conftest import SERVICE_DIR, free_port, gunicorn_workers, start_gunicorn
+
+
+@pytest.fixture
+def config():
+    return runpy.run_path(str(SERVICE_DIR / "gunicorn.conf.py"))
+
+
+def test_models_are_loaded_before_forking(config):
+    assert config["preload_app"] is True
+    assert config["worker_class"] == "uvicorn.workers.UvicornWorker"
+    assert config["bind"] == "0.0.0.0:9714"
+    assert config["workers"] == 1
+
+
+def test_pre_fork_freezes_objects(config):
+    assert gc.get_freeze_count() == 0
+    try:
+        config["pre_fork"](None, None)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_workers_serve_requests(model_dir):
+    pytest.importorskip("gunicorn")
+    pytest.importorskip("uvicorn")
+
+    port = free_port()
+    process = start_gunicorn(model_dir, 2, port)
+    try:
+        assert len(gunicorn_workers(process.pid)) == 2
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/v1/process",
+            data=json.dumps({"text": "Anna likes cats.", "lang": "en"}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            tokens = json.loads(response.read())["tokens"]
+        assert [t["begin"] for t in tokens] == [0, 5, 11, 15]
+    finally:
+        process.terminate()
+        process.wait(timeout=60)
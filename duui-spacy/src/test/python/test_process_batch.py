@@ -0,0 +1,60 @@
+import pytest
+
+
+@pytest.fixture
+def client(service):
+    from fastapi.testclient import TestClient
+    return TestClient(service.app)
+
+
+def request(text, **parameters):
+    return {"text": text, "lang": "en", "parameters": parameters}
+
+
+def strip_meta(response):
+    # the modification timestamp differs between the calls
+    return {key: value for key, value in response.items() if key != "modification_meta"}
+
+
+def test_batch_matches_single_requests(client):
+    requests = [
+        request("Anna likes cats."),
+        request("Bob visited Berlin \U0001F600 in the summer."),
+        request(""),
+        request("Only tokens here.", write_types="de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Token"),
+        request("Anna likes cats too."),
+    ]
+
+    batch_response = client.post("/v1/process_batch", json=requests)
+    assert batch_response.status_code == 200
+    batch_results = batch_response.json()
+
+    assert len(batch_results) == len(requests)
+    for req, batch_result in zip(requests, batch_results):
+        single_result = client.post("/v1/process", json=req).json()
+        assert strip_meta(batch_result) == strip_meta(single_result)
+
+    assert [t["begin"] for t in batch_results[1]["tokens"]] == [0, 4, 12, 19, 22, 25, 29, 35]
+    assert batch_results[2]["tokens"] == []
+    assert all(t["write_pos"] is False for t in batch_results[3]["tokens"])
+
+
+def test_failed_request_does_not_fail_batch(client, service, monkeypatch):
+    prepare_job = service.prepare_job
+
+    def failing_prepare_job(req):
+        if req.text == "fail":
+            raise ValueError("failed")
+        return prepare_job(req)
+
+    monkeypatch.setattr(service, "prepare_job", failing_prepare_job)
+
+    results = client.post("/v1/process_batch", json=[request("fail"), request("Anna likes cats.")]).json()
+    assert results[0]["tokens"] == []
+    assert [t["begin"] for t in results[1]["tokens"]] == [0, 5, 11, 15]
+
+
+def test_empty_batch(client):
+    response = client.post("/v1/process_batch", json=[])
+    assert response.status_code == 200
+    assert response.json() == []
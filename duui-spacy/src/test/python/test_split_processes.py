@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+
+def test_split_processes_disabled_for_transformer_pipelines(service, monkeypatch):
+    monkeypatch.setattr(service.settings, "split_processes", 4)
+
+    assert service.get_split_processes(SimpleNamespace(pipe_names=["tok2vec", "tagger", "parser"])) == 4
+    assert service.get_split_processes(SimpleNamespace(pipe_names=["transformer", "tagger", "parser"])) == 1
+    assert service.get_split_processes(SimpleNamespace(pipe_names=["curated_transformer", "ner"])) == 1
+
+    monkeypatch.setattr(service.settings, "split_processes", 1)
+    assert service.get_split_processes(SimpleNamespace(pipe_names=["tok2vec"])) == 1
+
+
+def test_process_inputs_in_processes_keeps_order(service, nlp):
+    texts = [f"Text number {i} is about Anna and Berlin ." for i in range(20)]
+
+    docs = service.process_inputs(nlp, texts, [])
+    docs_split = service.process_inputs(nlp, texts, [], n_process=2, batch_size=3)
+
+    assert [doc.text for doc in docs_split] == texts
+    for doc, doc_split in zip(docs, docs_split):
+        assert [(t.tag_, t.dep_, t.head.i) for t in doc] == [(t.tag_, t.dep_, t.head.i) for t in doc_split]
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+TEXT = "Anna likes cats. Bob visited Berlin \U0001F600 in the summer. Anna and Bob like Berlin."
+
+
+@pytest.fixture
+def client(service):
+    from fastapi.testclient import TestClient
+    return TestClient(service.app)
+
+
+def merge_stream(content):
+    """
+    Merge the header line and the chunk lines of a streamed response into one regular response.
+    """
+    lines = content.splitlines()
+    header = json.loads(lines[0])
+    assert header.pop("stream") is True
+
+    response = {"sentences": [], "tokens": [], "dependencies": [], "entities": [], **header}
+    for line in lines[1:]:
+        chunk = json.loads(line)
+        assert set(chunk) == {"sentences", "tokens", "dependencies", "entities"}
+        for key, annotations in chunk.items():
+            response[key].extend(annotations)
+    return response, len(lines) - 1
+
+
+def strip_timestamp(response):
+    # the modification timestamp differs between the calls
+    if response["modification_meta"] is not None:
+        response["modification_meta"] = {**response["modification_meta"], "timestamp": None}
+    return response
+
+
+def post(client, text, **parameters):
+    regular = client.post("/v1/process", json={"text": text, "lang": "en", "parameters": parameters})
+    streamed = client.post("/v1/process", json={"text": text, "lang": "en", "parameters": {**parameters, "stream": "true"}})
+
+    assert regular.status_code == streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    merged, chunks = merge_stream(streamed.text)
+    return strip_timestamp(regular.json()), strip_timestamp(merged), chunks
+
+
+def test_stream_matches_regular_response(client):
+    regular, merged, chunks = post(client, TEXT)
+
+    assert merged == regular
+    assert regular["meta"] is not None
+    # one chunk per sentence
+    assert chunks == len(regular["sentences"]) > 1
+
+
+def test_stream_of_split_text(client, service, monkeypatch):
+    inputs_counts = []
+    pipe_inputs = service.pipe_inputs
+
+    def spy(nlp, inputs, *args, **kwargs):
+        inputs_counts.append(len(inputs))
+        return pipe_inputs(nlp, inputs, *args, **kwargs)
+
+    monkeypatch.setattr(service, "pipe_inputs", spy)
+    regular, merged, chunks = post(client, TEXT, force_split_text="true", split_large_texts="true")
+
+    # one doc per sentence of the sentencizer
+    assert inputs_counts == [3, 3]
+    assert merged == regular
+    assert chunks == len(regular["sentences"])
+    # token indices continue across the docs of the split text
+    assert [t["ind"] for t in merged["tokens"]] == list(range(len(merged["tokens"])))
+    assert {d["governor_ind"] for d in merged["dependencies"]} <= {t["ind"] for t in merged["tokens"]}
+
+
+def test_stream_of_doc_without_sentences(client, service):
+    regular, merged, chunks = post(client, TEXT, write_types=service.UIMA_TYPE_TOKEN)
+
+    assert merged == regular
+    assert merged["sentences"] == []
+    # the whole doc in one chunk
+    assert chunks == 1
+    assert len(merged["tokens"]) == 18
+
+
+def test_stream_of_empty_text(client):
+    regular, merged, chunks = post(client, "")
+
+    assert merged == regular
+    assert chunks == 0
+
+
+def test_stream_processes_docs_lazily(service):
+    request = service.TextImagerRequest(text=TEXT, lang="en", parameters={"force_split_text": "true", "split_large_texts": "true"})
+    job = service.prepare_job(request)
+
+    processed = []
+
+    def docs():
+        for doc in service.pipe_inputs(job.nlp, job.inputs, job.disabled_components):
+            processed.append(doc.text)
+            yield doc
+
+    lines = service.stream_response(job, docs())
+    next(lines)
+    next(lines)
+
+    # the first sentence is sent before the other split texts are processed
+    assert len(job.inputs) == 3
+    assert len(processed) == 1
+    assert len(list(lines)) >= 2
+    assert len(processed) == 3
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+cassis = pytest.importorskip("cassis")
+
+ASTRAL_TEXT = "Grüße \U0001F600 aus \U0001D49C\U0001D49D! Ende \U0001F408"
+
+
+def cassis_converter(text):
+    converter = cassis.cas.Utf16CodepointOffsetConverter()
+    converter.create_offset_mapping(text)
+    return converter
+
+
+@pytest.mark.parametrize("text", ["Plain ASCII text.", "Grüße aus Köln, ça va?"])
+def test_bmp_text_is_not_converted(service, text):
+    converter = service.Utf16OffsetConverter(text)
+
+    assert converter.astral_before is None
+    assert converter.python_to_external(5) == 5
+    assert converter.external_to_python(5) == 5
+    offsets = np.arange(len(text) + 1)
+    assert converter.python_to_external_array(offsets) is offsets
+
+
+def test_astral_text_matches_cassis(service):
+    converter = service.Utf16OffsetConverter(ASTRAL_TEXT)
+    reference = cassis_converter(ASTRAL_TEXT)
+
+    offsets = list(range(len(ASTRAL_TEXT) + 1))
+    external = [reference.python_to_external(i) for i in offsets]
+    assert [converter.python_to_external(i) for i in offsets] == external
+    assert converter.python_to_external_array(np.array(offsets)).tolist() == external
+    assert [converter.external_to_python(i) for i in external] == offsets
+    # the UTF-16 length as in Java
+    assert external[-1] == len(ASTRAL_TEXT.encode("utf-16-le")) // 2
+
+
+def test_astral_offsets_of_response(service):
+    from fastapi.testclient import TestClient
+
+    response = TestClient(service.app).post("/v1/process", json={"text": ASTRAL_TEXT, "lang": "en"})
+    assert response.status_code == 200
+
+    utf16_text = ASTRAL_TEXT.encode("utf-16-le")
+    covered = [
+        utf16_text[token["begin"] * 2:token["end"] * 2].decode("utf-16-le")
+        for token in response.json()["tokens"]
+    ]
+    assert covered == ["Grüße", "\U0001F600", "aus", "\U0001D49C\U0001D49D", "!", "Ende", "\U0001F408"]
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from bisect import bisect_right
+from typing import List, Optional, Tuple
 import uvicorn
 from cassis import *
 from fastapi import FastAPI, Response
@@ -8,6 +9,7 @@ from pydantic import BaseModel, BaseSettings
 from starlette.responses import JSONResponse
 from functools import lru_cache
 from trankit import Pipeline
+from trankit.utils.tbinfo import langwithner
 
 
 # Lemma
@@ -163,6 +165,9 @@ class Settings(BaseSettings):
     # use gpu
     cuda: int
 
+    # process the sentences of a request in one batch instead of one by one, experimental
+    batch_sentences: int = 0
+
     # meta data
     textimager_trankit_annotator_name: str
     textimager_trankit_annotator_version: str
@@ -175,6 +180,9 @@ lru_cache_with_size = lru_cache(maxsize=3)
 config = {"gpu": bool(settings.cuda),
           "embedding": settings.model_name}
 
+# separator of the sentences in the batched tokenization, an empty line starts a new paragraph in trankit
+SENTENCE_SEPARATOR = "\n\n"
+
 
 @lru_cache_with_size
 def load_pipeline(**kwargs) -> Pipeline:
@@ -265,6 +273,83 @@ def get_documentation() -> TextImagerDocumentation:
     return documentation
 
 
+def add_tokens(trankit_tokens: list, spans: List[Tuple[int, int]], token: List[Token], deps: List[Dependency], ners: List[Entity]):
+    # adds the annotations of the trankit tokens of one sentence, spans are the document offsets of the tokens
+    tokens = []
+    for tok, (beg, end) in zip(trankit_tokens, spans):
+        pos = Pos(**{"begin": beg, "end": end, "PosValue": tok.get("xpos"), "coarseValue": tok.get("upos")})
+        try:
+            morph = MorphUD1.from_str(begin=beg, end=end, morph_string=tok["feats"])
+        except KeyError:
+            morph = MorphUD1.from_str(begin=beg, end=end, morph_string=None)
+        lemma = Lemma(**{"begin": beg, "end": end, "value": tok.get("lemma")})
+        tokens.append(Token(**{"begin": beg, "end": end, "lemma": lemma, "pos": pos, "morph": morph}))
+        if tok.get("ner") != "O" and tok.get("ner") is not None:
+            ners.append(Entity(**{"begin": beg, "end": end, "value": tok["ner"]}))
+    for idx, (tok, (beg, end)) in enumerate(zip(trankit_tokens, spans)):
+        # deps.append(**{"begin": beg, "end": end, "DependencyType": tok["deprel"], "flavor": "basic", "Governor": tokens[tok["head"] - 1], "Dependent": tokens[idx]})
+        if tok.get("deprel") is not None and tok.get("head") is not None:
+            deps.append(Dependency(**{"begin": beg, "end": end, "DependencyType": tok["deprel"], "flavor": "basic",
+                           "Governor": len(token) + tok["head"] - 1, "Dependent": len(token) + idx}))
+    token.extend(tokens)
+
+
+def renumber_tokens(trankit_tokens: list):
+    # word ids restart in every trankit sentence, number them through the tokens of the cas sentence,
+    # a multi-word token like "zum" has the ids of its expanded words ("zu", "dem") as a range
+    word_id = 0
+    for tok in trankit_tokens:
+        if "expanded" in tok:
+            for word in tok["expanded"]:
+                word_id += 1
+                word["id"] = word_id
+            tok["id"] = (tok["expanded"][0]["id"], word_id)
+        else:
+            word_id += 1
+            tok["id"] = word_id
+
+
+def process_sentences_batched(pipeline: Pipeline, sentences: List[Sentence], token: List[Token], deps: List[Dependency], ners: List[Entity]):
+    # tokenize all sentences at once, joined as paragraphs of one document, with the multi-word tokens expanded
+    starts = []
+    texts = []
+    length = 0
+    for sent in sentences:
+        starts.append(length)
+        texts.append(sent.coveredText)
+        length += len(sent.coveredText) + len(SENTENCE_SEPARATOR)
+    tokenized = pipeline.tokenize(SENTENCE_SEPARATOR.join(texts))
+    if not tokenized:
+        return
+
+    # group the tokens by the cas sentence they start in, trankit may split a sentence further
+    sent_tokens = [[] for _ in sentences]
+    sent_spans = [[] for _ in sentences]
+    for tok_sent in tokenized["sentences"]:
+        for tok in tok_sent["tokens"]:
+            beg, end = tok["dspan"]
+            ind = bisect_right(starts, beg) - 1
+            offset = sentences[ind].begin - starts[ind]
+            sent_tokens[ind].append(tok)
+            sent_spans[ind].append((beg + offset, end + offset))
+
+    # tag, lemmatize and parse the cas sentences as one tokenized document, trankit batches them internally.
+    # These are the internal steps of Pipeline.__call__ (trankit 1.1.0), its pretokenized input would drop the
+    # expanded words of the multi-word tokens.
+    indices = [ind for ind, tokens in enumerate(sent_tokens) if len(tokens) > 0]
+    if len(indices) == 0:
+        return
+    doc = []
+    for ind in indices:
+        renumber_tokens(sent_tokens[ind])
+        doc.append({"id": len(doc) + 1, "tokens": sent_tokens[ind]})
+    res = pipeline._lemmatize_doc(pipeline._posdep_doc(doc))
+    if pipeline._config.active_lang in langwithner:
+        res = pipeline._ner_doc(res)
+    for ind, sent in zip(indices, res):
+        add_tokens(sent["tokens"], sent_spans[ind], token, deps, ners)
+
+
 # Process request from DUUI
 @app.post("/v1/process")
 def post_process(request: DUUIRequest) -> DUUIResponse:
@@ -279,30 +364,13 @@ def post_process(request: DUUIRequest) -> DUUIResponse:
         ners = []
         deps = []
         token = []
-        for sent in request.sentences:
-            tokens = []
-            temp = pipeline(sent.coveredText, is_sent=True)
-            beg_prefix = sent.begin
-            for tok in temp["tokens"]:
-                beg, end = tok["span"]
-                beg, end = beg + beg_prefix, end + beg_prefix
-                pos = Pos(**{"begin": beg, "end": end, "PosValue": tok.get("xpos"), "coarseValue": tok.get("upos")})
-                try:
-                    morph = MorphUD1.from_str(begin=beg, end=end, morph_string=tok["feats"])
-                except KeyError:
-                    morph = MorphUD1.from_str(begin=beg, end=end, morph_string=None)
-                lemma = Lemma(**{"begin": beg, "end": end, "value": tok.get("lemma")})
-                tokens.append(Token(**{"begin": beg, "end": end, "lemma": lemma, "pos": pos, "morph": morph}))
-                if tok.get("ner") != "O" and tok.get("ner") is not None:
-                    ners.append(Entity(**{"begin": beg, "end": end, "value": tok["ner"]}))
-            for idx, tok in enumerate(temp["tokens"]):
-                beg, end = tok["span"]
-                beg, end = beg + beg_prefix, end + beg_prefix
-                # deps.append(**{"begin": beg, "end": end, "DependencyType": tok["deprel"], "flavor": "basic", "Governor": tokens[tok["head"] - 1], "Dependent": tokens[idx]})
-                if tok.get("deprel") is not None and tok.get("head") is not None:
-                    deps.append(Dependency(**{"begin": beg, "end": end, "DependencyType": tok["deprel"], "flavor": "basic",
-                                   "Governor": len(token) + tok["head"] - 1, "Dependent": len(token) + idx}))
-            token.extend(tokens)
+        if settings.batch_sentences:
+            process_sentences_batched(pipeline, request.sentences, token, deps, ners)
+        else:
+            for sent in request.sentences:
+                temp = pipeline(sent.coveredText, is_sent=True)
+                spans = [(tok["span"][0] + sent.begin, tok["span"][1] + sent.begin) for tok in temp["tokens"]]
+                add_tokens(temp["tokens"], spans, token, deps, ners)
 
         # Return data as JSON
         return DUUIResponse(
@@ -320,26 +388,8 @@ def post_process(request: DUUIRequest) -> DUUIResponse:
         deps = []
         token = []
         for sent in res["sentences"]:
-            tokens = []
             sents.append(Sentence(**{"begin": sent["dspan"][0], "end": sent["dspan"][1], "coveredText": sent["text"]}))
-            for tok in sent["tokens"]:
-                beg, end = tok["dspan"]
-                pos = Pos(**{"begin": beg, "end": end, "PosValue": tok.get("xpos"), "coarseValue": tok.get("upos")})
-                try:
-                    morph = MorphUD1.from_str(begin=beg, end=end, morph_string=tok["feats"])
-                except KeyError:
-                    morph = MorphUD1.from_str(begin=beg, end=end, morph_string=None)
-                lemma = Lemma(**{"begin": beg, "end": end, "value": tok.get("lemma")})
-                tokens.append(Token(**{"begin": beg, "end": end, "lemma": lemma, "pos": pos, "morph": morph}))
-                if tok.get("ner") != "O" and tok.get("ner") is not None:
-                    ners.append(Entity(**{"begin": beg, "end": end, "value": tok["ner"]}))
-            for idx, tok in enumerate(sent["tokens"]):
-                beg, end = tok["dspan"]
-                # deps.append(**{"begin": beg, "end": end, "DependencyType": tok["deprel"], "flavor": "basic", "Governor": tokens[tok["head"]-1], "Dependent": tokens[idx]})
-                if tok.get("deprel") is not None and tok.get("head") is not None:
-                    deps.append(Dependency(**{"begin": beg, "end": end, "DependencyType": tok["deprel"], "flavor": "basic",
-                                   "Governor": len(token) + tok["head"] - 1, "Dependent": len(token) + idx}))
-            token.extend(tokens)
+            add_tokens(sent["tokens"], [tok["dspan"] for tok in sent["tokens"]], token, deps, ners)
         # Return data as JSON
         return DUUIResponse(
             sentences=sents,
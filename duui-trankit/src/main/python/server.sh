@@ -1,6 +1,7 @@
 # meta data
 CUDA=0 \
 MODEL_NAME='xlm-roberta-base' \
+BATCH_SENTENCES=0 \
 TEXTIMAGER_TRANKIT_ANNOTATOR_NAME="duui-trankit" \
 TEXTIMAGER_TRANKIT_ANNOTATOR_VERSION="0.1" \
 /home/leon/uni/trankit_duui/venv/bin/python duui_trankit.py
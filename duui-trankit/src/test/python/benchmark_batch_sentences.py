@@ -0,0 +1,43 @@
+"""
+Time to process a request with 1k German sentences one by one (BATCH_SENTENCES=0) compared to the batched path,
+both with the xlm-roberta-base trankit pipeline, and check that both return the same annotations.
+
+Run from the component root: python src/test/python/benchmark_batch_sentences.py
+"""
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import SENTENCES, build_request, import_service
+
+SENTENCE_COUNT = 1000
+
+
+def main():
+    try:
+        import trankit  # noqa: F401
+    except ImportError:
+        print("trankit is not installed, skipping the benchmark")
+        return
+
+    service = import_service()
+    random.seed(0)
+    request = build_request(service, [random.choice(SENTENCES) for _ in range(SENTENCE_COUNT)])
+    # load the pipeline before measuring
+    service.post_process(build_request(service, SENTENCES[:1]))
+
+    results = {}
+    for name, batch_sentences in [("one by one", 0), ("batched", 1)]:
+        service.settings.batch_sentences = batch_sentences
+        start = perf_counter()
+        results[name] = service.post_process(request).dict()
+        duration = perf_counter() - start
+        print(f"{name}: {duration:.2f} s, {SENTENCE_COUNT / duration:.1f} sentences/s")
+
+    assert results["batched"] == results["one by one"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import os
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+SERVICE_DIR = Path(__file__).parents[2] / "main" / "python"
+
+# German sentences with the contractions "zum", "im" and "vom", that trankit expands into multi-word tokens
+SENTENCES = [
+    "Wir gehen heute Abend zum Bahnhof.",
+    "Im Sommer fährt Anna mit Bob vom Rathaus nach Berlin.",
+    "Das Wetter war schön!",
+    "Der Zug kommt um 18 Uhr an, sagte sie zum Schaffner.",
+]
+
+
+def import_service(**env):
+    os.environ.update({
+        "MODEL_NAME": "xlm-roberta-base",
+        "CUDA": "0",
+        "BATCH_SENTENCES": "0",
+        "TEXTIMAGER_TRANKIT_ANNOTATOR_NAME": "test",
+        "TEXTIMAGER_TRANKIT_ANNOTATOR_VERSION": "test",
+        **env,
+    })
+    # the service reads the Lua script and type system from the working directory
+    sys.path.insert(0, str(SERVICE_DIR))
+    cwd = os.getcwd()
+    os.chdir(SERVICE_DIR)
+    try:
+        return import_module("duui_trankit")
+    finally:
+        os.chdir(cwd)
+
+
+def build_request(service, sentences, separator=" "):
+    text = ""
+    request_sentences = []
+    for sentence in sentences:
+        if text:
+            text += separator
+        request_sentences.append(service.Sentence(begin=len(text), end=len(text) + len(sentence), coveredText=sentence))
+        text += sentence
+    return service.DUUIRequest(doc_text=text, sentences=request_sentences)
+
+
+@pytest.fixture(scope="session")
+def service():
+    pytest.importorskip("trankit")
+    return import_service()
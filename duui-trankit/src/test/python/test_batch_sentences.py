@@ -0,0 +1,39 @@
+import pytest
+
+from conftest import SENTENCES, build_request
+
+
+def process(service, monkeypatch, request, batch_sentences):
+    monkeypatch.setattr(service.settings, "batch_sentences", batch_sentences)
+    return service.post_process(request).dict()
+
+
+@pytest.mark.parametrize("separator", [" ", "\n", "  \n\n "])
+def test_batched_matches_sentence_by_sentence(service, monkeypatch, separator):
+    request = build_request(service, SENTENCES, separator)
+
+    batched = process(service, monkeypatch, request, 1)
+    expected = process(service, monkeypatch, request, 0)
+
+    assert batched == expected
+    covered = [request.doc_text[token["begin"]:token["end"]] for token in batched["token"]]
+    assert covered.count("zum") == 2
+    assert "Im" in covered and "vom" in covered
+
+
+def test_multi_word_tokens_are_expanded(service):
+    pipeline = service.load_pipeline(**service.config)
+    tokens = []
+    for sentence in pipeline.tokenize(service.SENTENCE_SEPARATOR.join(SENTENCES))["sentences"]:
+        tokens += sentence["tokens"]
+
+    # trankit expands "zum" into "zu dem", the batched path has to keep these words
+    assert "zum" in [token["text"] for token in tokens if "expanded" in token]
+
+    # the word ids continue through the tokens of all sentences
+    service.renumber_tokens(tokens)
+    ids = []
+    for token in tokens:
+        ids += [word["id"] for word in token["expanded"]] if "expanded" in token else [token["id"]]
+    assert ids == list(range(1, len(ids) + 1))
+
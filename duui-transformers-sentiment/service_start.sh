@@ -2,4 +2,11 @@ TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_NAME="textimager-duui-transform
 TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_VERSION="unset" \
 TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_LOG_LEVEL="DEBUG" \
 TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_SIZE="1" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_MAX_MB="0" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_BATCH_MAX_SENTENCES="256" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_BATCH_MAX_WAIT_MS="5" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_BATCH_MAX_TOKENS="16384" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_RESULT_CACHE_SIZE="0" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_BACKEND="torch" \
+TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ONNX_CACHE_DIR="onnx_models" \
 uvicorn src.main.python.textimager_duui_transformers_sentiment:app --host 0.0.0.0 --port 9714 --workers 1
@@ -13,6 +13,20 @@ function serialize(inputCas, outputStream, parameters)
     local model_name = parameters["model_name"]
     local selection_types = parameters["selection"]
 
+    -- sweep mode, comma separated list of models sharing a tokenizer
+    local model_names = nil
+    if parameters["model_names"] ~= nil then
+        model_names = {}
+        local model_names_count = 1
+        for sweep_model_name in string.gmatch(parameters["model_names"], "([^,]+)") do
+            model_names[model_names_count] = sweep_model_name
+            model_names_count = model_names_count + 1
+        end
+        if model_name == nil then
+            model_name = model_names[1]
+        end
+    end
+
     local ignore_max_length_truncation_padding = parameters["ignore_max_length_truncation_padding"]
     if ignore_max_length_truncation_padding == nil then
         ignore_max_length_truncation_padding = false
@@ -23,6 +37,11 @@ function serialize(inputCas, outputStream, parameters)
         batch_size = 128
     end
 
+    local columnar = parameters["columnar"]
+    if columnar == nil then
+        columnar = false
+    end
+
     local selections = {}
     local selections_count = 1
     for selection_type in string.gmatch(selection_types, "([^,]+)") do
@@ -63,11 +82,82 @@ function serialize(inputCas, outputStream, parameters)
         lang = doc_lang,
         doc_len = doc_len,
         model_name = model_name,
+        model_names = model_names,
         batch_size = batch_size,
-        ignore_max_length_truncation_padding = ignore_max_length_truncation_padding
+        ignore_max_length_truncation_padding = ignore_max_length_truncation_padding,
+        columnar = columnar
     }))
 end
 
+function add_sentiment(inputCas, meta, selection_type, sentence_begin, sentence_end, sentiment, score, details, polarity, pos, neu, neg)
+    -- simple sentiment
+    local sentiment_anno = luajava.newInstance("org.hucompute.textimager.uima.type.Sentiment", inputCas)
+    sentiment_anno:setBegin(sentence_begin)
+    sentiment_anno:setEnd(sentence_end)
+    sentiment_anno:setSentiment(sentiment)
+    sentiment_anno:addToIndexes()
+
+    local meta_anno = luajava.newInstance("org.texttechnologylab.annotation.AnnotatorMetaData", inputCas)
+    meta_anno:setReference(sentiment_anno)
+    meta_anno:setName(meta["name"])
+    meta_anno:setVersion(meta["version"])
+    meta_anno:setModelName(meta["modelName"])
+    meta_anno:setModelVersion(meta["modelVersion"])
+    meta_anno:addToIndexes()
+
+    local meta_selection = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
+    meta_selection:setReference(sentiment_anno)
+    meta_selection:setKey("selection")
+    meta_selection:setValue(selection_type)
+    meta_selection:addToIndexes()
+
+    local meta_score = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
+    meta_score:setReference(sentiment_anno)
+    meta_score:setKey("score")
+    meta_score:setValue(score)
+    meta_score:addToIndexes()
+
+    -- raw label scores
+    for label, label_score in pairs(details) do
+        local raw_anno = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
+        raw_anno:setReference(sentiment_anno)
+        raw_anno:setKey("raw_score")
+        raw_anno:setValue(label .. "=" .. label_score)
+        raw_anno:addToIndexes()
+    end
+
+    -- detailed sentiment
+    local sentiment_anno2 = luajava.newInstance("org.hucompute.textimager.uima.type.CategorizedSentiment", inputCas)
+    sentiment_anno2:setBegin(sentence_begin)
+    sentiment_anno2:setEnd(sentence_end)
+    sentiment_anno2:setSentiment(polarity)
+    sentiment_anno2:setPos(pos)
+    sentiment_anno2:setNeu(neu)
+    sentiment_anno2:setNeg(neg)
+    sentiment_anno2:addToIndexes()
+
+    local meta_anno2 = luajava.newInstance("org.texttechnologylab.annotation.AnnotatorMetaData", inputCas)
+    meta_anno2:setReference(sentiment_anno2)
+    meta_anno2:setName(meta["name"])
+    meta_anno2:setVersion(meta["version"])
+    meta_anno2:setModelName(meta["modelName"])
+    meta_anno2:setModelVersion(meta["modelVersion"])
+    meta_anno2:addToIndexes()
+
+    local meta_selection2 = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
+    meta_selection2:setReference(sentiment_anno2)
+    meta_selection2:setKey("selection")
+    meta_selection2:setValue(selection_type)
+    meta_selection2:addToIndexes()
+
+    -- add address of simple annotation to each detailed
+    local meta_simple = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
+    meta_simple:setReference(sentiment_anno2)
+    meta_simple:setKey("sentiment_ref")
+    meta_simple:setValue(sentiment_anno:getAddress())
+    meta_simple:addToIndexes()
+end
+
 function deserialize(inputCas, inputStream)
     local inputString = luajava.newInstance("java.lang.String", inputStream:readAllBytes(), StandardCharsets.UTF_8)
     local results = json.decode(inputString)
@@ -80,77 +170,33 @@ function deserialize(inputCas, inputStream)
         modification_anno:setComment(modification_meta["comment"])
         modification_anno:addToIndexes()
 
-        local meta = results["meta"]
-
         for i, selection in ipairs(results["selections"]) do
             local selection_type = selection["selection"]
-            for j, sentence in ipairs(selection["sentences"]) do
-                -- simple sentiment
-                local sentiment_anno = luajava.newInstance("org.hucompute.textimager.uima.type.Sentiment", inputCas)
-                sentiment_anno:setBegin(sentence["sentence"]["begin"])
-                sentiment_anno:setEnd(sentence["sentence"]["end"])
-                sentiment_anno:setSentiment(sentence["sentiment"])
-                sentiment_anno:addToIndexes()
-
-                local meta_anno = luajava.newInstance("org.texttechnologylab.annotation.AnnotatorMetaData", inputCas)
-                meta_anno:setReference(sentiment_anno)
-                meta_anno:setName(meta["name"])
-                meta_anno:setVersion(meta["version"])
-                meta_anno:setModelName(meta["modelName"])
-                meta_anno:setModelVersion(meta["modelVersion"])
-                meta_anno:addToIndexes()
-
-                local meta_selection = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
-                meta_selection:setReference(sentiment_anno)
-                meta_selection:setKey("selection")
-                meta_selection:setValue(selection_type)
-                meta_selection:addToIndexes()
-
-                local meta_score = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
-                meta_score:setReference(sentiment_anno)
-                meta_score:setKey("score")
-                meta_score:setValue(sentence["score"])
-                meta_score:addToIndexes()
-
-                -- raw label scores
-                for label, score in pairs(sentence["details"]) do
-                    local raw_anno = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
-                    raw_anno:setReference(sentiment_anno)
-                    raw_anno:setKey("raw_score")
-                    raw_anno:setValue(label .. "=" .. score)
-                    raw_anno:addToIndexes()
-                end
 
-                -- detailed sentiment
-                local sentiment_anno2 = luajava.newInstance("org.hucompute.textimager.uima.type.CategorizedSentiment", inputCas)
-                sentiment_anno2:setBegin(sentence["sentence"]["begin"])
-                sentiment_anno2:setEnd(sentence["sentence"]["end"])
-                sentiment_anno2:setSentiment(sentence["polarity"])
-                sentiment_anno2:setPos(sentence["pos"])
-                sentiment_anno2:setNeu(sentence["neu"])
-                sentiment_anno2:setNeg(sentence["neg"])
-                sentiment_anno2:addToIndexes()
-
-                local meta_anno2 = luajava.newInstance("org.texttechnologylab.annotation.AnnotatorMetaData", inputCas)
-                meta_anno2:setReference(sentiment_anno2)
-                meta_anno2:setName(meta["name"])
-                meta_anno2:setVersion(meta["version"])
-                meta_anno2:setModelName(meta["modelName"])
-                meta_anno2:setModelVersion(meta["modelVersion"])
-                meta_anno2:addToIndexes()
-
-                local meta_selection2 = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
-                meta_selection2:setReference(sentiment_anno2)
-                meta_selection2:setKey("selection")
-                meta_selection2:setValue(selection_type)
-                meta_selection2:addToIndexes()
-
-                -- add address of simple annotation to each detailed
-                local meta_simple = luajava.newInstance("org.texttechnologylab.annotation.AnnotationComment", inputCas)
-                meta_simple:setReference(sentiment_anno2)
-                meta_simple:setKey("sentiment_ref")
-                meta_simple:setValue(sentiment_anno:getAddress())
-                meta_simple:addToIndexes()
+            -- selections can have their own model meta data, e.g. in sweep mode
+            local meta = results["meta"]
+            if selection["meta"] ~= nil then
+                meta = selection["meta"]
+            end
+
+            if selection["columns"] ~= nil then
+                -- columnar results, parallel arrays per sentence and a label x sentence score matrix
+                local columns = selection["columns"]
+                for j, sentence_begin in ipairs(columns["begin"]) do
+                    local details = {}
+                    for k, label in ipairs(columns["labels"]) do
+                        local score = columns["details"][k][j]
+                        if score ~= nil then
+                            details[label] = score
+                        end
+                    end
+
+                    add_sentiment(inputCas, meta, selection_type, sentence_begin, columns["end"][j], columns["sentiment"][j], columns["score"][j], details, columns["polarity"][j], columns["pos"][j], columns["neu"][j], columns["neg"][j])
+                end
+            else
+                for j, sentence in ipairs(selection["sentences"]) do
+                    add_sentiment(inputCas, meta, selection_type, sentence["sentence"]["begin"], sentence["sentence"]["end"], sentence["sentiment"], sentence["score"], sentence["details"], sentence["polarity"], sentence["pos"], sentence["neu"], sentence["neg"])
+                end
             end
         end
     end
@@ -0,0 +1,40 @@
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdapterSentimentAnalysis:
+    """
+    Sentiment pipeline of one base model shared by all its adapters.
+
+    Adapters are loaded into the base model on first use and kept, "activate" switches the active
+    adapter and its prediction head. Activating and calling must happen under the same lock.
+    """
+
+    def __init__(self, sentiment_analysis):
+        self.sentiment_analysis = sentiment_analysis
+        self.model = sentiment_analysis.model
+        self.tokenizer = sentiment_analysis.tokenizer
+
+        # adapter path -> adapter name
+        self.adapters: Dict[str, str] = {}
+        self.active_adapter: Optional[str] = None
+        self.top_k: Optional[int] = None
+
+    def activate(self, adapter_path: str, labels_count: int) -> "AdapterSentimentAnalysis":
+        if adapter_path not in self.adapters:
+            logger.info("Loading adapter \"%s\"", adapter_path)
+            self.adapters[adapter_path] = self.model.load_adapter(adapter_path)
+
+        adapter_name = self.adapters[adapter_path]
+        if adapter_name != self.active_adapter:
+            logger.debug("Activating adapter \"%s\"", adapter_name)
+            self.model.set_active_adapters(adapter_name)
+            self.active_adapter = adapter_name
+
+        self.top_k = labels_count
+        return self
+
+    def __call__(self, texts, **kwargs):
+        return self.sentiment_analysis(texts, top_k=self.top_k, **kwargs)
@@ -0,0 +1,33 @@
+from typing import List
+
+
+def token_budget_batches(lengths: List[int], max_tokens: int, max_batch_size: int) -> List[List[int]]:
+    """
+    Groups text indices into batches of similar length.
+
+    Texts are sorted by their token length, a batch is closed as soon as adding the next text would
+    exceed "max_tokens" padded tokens (batch size times longest text) or "max_batch_size" texts.
+    A single text longer than "max_tokens" is put in its own batch.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+
+    batches = []
+    batch = []
+    for i in order:
+        # sorted ascending, so the current text is the longest in the batch
+        if batch and ((len(batch)+1) * lengths[i] > max_tokens or len(batch) >= max_batch_size):
+            batches.append(batch)
+            batch = []
+        batch.append(i)
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+def padded_tokens(lengths: List[int], batches: List[List[int]]) -> int:
+    # number of tokens including padding the model has to process for these batches
+    return sum(
+        len(batch) * max(lengths[i] for i in batch)
+        for batch in batches
+    )
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from pydantic import BaseModel
 
-from .sentiment import SentimentSelection
+from .sentiment import SentimentSelection, SentimentCacheStats
 from .uima import UimaSentenceSelection, UimaAnnotationMeta, UimaDocumentModification
 
 
@@ -10,11 +10,16 @@ class TextImagerRequest(BaseModel):
     lang: str
     doc_len: int
     model_name: str
+    # sweep mode: run all these models, which have to share a tokenizer, on one tokenization pass
+    model_names: Optional[List[str]]
     batch_size: int
     ignore_max_length_truncation_padding: bool
+    # return the results of each selection as parallel arrays instead of one object per sentence
+    columnar: bool = False
 
 
 class TextImagerResponse(BaseModel):
     selections: List[SentimentSelection]
     meta: Optional[UimaAnnotationMeta]
     modification_meta: Optional[UimaDocumentModification]
+    cache_stats: Optional[SentimentCacheStats]
@@ -1,7 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pydantic import BaseModel
 
-from .uima import UimaSentence
+from .uima import UimaSentence, UimaAnnotationMeta
 
 
 class SentimentSentence(BaseModel):
@@ -24,6 +24,33 @@ class SentimentSentence(BaseModel):
     details: Dict[str, float]
 
 
+class SentimentColumns(BaseModel):
+    # parallel arrays with one entry per sentence, see "SentimentSentence"
+    begin: List[int]
+    end: List[int]
+    sentiment: List[float]
+    score: List[float]
+    polarity: List[float]
+    pos: List[float]
+    neu: List[float]
+    neg: List[float]
+
+    # label x sentence matrix of the scores of "labels", null if a label is missing for a sentence
+    labels: List[str]
+    details: List[List[Optional[float]]]
+
+
 class SentimentSelection(BaseModel):
     selection: str
     sentences: List[SentimentSentence]
+    # columnar results instead of "sentences", if requested
+    columns: Optional[SentimentColumns]
+    # model meta data of this selection if it differs from the response meta, e.g. in sweep mode
+    meta: Optional[UimaAnnotationMeta]
+
+
+class SentimentCacheStats(BaseModel):
+    # sentences whose results were taken from the cache, including repeated sentences in the request
+    hits: int
+    # sentences processed by the model
+    misses: int
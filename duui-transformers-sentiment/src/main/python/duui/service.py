@@ -13,9 +13,34 @@ class Settings(BaseSettings):
     # Log level
     textimager_duui_transformers_sentiment_log_level: Optional[str]
 
-    # Model LRU cache size
+    # Model LRU cache size, 0 disables caching, -1 for no limit on the number of models
     textimager_duui_transformers_sentiment_model_cache_size: int
 
+    # Memory budget of the model cache in MB, 0 for no limit
+    textimager_duui_transformers_sentiment_model_cache_max_mb: int = 0
+
+    # Max number of sentences of concurrent requests merged into one batch, 0 disables merging
+    # Note: counts sentences, the merged batch is split into model calls by "batch_max_tokens"
+    textimager_duui_transformers_sentiment_batch_max_sentences: int = 256
+
+    # Max time in ms to wait for further requests to fill a batch
+    textimager_duui_transformers_sentiment_batch_max_wait_ms: int = 5
+
+    # Max number of padded tokens per model call, sentences are sorted by length, 0 disables sorting
+    textimager_duui_transformers_sentiment_batch_max_tokens: int = 16384
+
+    # Number of sentence results kept in memory, 0 disables the in-memory cache (default)
+    textimager_duui_transformers_sentiment_result_cache_size: int = 0
+
+    # Optional SQLite database file to persist sentence results
+    textimager_duui_transformers_sentiment_result_cache_db: Optional[str]
+
+    # Inference backend of models without "backend" in their config: "torch", "onnx" or "onnx-int8"
+    textimager_duui_transformers_sentiment_backend: str = "torch"
+
+    # Directory of the ONNX exports of models, created on first use of a model
+    textimager_duui_transformers_sentiment_onnx_cache_dir: str = "onnx_models"
+
 
 # Capabilities
 class TextImagerCapability(BaseModel):
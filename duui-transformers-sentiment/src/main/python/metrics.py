@@ -0,0 +1,106 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+
+def format_labels(labels: Tuple[Tuple[str, str], ...], extra: str = None) -> str:
+    parts = [f'{name}="{value}"' for name, value in labels]
+    if extra is not None:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self.lock = Lock()
+
+    def inc(self, value: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + value
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+        ]
+        with self.lock:
+            for labels, value in self.values.items():
+                lines.append(f"{self.name}{format_labels(labels)} {format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, description: str, buckets: List[float]):
+        self.name = name
+        self.description = description
+        self.buckets = sorted(buckets)
+        # labels -> [bucket counts..., sum, count]
+        self.values: Dict[Tuple[Tuple[str, str], ...], list] = {}
+        self.lock = Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        # index of the smallest bucket the value fits in, counts are made cumulative on rendering
+        bucket = bisect_left(self.buckets, value)
+        with self.lock:
+            if key not in self.values:
+                self.values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            values = self.values[key]
+            values[bucket] += 1
+            values[-2] += value
+            values[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - start, **labels)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self.lock:
+            for labels, values in self.values.items():
+                cumulative = 0
+                for le, count in zip(self.buckets + ["+Inf"], values[:-2]):
+                    cumulative += count
+                    le_label = f'le="{le}"'
+                    lines.append(f"{self.name}_bucket{format_labels(labels, le_label)} {cumulative}")
+                lines.append(f"{self.name}_sum{format_labels(labels)} {format_value(values[-2])}")
+                lines.append(f"{self.name}_count{format_labels(labels)} {values[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name: str, description: str) -> Counter:
+        metric = Counter(name, description)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, description: str, buckets: List[float]) -> Histogram:
+        metric = Histogram(name, description, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
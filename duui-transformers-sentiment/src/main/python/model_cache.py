@@ -0,0 +1,95 @@
+import logging
+from collections import OrderedDict
+from functools import wraps
+from threading import RLock
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+def model_bytes(sentiment_analysis) -> int:
+    # pipelines of other backends report their size themselves
+    if hasattr(sentiment_analysis, "nbytes"):
+        return sentiment_analysis.nbytes
+
+    # memory of parameters and buffers of the underlying torch model
+    model = sentiment_analysis.model
+    return sum(
+        t.numel() * t.element_size()
+        for t in list(model.parameters()) + list(model.buffers())
+    )
+
+
+class ModelCache:
+    """
+    LRU cache of loaded pipelines, bounded by the memory of their models.
+
+    Least recently used models are evicted as soon as the models in the cache need more than
+    "max_bytes" or the cache holds more than "max_entries" models. "max_bytes" 0 disables the memory
+    limit. Like "lru_cache", "max_entries" 0 disables caching and a negative value disables the
+    count limit. The most recently loaded model is never evicted, even if it alone exceeds the budget.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        # key -> [model, bytes]
+        self.entries = OrderedDict()
+        self.lock = RLock()
+
+    def cached(self, load: Callable[..., Any]) -> Callable[..., Any]:
+        # decorator, caches the results of "load" by function name and positional args
+        @wraps(load)
+        def wrapper(*args):
+            return self.get((load.__name__, *args), lambda: load(*args))
+        return wrapper
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key][0]
+
+            logger.info("Loading model %s", key)
+            model = load()
+            if self.max_entries == 0:
+                return model
+
+            self.entries[key] = [model, model_bytes(model)]
+
+            # sizes can change after loading, e.g. by adding adapters
+            self._update_sizes()
+            self._evict()
+
+            return model
+
+    def used_bytes(self) -> int:
+        return sum(size for _, size in self.entries.values())
+
+    def _update_sizes(self):
+        for entry in self.entries.values():
+            entry[1] = model_bytes(entry[0])
+
+    def _evict(self):
+        while len(self.entries) > 1 and (
+                (self.max_bytes > 0 and self.used_bytes() > self.max_bytes)
+                or (self.max_entries > 0 and len(self.entries) > self.max_entries)):
+            key, (_, size) = self.entries.popitem(last=False)
+            logger.info("Evicting model %s, freeing %d bytes", key, size)
+
+    def stats(self) -> dict:
+        with self.lock:
+            self._update_sizes()
+            return {
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "used_bytes": self.used_bytes(),
+                "models": [
+                    {
+                        "key": [str(k) for k in key],
+                        "bytes": size,
+                    }
+                    for key, (_, size) in self.entries.items()
+                ]
+            }
@@ -0,0 +1,236 @@
+import json
+import logging
+from collections.abc import Mapping
+from importlib import import_module
+from pathlib import Path
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+# Static manifest of all supported models, generated at build time by running this module
+MANIFEST_FILENAME = Path(__file__).parent / "manifest.json"
+
+# Config modules of the supported models, each defines a "SUPPORTED_MODEL" dict
+MODEL_MODULES = [
+    "cardiffnlp_twitter_roberta_base_sentiment",
+    "cardiffnlp_twitter_roberta_base_sentiment_latest",
+    "cardiffnlp_twitter_xlm_roberta_base_sentiment",
+    "clampert_multilingual_sentiment_covid19",
+    "cmarkea_distilcamembert_base_sentiment",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep1_cp35057",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep2_cp70114",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep3_cp105171",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep4_cp140228",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep5_cp175285",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep1_cp35010",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep2_cp70020",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep3_cp105030",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep4_cp140040",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep5_cp175050",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp210060",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp420120",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp630180",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp840240",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp1050300",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep1_cp30979",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep2_cp61958",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep3_cp92937",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep4_cp123916",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep5_cp154895",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep6_cp185874",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep7_cp216853",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep8_cp247832",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep9_cp278811",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep10_cp309790",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep11_cp340769",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep12_cp371748",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep13_cp402727",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep14_cp433706",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep15_cp464685",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep16_cp495664",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep17_cp526643",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep18_cp557622",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep19_cp588601",
+    #"dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep20_cp619580",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4193",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8386",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12579",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16772",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp20965",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25156",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50312",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp75468",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp100624",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp125780",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916",
+    #"dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4224",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8448",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12672",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16896",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp21120",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25342",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50684",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp76026",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp101368",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp126710",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601",
+    #"dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep1_cp35057",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep2_cp70114",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep3_cp105171",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep4_cp140228",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep5_cp175285",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep1_cp30870",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep2_cp61740",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep3_cp92610",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep4_cp123480",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep5_cp154350",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp185216",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp370432",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp555648",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp740864",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp926080",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep1_cp30979",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep2_cp61958",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep3_cp92937",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep4_cp123916",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep5_cp154895",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep6_cp185874",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep7_cp216853",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep8_cp247832",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep9_cp278811",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep10_cp309790",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep11_cp340769",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep12_cp371748",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep13_cp402727",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep14_cp433706",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep15_cp464685",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep16_cp495664",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep17_cp526643",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep18_cp557622",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep19_cp588601",
+    #"dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep20_cp619580",
+    "finiteautomata_bertweet_base_sentiment_analysis",
+    "j_hartmann_sentiment_roberta_large_english_3_classes",
+    "liyuan_amazon_review_sentiment_analysis",
+    "mdraw_german_news_sentiment_bert",
+    "nlptown_bert_base_multilingual_uncased_sentiment",
+    "oliverguhr_german_sentiment_bert",
+    "philschmid_distilbert_base_multilingual_cased_sentiment_2",
+    "siebert_sentiment_roberta_large_english",
+]
+
+
+def build_manifest():
+    manifest = {}
+    for module_name in MODEL_MODULES:
+        module = import_module(f"{__package__}.{module_name}")
+        for model_name, model_data in module.SUPPORTED_MODEL.items():
+            manifest[model_name] = {
+                "module": module_name,
+                "version": model_data["version"],
+                "max_length": model_data["max_length"],
+                "languages": model_data["languages"],
+            }
+    return manifest
+
+
+class ModelRegistry(Mapping):
+    """
+    Read-only mapping of model name to model config, backed by the static manifest.
+
+    The config module of a model is only imported when the model is accessed for the first time.
+    Use "manifest" to get infos on all models without importing them.
+    """
+
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.models = {}
+        self.lock = Lock()
+
+    @classmethod
+    def load(cls, manifest_filename=MANIFEST_FILENAME):
+        if Path(manifest_filename).is_file():
+            logger.info("Loading model manifest from \"%s\"", manifest_filename)
+            with open(manifest_filename, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        else:
+            logger.warning("Model manifest \"%s\" not found, importing all model config modules", manifest_filename)
+            manifest = build_manifest()
+        return cls(manifest)
+
+    def __getitem__(self, model_name):
+        if model_name not in self.manifest:
+            raise KeyError(model_name)
+
+        with self.lock:
+            if model_name not in self.models:
+                module_name = self.manifest[model_name]["module"]
+                logger.info("Importing config module \"%s\" of model \"%s\"", module_name, model_name)
+                module = import_module(f"{__package__}.{module_name}")
+                self.models[model_name] = module.SUPPORTED_MODEL[model_name]
+
+        return self.models[model_name]
+
+    def __contains__(self, model_name):
+        return model_name in self.manifest
+
+    def __iter__(self):
+        return iter(self.manifest)
+
+    def __len__(self):
+        return len(self.manifest)
+
+
+if __name__ == "__main__":
+    models_manifest = build_manifest()
+    with open(MANIFEST_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(models_manifest, f, indent=2)
+    print("wrote manifest with", len(models_manifest), "models to", MANIFEST_FILENAME)
@@ -0,0 +1,138 @@
+import inspect
+import logging
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ["torch", "onnx", "onnx-int8"]
+
+
+def scores_to_results(scores: List[List[float]], id2label: Dict[int, str], top_k: int) -> List[List[dict]]:
+    # same output format as the "sentiment-analysis" pipeline with "top_k"
+    results = []
+    for sentence_scores in scores:
+        sentence_results = [
+            {"label": id2label[i], "score": score}
+            for i, score in enumerate(sentence_scores)
+        ]
+        sentence_results.sort(key=lambda r: r["score"], reverse=True)
+        results.append(sentence_results[:top_k])
+    return results
+
+
+def onnx_filename(cache_dir: str, model_name: str, model_version: Optional[str], quantize: bool) -> str:
+    model_dir = os.path.join(
+        cache_dir,
+        model_name.strip("/").replace("/", "--"),
+        model_version if model_version is not None else "local"
+    )
+    return os.path.join(model_dir, "model_int8.onnx" if quantize else "model.onnx")
+
+
+def export_onnx(model, tokenizer, filename: str):
+    import torch
+
+    # inputs in the order of the forward signature, models without token type ids do not get them
+    encoding = tokenizer(["Export"], return_tensors="pt")
+    input_names = [
+        name
+        for name in inspect.signature(model.forward).parameters
+        if name in encoding
+    ]
+    dynamic_axes = {
+        name: {0: "batch", 1: "sequence"}
+        for name in input_names
+    }
+    dynamic_axes["logits"] = {0: "batch"}
+
+    # newer torch versions default to the dynamo exporter, which ignores "dynamic_axes" and
+    # exports to a newer opset, keep the TorchScript exporter
+    export_kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        export_kwargs["dynamo"] = False
+
+    # export to a temporary file first, an interrupted export must not be used on the next start
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    model.eval()
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            ({name: encoding[name] for name in input_names},),
+            filename + ".tmp",
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+            **export_kwargs
+        )
+    os.replace(filename + ".tmp", filename)
+
+
+class OnnxSentimentAnalysis:
+    """
+    Sentiment analysis on CPU with ONNX Runtime, called like the "sentiment-analysis" pipeline.
+
+    Only the tokenizer and config of the transformers model are kept, "nbytes" is the size of the
+    ONNX model used by the model cache.
+    """
+
+    def __init__(self, filename: str, tokenizer, config, top_k: int):
+        import onnxruntime
+
+        self.tokenizer = tokenizer
+        self.config = config
+        self.top_k = top_k
+
+        self.session = onnxruntime.InferenceSession(filename, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.nbytes = os.path.getsize(filename)
+
+    def __call__(self, texts, truncation=False, padding=False, max_length=None, batch_size=1):
+        results = []
+        for i in range(0, len(texts), batch_size):
+            encoding = self.tokenizer(
+                texts[i:i+batch_size], truncation=truncation, padding=True, max_length=max_length, return_tensors="np"
+            )
+            logits = self.session.run(
+                ["logits"],
+                {name: encoding[name].astype(np.int64) for name in self.input_names}
+            )[0]
+
+            if self.config.problem_type == "multi_label_classification" or self.config.num_labels == 1:
+                scores = 1 / (1 + np.exp(-logits))
+            else:
+                exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+                scores = exp / exp.sum(axis=-1, keepdims=True)
+
+            results.extend(scores_to_results(scores.tolist(), self.config.id2label, self.top_k))
+
+        return results
+
+
+def load_onnx_sentiment_analysis(model_name: str, model_version: Optional[str], labels_count: int, quantize: bool, cache_dir: str) -> OnnxSentimentAnalysis:
+    from transformers import AutoConfig, AutoTokenizer
+
+    local_files_only = model_version is None
+    tokenizer = AutoTokenizer.from_pretrained(model_name, revision=model_version, local_files_only=local_files_only)
+    config = AutoConfig.from_pretrained(model_name, revision=model_version, local_files_only=local_files_only)
+
+    filename = onnx_filename(cache_dir, model_name, model_version, quantize)
+    if not os.path.exists(filename):
+        export_filename = onnx_filename(cache_dir, model_name, model_version, False)
+        if not os.path.exists(export_filename):
+            from transformers import AutoModelForSequenceClassification
+            logger.info("Exporting model \"%s\" to ONNX \"%s\"", model_name, export_filename)
+            model = AutoModelForSequenceClassification.from_pretrained(model_name, revision=model_version, local_files_only=local_files_only)
+            export_onnx(model, tokenizer, export_filename)
+
+        if quantize:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            logger.info("Quantizing ONNX model \"%s\" to int8 \"%s\"", export_filename, filename)
+            quantize_dynamic(export_filename, filename + ".tmp", weight_type=QuantType.QInt8)
+            os.replace(filename + ".tmp", filename)
+
+    logger.info("Loading ONNX model \"%s\"", filename)
+    return OnnxSentimentAnalysis(filename, tokenizer, config, labels_count)
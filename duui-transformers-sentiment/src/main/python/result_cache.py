@@ -0,0 +1,81 @@
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SentenceResultCache:
+    """
+    Content-addressed cache of the pipeline results of single sentences.
+
+    Entries are kept in an in-memory LRU of "max_entries" entries, and optionally persisted to an
+    SQLite database that is consulted on memory misses and survives restarts.
+    """
+
+    def __init__(self, max_entries: int, db_filename: Optional[str] = None):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+        self.db = None
+        if db_filename:
+            logger.info("Using sentence result cache database \"%s\"", db_filename)
+            self.db = sqlite3.connect(db_filename, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)")
+            self.db.commit()
+
+    @staticmethod
+    def key(model_name: str, model_version: Optional[str], backend: str, ignore_max_length_truncation_padding: bool, text: str) -> str:
+        # text might contain lone surrogates, see "fix_unicode_problems"
+        text_hash = sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+        return f"{model_name}|{model_version}|{backend}|{ignore_max_length_truncation_padding}|{text_hash}"
+
+    def _remember(self, key: str, result: Any):
+        if self.max_entries <= 0:
+            return
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        found = {}
+        with self.lock:
+            missing = []
+            for key in keys:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    found[key] = self.entries[key]
+                else:
+                    missing.append(key)
+
+            if self.db is not None and missing:
+                # query in chunks to stay below the SQLite variable limit
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i+500]
+                    rows = self.db.execute(
+                        f"SELECT key, result FROM results WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    for key, result in rows:
+                        found[key] = json.loads(result)
+                        self._remember(key, found[key])
+
+        return found
+
+    def put_many(self, items: List[Tuple[str, Any]]):
+        with self.lock:
+            for key, result in items:
+                self._remember(key, result)
+
+            if self.db is not None and items:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                    [(key, json.dumps(result)) for key, result in items]
+                )
+                self.db.commit()
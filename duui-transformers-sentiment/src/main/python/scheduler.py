@@ -0,0 +1,101 @@
+import logging
+from collections import deque
+from concurrent.futures import Future
+from queue import Queue, Empty
+from threading import Thread
+from time import monotonic
+from typing import Any, Callable, Hashable, List
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequest:
+    def __init__(self, key: Hashable, texts: List[str], context: Any):
+        # requests are only merged if their keys are equal, e.g. same model, version and batch size
+        self.key = key
+        self.texts = texts
+        # passed to the batch function, taken from the first request of a batch, so everything that
+        # can differ between requests and changes the results must be part of the key
+        self.context = context
+        self.future = Future()
+
+
+class BatchScheduler:
+    """
+    Collects the sentences of concurrent requests for the same model and runs them as one batch.
+
+    Requests are queued by the request threads and consumed by a single worker thread. After taking
+    a request, the worker waits at most "max_wait_ms" for further requests with the same key until
+    "max_sentences" are collected. A request that alone fills the budget is run immediately.
+
+    The budget counts sentences, not tokens: it only limits how many requests are merged, splitting
+    the merged sentences into model calls by their token length is up to "process_batch".
+    """
+
+    def __init__(self, process_batch: Callable[[Hashable, List[str], Any], List[Any]], max_sentences: int, max_wait_ms: int):
+        self.process_batch = process_batch
+        self.max_sentences = max_sentences
+        self.max_wait = max_wait_ms / 1000
+
+        self.queue = Queue()
+        # requests with other keys or too large for the current batch, run in order in later batches
+        self.pending = deque()
+
+        self.worker = Thread(target=self._run, name="batch-scheduler", daemon=True)
+        self.worker.start()
+
+    def submit(self, key: Hashable, texts: List[str], context: Any) -> Future:
+        request = BatchRequest(key, texts, context)
+        self.queue.put(request)
+        return request.future
+
+    def _collect(self) -> List[BatchRequest]:
+        first = self.pending.popleft() if self.pending else self.queue.get()
+        batch = [first]
+        size = len(first.texts)
+
+        # prefer already waiting requests for the same key
+        for request in list(self.pending):
+            if size >= self.max_sentences:
+                break
+            if request.key == first.key and size + len(request.texts) <= self.max_sentences:
+                self.pending.remove(request)
+                batch.append(request)
+                size += len(request.texts)
+
+        deadline = monotonic() + self.max_wait
+        while size < self.max_sentences:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self.queue.get(timeout=remaining)
+            except Empty:
+                break
+            if request.key != first.key or size + len(request.texts) > self.max_sentences:
+                self.pending.append(request)
+                continue
+            batch.append(request)
+            size += len(request.texts)
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+
+            texts = [text for request in batch for text in request.texts]
+            logger.debug("Running batch of %d sentences from %d requests", len(texts), len(batch))
+
+            try:
+                results = self.process_batch(batch[0].key, texts, batch[0].context)
+            except Exception as ex:
+                for request in batch:
+                    request.future.set_exception(ex)
+                continue
+
+            # route results back to the waiting requests
+            offset = 0
+            for request in batch:
+                request.future.set_result(results[offset:offset+len(request.texts)])
+                offset += len(request.texts)
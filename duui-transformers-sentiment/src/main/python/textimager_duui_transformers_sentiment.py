@@ -1,345 +1,69 @@
 import logging
-from functools import lru_cache
 from itertools import chain
 from platform import python_version
 from sys import version as sys_version
 from threading import Lock
-from time import time
+from time import time, perf_counter
 from typing import Dict, Union
 from datetime import datetime
 
 from cassis import load_typesystem
-from fastapi import FastAPI, Response
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import PlainTextResponse
 import torch
 from transformers import pipeline, __version__ as transformers_version, AutoTokenizer
 
 from .duui.reqres import TextImagerResponse, TextImagerRequest
-from .duui.sentiment import SentimentSentence, SentimentSelection
+from .duui.sentiment import SentimentSentence, SentimentSelection, SentimentCacheStats, SentimentColumns
 from .duui.service import Settings, TextImagerDocumentation, TextImagerCapability
 from .duui.uima import *
-from .models.cardiffnlp_twitter_roberta_base_sentiment import SUPPORTED_MODEL as CARDIFFNLP_TRBS
-from .models.cardiffnlp_twitter_roberta_base_sentiment_latest import SUPPORTED_MODEL as CARDIFFNLP_TRBSL
-from .models.cardiffnlp_twitter_xlm_roberta_base_sentiment import SUPPORTED_MODEL as CARDIFFNLP_TXRBS
-from .models.clampert_multilingual_sentiment_covid19 import SUPPORTED_MODEL as CLAMPERT_MSC19
-from .models.cmarkea_distilcamembert_base_sentiment import SUPPORTED_MODEL as CMARKEA_DBS
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E1
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E3
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E5
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep1_cp35010 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E1
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep2_cp70020 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep3_cp105030 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E3
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep4_cp140040 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_ep5_cp175050 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E5
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp210060 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp420120 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp630180 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E6
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp840240 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E8
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp1050300 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E10
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E1
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E2
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E3
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E4
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E5
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E6
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E7
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E8
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E9
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E10
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E11
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E12
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E13
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E14
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E15
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E16
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E17
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E18
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E19
-#from .models.dbaumartz_cardiffnlp_twitter_xlm_roberta_base_sentiment_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E20
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E1
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E3
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3_2E5
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4193 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E1
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8386 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12579 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E3
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16772 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp20965 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3U_2E5
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25156 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50312 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp75468 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E6
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp100624 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E8
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp125780 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3UAP_2E10
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E1
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E6
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E7
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E8
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E9
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E10
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E11
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E12
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E13
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E14
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E15
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E16
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E17
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E18
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E19
-# from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E20
-# #from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E2
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E3
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E4
-#from .models.dbaumartz_mdraw_german_news_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_MDRAW_GNSBFD3E_2E5
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E1
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E3
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3_2E5
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep1_cp4224 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E1
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep2_cp8448 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep3_cp12672 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E3
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep4_cp16896 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_ep5_cp21120 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E5
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp25342 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp50684 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp76026 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E6
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp101368 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E8
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp126710 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E10
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E1
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E2
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E3
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E4
-#from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E5
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E6
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E7
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E8
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E9
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E10
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E11
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E12
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E13
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E14
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E15
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E16
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E17
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E18
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E19
-# from .models.dbaumartz_oliverguhr_german_sentiment_bert_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E20
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep1_cp35057 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E1
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep2_cp70114 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep3_cp105171 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E3
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep4_cp140228 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_ep5_cp175285 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E5
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep1_cp30870 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E1
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep2_cp61740 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep3_cp92610 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E3
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep4_cp123480 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_ep5_cp154350 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E5
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep2_cp185216 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep4_cp370432 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep6_cp555648 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E6
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep8_cp740864 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E8
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_unseen_adapter_pfeiffer_ep10_cp926080 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E10
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep1_cp30979 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E1
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep2_cp61958 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E2
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep3_cp92937 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E3
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep4_cp123916 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E4
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep5_cp154895 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E5
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep6_cp185874 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E6
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep7_cp216853 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E7
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep8_cp247832 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E8
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep9_cp278811 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E9
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep10_cp309790 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E10
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep11_cp340769 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E11
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep12_cp371748 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E12
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep13_cp402727 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E13
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep14_cp433706 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E14
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep15_cp464685 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E15
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep16_cp495664 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E16
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep17_cp526643 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E17
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep18_cp557622 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E18
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep19_cp588601 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E19
-#from .models.dbaumartz_philschmid_distilbert_base_multilingual_cased_sentiment_2_finetuned_de_3sentiment_2_exact_ep20_cp619580 import SUPPORTED_MODEL as DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E20
-from .models.finiteautomata_bertweet_base_sentiment_analysis import SUPPORTED_MODEL as FINITEAUTOMATA_BBSA
-from .models.j_hartmann_sentiment_roberta_large_english_3_classes import SUPPORTED_MODEL as JHARTMANN_SRLE3C
-from .models.liyuan_amazon_review_sentiment_analysis import SUPPORTED_MODEL as LIYUAN_ARSA
-from .models.mdraw_german_news_sentiment_bert import SUPPORTED_MODEL as MDRAW_GNSB
-from .models.nlptown_bert_base_multilingual_uncased_sentiment import SUPPORTED_MODEL as NLPTOWN_BBMUS
-from .models.oliverguhr_german_sentiment_bert import SUPPORTED_MODEL as OLIVERGUHR_GSB
-from .models.philschmid_distilbert_base_multilingual_cased_sentiment_2 import SUPPORTED_MODEL as PHILSHMID_DBMCS2
-from .models.siebert_sentiment_roberta_large_english import SUPPORTED_MODEL as SIEBERT_SRLE
-
-
-SUPPORTED_MODELS = {
-    **CARDIFFNLP_TRBS,
-    **CARDIFFNLP_TRBSL,
-    **CARDIFFNLP_TXRBS,
-    **NLPTOWN_BBMUS,
-    **FINITEAUTOMATA_BBSA,
-    **SIEBERT_SRLE,
-    **JHARTMANN_SRLE3C,
-    **LIYUAN_ARSA,
-    **PHILSHMID_DBMCS2,
-    **CLAMPERT_MSC19,
-    **OLIVERGUHR_GSB,
-    **MDRAW_GNSB,
-    **CMARKEA_DBS,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E1,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E3,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSFD3_2E5,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E1,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E3,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3U_2E5,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E6,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E8,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3UAP_2E10,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E1,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E2,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E3,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E4,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E5,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E6,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E7,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E8,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E9,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E10,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E11,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E12,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E13,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E14,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E15,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E16,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E17,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E18,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E19,
-    #**DBAUMARTZ_CARDIFFNLP_TXRBSDF3E_2E20,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E1,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E3,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3_2E5,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E1,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E3,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3U_2E5,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E6,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E8,
-    #**DBAUMARTZ_MDRAW_GNSBFD3UAP_2E10,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E1,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E2,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E3,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E4,
-    #**DBAUMARTZ_MDRAW_GNSBFD3E_2E5,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E6,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E7,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E8,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E9,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E10,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E11,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E12,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E13,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E14,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E15,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E16,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E17,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E18,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E19,
-    # **DBAUMARTZ_MDRAW_GNSBFD3E_2E20,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E1,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E3,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3_2E5,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E1,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E3,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3U_2E5,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E6,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E8,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3UAP_2E10,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E1,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E2,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E3,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E4,
-    #**DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E5,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E6,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E7,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E8,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E9,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E10,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E11,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E12,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E13,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E14,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E15,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E16,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E17,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E18,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E19,
-    # **DBAUMARTZ_OLIVERGUHR_GSBFD3E_2E20,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E1,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E3,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3_2E5,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E1,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E3,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3U_2E5,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E6,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E8,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3UAP_2E10,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E1,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E2,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E3,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E4,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E5,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E6,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E7,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E8,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E9,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E10,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E11,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E12,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E13,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E14,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E15,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E16,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E17,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E18,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E19,
-    #**DBAUMARTZ_PHILSCHMID_DBMCS2FD3E_2E20,
-}
+from .adapters import AdapterSentimentAnalysis
+from .batching import token_budget_batches, padded_tokens
+from .metrics import MetricsRegistry
+from .model_cache import ModelCache
+from .onnx_backend import BACKENDS, load_onnx_sentiment_analysis, scores_to_results
+from .result_cache import SentenceResultCache
+from .scheduler import BatchScheduler
+from .models.registry import ModelRegistry
+
 
 settings = Settings()
-supported_languages = sorted(list(set(chain(*[m["languages"] for m in SUPPORTED_MODELS.values()]))))
-lru_cache_with_size = lru_cache(maxsize=settings.textimager_duui_transformers_sentiment_model_cache_size)
+model_cache = ModelCache(
+    settings.textimager_duui_transformers_sentiment_model_cache_max_mb * 1024 * 1024,
+    settings.textimager_duui_transformers_sentiment_model_cache_size
+)
 model_lock = Lock()
 
+# seconds per processing phase, "lock_wait" is the time waiting for the model lock
+metrics = MetricsRegistry()
+phase_seconds = metrics.histogram(
+    "duui_sentiment_phase_seconds",
+    "Time spent in each phase of processing a request",
+    [0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+)
+sentences_total = metrics.counter("duui_sentiment_sentences_total", "Sentences run through a model")
+tokens_total = metrics.counter("duui_sentiment_tokens_total", "Tokens run through a model, only counted with length sorted batching")
+sentences_per_second = metrics.histogram(
+    "duui_sentiment_sentences_per_second",
+    "Model throughput in sentences per second of inference time",
+    [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+)
+tokens_per_second = metrics.histogram(
+    "duui_sentiment_tokens_per_second",
+    "Model throughput in tokens per second of inference time",
+    [100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000]
+)
+
 logging.basicConfig(level=settings.textimager_duui_transformers_sentiment_log_level)
 logger = logging.getLogger(__name__)
 logger.info("TTLab TextImager DUUI Transformers Sentiment")
 logger.info("Name: %s", settings.textimager_duui_transformers_sentiment_annotator_name)
 logger.info("Version: %s", settings.textimager_duui_transformers_sentiment_annotator_version)
 
+SUPPORTED_MODELS = ModelRegistry.load()
+supported_languages = sorted(list(set(chain(*[m["languages"] for m in SUPPORTED_MODELS.manifest.values()]))))
+logger.info("Supported models: %d", len(SUPPORTED_MODELS))
+
 device = 0 if torch.cuda.is_available() else -1
 logger.info(f'USING {device}')
 
@@ -377,6 +101,13 @@ app = FastAPI(
 )
 
 
+@app.middleware("http")
+async def track_received_time(request: Request, call_next):
+    # used to measure the time to receive and parse the request
+    request.state.received_time = perf_counter()
+    return await call_next(request)
+
+
 @app.get("/v1/communication_layer", response_class=PlainTextResponse)
 def get_communication_layer() -> str:
     return lua_communication_script
@@ -401,7 +132,7 @@ def get_documentation() -> TextImagerDocumentation:
         },
         docker_container_id="[TODO]",
         parameters={
-            "model_name": SUPPORTED_MODELS,
+            "model_name": SUPPORTED_MODELS.manifest,
         },
         capability=capabilities,
         implementation_specific=None,
@@ -410,6 +141,16 @@ def get_documentation() -> TextImagerDocumentation:
     return documentation
 
 
+@app.get("/v1/model_cache")
+def get_model_cache() -> dict:
+    return model_cache.stats()
+
+
+@app.get("/v1/metrics", response_class=PlainTextResponse)
+def get_metrics() -> str:
+    return metrics.render()
+
+
 @app.get("/v1/typesystem")
 def get_typesystem() -> Response:
     xml = typesystem.to_xml()
@@ -429,10 +170,14 @@ def clean_cuda_cache():
 
 
 @app.post("/v1/process")
-def post_process(request: TextImagerRequest) -> TextImagerResponse:
+def post_process(request: TextImagerRequest, http_request: Request) -> TextImagerResponse:
+    start_time = perf_counter()
+    phase_seconds.observe(start_time - http_request.state.received_time, phase="parse")
+
     processed_selections = []
     meta = None
     modification_meta = None
+    cache_stats = None
 
     clean_cuda_cache()
 
@@ -444,32 +189,49 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
         logger.debug("Received:")
         logger.debug(request)
 
-        if request.model_name not in SUPPORTED_MODELS:
-            raise Exception(f"Model \"{request.model_name}\" is not supported!")
-
-        if request.lang not in SUPPORTED_MODELS[request.model_name]["languages"]:
-            raise Exception(f"Document language \"{request.lang}\" is not supported by model \"{request.model_name}\"!")
-
-        logger.info("Using model: \"%s\"", request.model_name)
-        model_data = SUPPORTED_MODELS[request.model_name]
-        logger.debug(model_data)
-
-        for selection in request.selections:
-            processed_sentences = process_selection(request.model_name, model_data, selection, request.doc_len, request.batch_size, request.ignore_max_length_truncation_padding)
-
-            processed_selections.append(
-                SentimentSelection(
-                    selection=selection.selection,
-                    sentences=processed_sentences
+        model_names = request.model_names if request.model_names else [request.model_name]
+        for model_name in model_names:
+            if model_name not in SUPPORTED_MODELS:
+                raise Exception(f"Model \"{model_name}\" is not supported!")
+
+            if request.lang not in SUPPORTED_MODELS.manifest[model_name]["languages"]:
+                raise Exception(f"Document language \"{request.lang}\" is not supported by model \"{model_name}\"!")
+
+        if request.model_names:
+            # sweep mode: run all models on the same tokenized sentences, "model_name" is not used
+            logger.info("Sweeping models: %s", request.model_names)
+            for selection in request.selections:
+                sweep_results = process_selection_sweep(request.model_names, selection, request.doc_len, request.batch_size, request.ignore_max_length_truncation_padding)
+                for model_name, processed_sentences in sweep_results.items():
+                    processed_selections.append(
+                        create_selection(
+                            selection.selection,
+                            processed_sentences,
+                            request.columnar,
+                            meta=create_annotation_meta(model_name, SUPPORTED_MODELS[model_name])
+                        )
+                    )
+
+            # the first model is used for the meta data of all results without own meta data
+            meta = create_annotation_meta(request.model_names[0], SUPPORTED_MODELS[request.model_names[0]])
+        else:
+            logger.info("Using model: \"%s\"", request.model_name)
+            model_data = SUPPORTED_MODELS[request.model_name]
+            logger.debug(model_data)
+
+            cache_stats = SentimentCacheStats(hits=0, misses=0)
+            for selection in request.selections:
+                processed_sentences = process_selection(request.model_name, model_data, selection, request.doc_len, request.batch_size, request.ignore_max_length_truncation_padding, cache_stats)
+
+                processed_selections.append(
+                    create_selection(
+                        selection.selection,
+                        processed_sentences,
+                        request.columnar
+                    )
                 )
-            )
 
-        meta = UimaAnnotationMeta(
-            name=settings.textimager_duui_transformers_sentiment_annotator_name,
-            version=settings.textimager_duui_transformers_sentiment_annotator_version,
-            modelName=request.model_name,
-            modelVersion=model_data["version"],
-        )
+            meta = create_annotation_meta(request.model_name, model_data)
 
         modification_meta_comment = f"{settings.textimager_duui_transformers_sentiment_annotator_name} ({settings.textimager_duui_transformers_sentiment_annotator_version})"
         modification_meta = UimaDocumentModification(
@@ -485,6 +247,8 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
     for ps in processed_selections:
         for s in ps.sentences:
             logger.debug(s)
+        if ps.columns is not None:
+            logger.debug(ps.columns)
 
     dte = datetime.now()
     print(dte, 'Finished processing', flush=True)
@@ -492,31 +256,79 @@ def post_process(request: TextImagerRequest) -> TextImagerResponse:
 
     clean_cuda_cache()
 
-    return TextImagerResponse(
+    response = TextImagerResponse(
         selections=processed_selections,
         meta=meta,
-        modification_meta=modification_meta
+        modification_meta=modification_meta,
+        cache_stats=cache_stats
     )
 
+    if request.columnar:
+        # encode directly, the generic encoder of fastapi walks every list element
+        response = Response(content=response.json(), media_type="application/json")
 
-@lru_cache_with_size
-def load_model(model_name, model_version, labels_count, adapter_path=None):
+    phase_seconds.observe(perf_counter() - start_time, phase="total")
+
+    return response
+
+
+def create_selection(selection_name, processed_sentences, columnar, meta=None) -> SentimentSelection:
+    if not columnar:
+        return SentimentSelection(
+            selection=selection_name,
+            sentences=processed_sentences,
+            meta=meta
+        )
+
+    labels = []
+    for s in processed_sentences:
+        for label in s.details:
+            if label not in labels:
+                labels.append(label)
+
+    # models are trusted to return correct values, skip validating every array element
+    columns = SentimentColumns.construct(
+        begin=[s.sentence.begin for s in processed_sentences],
+        end=[s.sentence.end for s in processed_sentences],
+        sentiment=[s.sentiment for s in processed_sentences],
+        score=[s.score for s in processed_sentences],
+        polarity=[s.polarity for s in processed_sentences],
+        pos=[s.pos for s in processed_sentences],
+        neu=[s.neu for s in processed_sentences],
+        neg=[s.neg for s in processed_sentences],
+        labels=labels,
+        details=[
+            [s.details.get(label) for s in processed_sentences]
+            for label in labels
+        ]
+    )
+
+    return SentimentSelection(
+        selection=selection_name,
+        sentences=[],
+        columns=columns,
+        meta=meta
+    )
+
+
+def create_annotation_meta(model_name, model_data) -> UimaAnnotationMeta:
+    return UimaAnnotationMeta(
+        name=settings.textimager_duui_transformers_sentiment_annotator_name,
+        version=settings.textimager_duui_transformers_sentiment_annotator_version,
+        modelName=model_name,
+        modelVersion=model_data["version"],
+    )
+
+
+@model_cache.cached
+def load_model(model_name, model_version, labels_count):
     mo = model_name
     to = model_name
 
-    # manually load model if:
-    # model is local path, not on huggingface hub
-    # or adapter is used
-    if model_version is None or adapter_path is not None:
-        if adapter_path is None:
-            from transformers import AutoModelForSequenceClassification
-            mo = AutoModelForSequenceClassification.from_pretrained(model_name, revision=model_version, local_files_only=True)
-        else:
-            from transformers import AutoAdapterModel
-            mo = AutoAdapterModel.from_pretrained(model_name, revision=model_version, local_files_only=True)
-            adapter_name = mo.load_adapter(adapter_path)
-            mo.set_active_adapters(adapter_name)
-
+    # manually load model if model is local path, not on huggingface hub
+    if model_version is None:
+        from transformers import AutoModelForSequenceClassification
+        mo = AutoModelForSequenceClassification.from_pretrained(model_name, revision=model_version, local_files_only=True)
         to = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
 
     return pipeline(
@@ -529,6 +341,22 @@ def load_model(model_name, model_version, labels_count, adapter_path=None):
     )
 
 
+@model_cache.cached
+def load_adapter_base_model(model_name, model_version):
+    # one base model instance is shared by all adapters on top of it
+    from transformers import AutoAdapterModel
+    mo = AutoAdapterModel.from_pretrained(model_name, revision=model_version, local_files_only=True)
+    to = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+
+    return AdapterSentimentAnalysis(pipeline(
+        "sentiment-analysis",
+        model=mo,
+        tokenizer=to,
+        revision=model_version,
+        device=device
+    ))
+
+
 def map_sentiment(sentiment_result: List[Dict[str, Union[str, float]]], sentiment_mapping: Dict[str, float], sentiment_polarity: Dict[str, List[str]], sentence: UimaSentence) -> SentimentSentence:
     # get label from top result and map to sentiment values -1, 0 or 1
     sentiment_value = 0.0
@@ -574,47 +402,193 @@ def fix_unicode_problems(text):
     return clean_text
 
 
-def process_selection(model_name, model_data, selection, doc_len, batch_size, ignore_max_length_truncation_padding):
-    for s in selection.sentences:
-        s.text = fix_unicode_problems(s.text)
+@model_cache.cached
+def load_onnx_model(model_name, model_version, labels_count, quantize):
+    return load_onnx_sentiment_analysis(
+        model_name,
+        model_version,
+        labels_count,
+        quantize,
+        settings.textimager_duui_transformers_sentiment_onnx_cache_dir
+    )
 
-    texts = [
-        model_data["preprocess"](s.text)
-        for s in selection.sentences
-    ]
-    logger.debug("Preprocessed texts:")
-    logger.debug(texts)
 
-    with model_lock:
-        model_type = "huggingface" if not "type" in model_data else model_data["type"]
+def get_backend(model_data):
+    backend = model_data.get("backend", settings.textimager_duui_transformers_sentiment_backend)
+    if backend not in BACKENDS:
+        raise Exception(f"Backend \"{backend}\" is not supported!")
+    return backend
+
+
+def get_sentiment_analysis(model_name, model_data):
+    model_type = "huggingface" if not "type" in model_data else model_data["type"]
+    backend = get_backend(model_data)
+    if backend != "torch":
+        if model_type == "adapter":
+            raise Exception(f"Backend \"{backend}\" does not support adapter model \"{model_name}\"!")
+        quantize = backend == "onnx-int8"
         if model_type == "local":
-            sentiment_analysis = load_model(model_data["path"], None, len(model_data["mapping"]))
-        elif model_type == "adapter":
-            adapter_model_type = "huggingface" if not "type" in model_data else model_data["type"]
-            adapter_path = model_data["adapter_path"]
-            if adapter_model_type == "local":
-                sentiment_analysis = load_model(model_data["model_path"], None, len(model_data["mapping"]), adapter_path)
-            else:
-                sentiment_analysis = load_model(model_data["model_name"], model_data["model_version"], len(model_data["mapping"]), adapter_path)
+            return load_onnx_model(model_data["path"], None, len(model_data["mapping"]), quantize)
+        return load_onnx_model(model_name, model_data["version"], len(model_data["mapping"]), quantize)
+    elif model_type == "local":
+        return load_model(model_data["path"], None, len(model_data["mapping"]))
+    elif model_type == "adapter":
+        adapter_model_type = "huggingface" if not "model_type" in model_data else model_data["model_type"]
+        if adapter_model_type == "local":
+            base_model = load_adapter_base_model(model_data["model_path"], None)
         else:
-            sentiment_analysis = load_model(model_name, model_data["version"], len(model_data["mapping"]))
+            base_model = load_adapter_base_model(model_data["model_name"], model_data["model_version"])
+        return base_model.activate(model_data["adapter_path"], len(model_data["mapping"]))
+    else:
+        return load_model(model_name, model_data["version"], len(model_data["mapping"]))
 
-        if ignore_max_length_truncation_padding:
-            results = sentiment_analysis(
-                texts, batch_size=batch_size
-            )
+
+def run_sentiment_analysis(key, texts, context):
+    model_name, _, _, ignore_max_length_truncation_padding, batch_size = key
+    model_data = context
+
+    if not texts:
+        return []
+
+    lock_wait_start = perf_counter()
+    with model_lock:
+        phase_seconds.observe(perf_counter() - lock_wait_start, phase="lock_wait")
+
+        with phase_seconds.time(phase="load_model"):
+            sentiment_analysis = get_sentiment_analysis(model_name, model_data)
+
+        if settings.textimager_duui_transformers_sentiment_batch_max_tokens <= 0:
+            inference_start = perf_counter()
+            results = call_sentiment_analysis(sentiment_analysis, texts, model_data, batch_size, ignore_max_length_truncation_padding)
+            observe_inference(perf_counter() - inference_start, len(texts))
+            return results
+
+        # sort by token length and batch by padded tokens to avoid padding short sentences to the longest one
+        with phase_seconds.time(phase="tokenize"):
+            if ignore_max_length_truncation_padding:
+                encodings = sentiment_analysis.tokenizer(texts)
+            else:
+                encodings = sentiment_analysis.tokenizer(texts, truncation=True, max_length=model_data["max_length"])
+            lengths = [len(ids) for ids in encodings["input_ids"]]
+            batches = token_budget_batches(lengths, settings.textimager_duui_transformers_sentiment_batch_max_tokens, batch_size)
+        if logger.isEnabledFor(logging.DEBUG):
+            document_order_batches = [
+                list(range(i, min(i+batch_size, len(lengths))))
+                for i in range(0, len(lengths), batch_size)
+            ]
+            logger.debug("Padded tokens: %d sorted, %d in document order", padded_tokens(lengths, batches), padded_tokens(lengths, document_order_batches))
+
+        inference_start = perf_counter()
+        results = [None] * len(texts)
+        for batch in batches:
+            batch_results = call_sentiment_analysis(sentiment_analysis, [texts[i] for i in batch], model_data, len(batch), ignore_max_length_truncation_padding)
+            for i, r in zip(batch, batch_results):
+                results[i] = r
+        observe_inference(perf_counter() - inference_start, len(texts), sum(lengths))
+
+        return results
+
+
+def observe_inference(seconds, sentences_count, tokens_count=None):
+    phase_seconds.observe(seconds, phase="inference")
+    sentences_total.inc(sentences_count)
+    if seconds > 0:
+        sentences_per_second.observe(sentences_count / seconds)
+    if tokens_count is not None:
+        tokens_total.inc(tokens_count)
+        if seconds > 0:
+            tokens_per_second.observe(tokens_count / seconds)
+
+
+def call_sentiment_analysis(sentiment_analysis, texts, model_data, batch_size, ignore_max_length_truncation_padding):
+    if ignore_max_length_truncation_padding:
+        return sentiment_analysis(
+            texts, batch_size=batch_size
+        )
+    else:
+        return sentiment_analysis(
+            texts, truncation=True, padding=True, max_length=model_data["max_length"], batch_size=batch_size
+        )
+
+
+result_cache = None
+if settings.textimager_duui_transformers_sentiment_result_cache_size > 0 or settings.textimager_duui_transformers_sentiment_result_cache_db:
+    result_cache = SentenceResultCache(
+        settings.textimager_duui_transformers_sentiment_result_cache_size,
+        settings.textimager_duui_transformers_sentiment_result_cache_db
+    )
+
+batch_scheduler = None
+if settings.textimager_duui_transformers_sentiment_batch_max_sentences > 0:
+    batch_scheduler = BatchScheduler(
+        run_sentiment_analysis,
+        settings.textimager_duui_transformers_sentiment_batch_max_sentences,
+        settings.textimager_duui_transformers_sentiment_batch_max_wait_ms
+    )
+
+
+def process_selection(model_name, model_data, selection, doc_len, batch_size, ignore_max_length_truncation_padding, cache_stats):
+    with phase_seconds.time(phase="preprocess"):
+        for s in selection.sentences:
+            s.text = fix_unicode_problems(s.text)
+
+        texts = [
+            model_data["preprocess"](s.text)
+            for s in selection.sentences
+        ]
+    logger.debug("Preprocessed texts:")
+    logger.debug(texts)
+
+    # only requests with equal model and settings can share a batch
+    backend = get_backend(model_data)
+    key = (model_name, model_data["version"], backend, ignore_max_length_truncation_padding, batch_size)
+    context = model_data
+
+    # only sentences not in the cache are sent to the model, each unique sentence once
+    with phase_seconds.time(phase="cache"):
+        cache_keys = [
+            SentenceResultCache.key(model_name, model_data["version"], backend, ignore_max_length_truncation_padding, text)
+            for text in texts
+        ]
+        cached_results = result_cache.get_many(cache_keys) if result_cache is not None else {}
+        missing_texts = {}
+        for cache_key, text in zip(cache_keys, texts):
+            if cache_key not in cached_results and cache_key not in missing_texts:
+                missing_texts[cache_key] = text
+
+    cache_stats.hits += len(texts) - len(missing_texts)
+    cache_stats.misses += len(missing_texts)
+
+    if missing_texts:
+        if batch_scheduler is not None:
+            missing_results = batch_scheduler.submit(key, list(missing_texts.values()), context).result()
         else:
-            results = sentiment_analysis(
-                texts, truncation=True, padding=True, max_length=model_data["max_length"], batch_size=batch_size
-            )
+            missing_results = run_sentiment_analysis(key, list(missing_texts.values()), context)
+
+        new_results = list(zip(missing_texts.keys(), missing_results))
+        cached_results.update(new_results)
+        if result_cache is not None:
+            result_cache.put_many(new_results)
 
-    processed_sentences = [
-        map_sentiment(r, model_data["mapping"], model_data["3sentiment"], s)
-        for s, r
-        in zip(selection.sentences, results)
+    results = [
+        cached_results[cache_key]
+        for cache_key in cache_keys
     ]
 
+    return map_selection(results, model_data, selection, doc_len)
+
+
+def map_selection(results, model_data, selection, doc_len):
+    with phase_seconds.time(phase="map_sentiment"):
+        processed_sentences = [
+            map_sentiment(r, model_data["mapping"], model_data["3sentiment"], s)
+            for s, r
+            in zip(selection.sentences, results)
+        ]
+
     if len(results) > 1:
+        aggregation_start = perf_counter()
+
         begin = 0
         end = doc_len
 
@@ -674,4 +648,116 @@ def process_selection(model_name, model_data, selection, doc_len, batch_size, ig
             )
         )
 
+        phase_seconds.observe(perf_counter() - aggregation_start, phase="aggregate")
+
     return processed_sentences
+
+
+def process_selection_sweep(model_names, selection, doc_len, batch_size, ignore_max_length_truncation_padding):
+    models_data = {
+        model_name: SUPPORTED_MODELS[model_name]
+        for model_name in model_names
+    }
+    for model_name, model_data in models_data.items():
+        if get_backend(model_data) != "torch":
+            raise Exception(f"Model \"{model_name}\" does not use the torch backend, can not be used in a sweep!")
+        # the sweep runs the bare model, without the adapter and its prediction head
+        model_type = "huggingface" if not "type" in model_data else model_data["type"]
+        if model_type == "adapter":
+            raise Exception(f"Model \"{model_name}\" is an adapter model, can not be used in a sweep!")
+
+    with phase_seconds.time(phase="preprocess"):
+        for s in selection.sentences:
+            s.text = fix_unicode_problems(s.text)
+
+        texts = None
+        for model_name, model_data in models_data.items():
+            model_texts = [
+                model_data["preprocess"](s.text)
+                for s in selection.sentences
+            ]
+            if texts is None:
+                texts = model_texts
+            elif model_texts != texts:
+                raise Exception(f"Model \"{model_name}\" uses a different preprocessing than \"{model_names[0]}\", can not be used in one sweep!")
+
+    if not texts:
+        return {
+            model_name: map_selection([], model_data, selection, doc_len)
+            for model_name, model_data in models_data.items()
+        }
+
+    max_length = min(model_data["max_length"] for model_data in models_data.values())
+
+    # tokenize once with the tokenizer of the first model, all models must use an equal tokenizer
+    lock_wait_start = perf_counter()
+    with model_lock:
+        phase_seconds.observe(perf_counter() - lock_wait_start, phase="lock_wait")
+        with phase_seconds.time(phase="load_model"):
+            tokenizer = get_sentiment_analysis(model_names[0], models_data[model_names[0]]).tokenizer
+
+    with phase_seconds.time(phase="tokenize"):
+        if ignore_max_length_truncation_padding:
+            lengths = [len(ids) for ids in tokenizer(texts)["input_ids"]]
+        else:
+            lengths = [len(ids) for ids in tokenizer(texts, truncation=True, max_length=max_length)["input_ids"]]
+
+        if settings.textimager_duui_transformers_sentiment_batch_max_tokens > 0:
+            batches = token_budget_batches(lengths, settings.textimager_duui_transformers_sentiment_batch_max_tokens, batch_size)
+        else:
+            batches = [
+                list(range(i, min(i+batch_size, len(texts))))
+                for i in range(0, len(texts), batch_size)
+            ]
+
+        encodings = []
+        for batch in batches:
+            batch_texts = [texts[i] for i in batch]
+            if ignore_max_length_truncation_padding:
+                encodings.append(tokenizer(batch_texts, padding=True, return_tensors="pt"))
+            else:
+                encodings.append(tokenizer(batch_texts, truncation=True, padding=True, max_length=max_length, return_tensors="pt"))
+
+    # run each model once over all batches, to load every model only once
+    processed_selections = {}
+    for model_name, model_data in models_data.items():
+        lock_wait_start = perf_counter()
+        with model_lock:
+            phase_seconds.observe(perf_counter() - lock_wait_start, phase="lock_wait")
+
+            with phase_seconds.time(phase="load_model"):
+                sentiment_analysis = get_sentiment_analysis(model_name, model_data)
+            check_sweep_tokenizer(tokenizer, sentiment_analysis.tokenizer, model_names[0], model_name)
+
+            inference_start = perf_counter()
+            results = [None] * len(texts)
+            for batch, encoding in zip(batches, encodings):
+                batch_results = classify_encoding(sentiment_analysis.model, encoding, len(model_data["mapping"]))
+                for i, r in zip(batch, batch_results):
+                    results[i] = r
+            observe_inference(perf_counter() - inference_start, len(texts), sum(lengths))
+
+        processed_selections[model_name] = map_selection(results, model_data, selection, doc_len)
+
+    return processed_selections
+
+
+def check_sweep_tokenizer(tokenizer, other_tokenizer, model_name, other_model_name):
+    # tokenizers of checkpoints of the same base model only differ in their path
+    if type(tokenizer) != type(other_tokenizer) \
+            or len(tokenizer) != len(other_tokenizer) \
+            or tokenizer.all_special_ids != other_tokenizer.all_special_ids:
+        raise Exception(f"Model \"{other_model_name}\" uses a different tokenizer than \"{model_name}\", can not be used in one sweep!")
+
+
+def classify_encoding(model, encoding, top_k):
+    # same output as the "sentiment-analysis" pipeline, but on already tokenized input
+    with torch.no_grad():
+        logits = model(**encoding.to(model.device)).logits
+
+    if model.config.problem_type == "multi_label_classification" or model.config.num_labels == 1:
+        scores = torch.sigmoid(logits)
+    else:
+        scores = torch.softmax(logits, dim=-1)
+
+    return scores_to_results(scores.cpu().tolist(), model.config.id2label, top_k)
@@ -0,0 +1,119 @@
+package org.hucompute.textimager.uima.transformers.sentiment;
+
+import de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence;
+import org.apache.uima.UIMAException;
+import org.apache.uima.fit.factory.JCasFactory;
+import org.apache.uima.fit.util.JCasUtil;
+import org.apache.uima.jcas.JCas;
+import org.hucompute.textimager.uima.type.CategorizedSentiment;
+import org.hucompute.textimager.uima.type.Sentiment;
+import org.junit.jupiter.api.*;
+import org.texttechnologylab.DockerUnifiedUIMAInterface.DUUIComposer;
+import org.texttechnologylab.DockerUnifiedUIMAInterface.driver.DUUIRemoteDriver;
+import org.texttechnologylab.DockerUnifiedUIMAInterface.lua.DUUILuaContext;
+import org.texttechnologylab.annotation.AnnotationComment;
+
+import java.io.IOException;
+import java.net.URISyntaxException;
+import java.net.UnknownHostException;
+import java.util.*;
+import java.util.stream.Collectors;
+
+import static org.junit.jupiter.api.Assertions.assertArrayEquals;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+
+public class ColumnarResponseTest {
+    static DUUIComposer composer;
+    static JCas cas;
+
+    static String url = "http://127.0.0.1:9714";
+    static String model = "cardiffnlp/twitter-roberta-base-sentiment";
+
+    static List<String> sentences = Arrays.asList(
+            "This is a very great example sentence!",
+            "I absolutely hate this example.",
+            "This is an example."
+    );
+
+    @BeforeAll
+    static void beforeAll() throws URISyntaxException, IOException, UIMAException {
+        composer = new DUUIComposer()
+                .withSkipVerification(true)
+                .withLuaContext(new DUUILuaContext().withJsonLibrary());
+
+        DUUIRemoteDriver remoteDriver = new DUUIRemoteDriver();
+        composer.addDriver(remoteDriver);
+
+        cas = JCasFactory.createJCas();
+    }
+
+    @AfterAll
+    static void afterAll() throws UnknownHostException {
+        composer.shutdown();
+    }
+
+    @AfterEach
+    public void afterEach() {
+        composer.resetPipeline();
+        cas.reset();
+    }
+
+    public void createCas(String language, List<String> sentences) {
+        cas.setDocumentLanguage(language);
+
+        StringBuilder sb = new StringBuilder();
+        for (String sentence : sentences) {
+            Sentence sentenceAnnotation = new Sentence(cas, sb.length(), sb.length()+sentence.length());
+            sentenceAnnotation.addToIndexes();
+            sb.append(sentence).append(" ");
+        }
+
+        cas.setDocumentText(sb.toString());
+    }
+
+    public List<String> runSentiments(boolean columnar) throws Exception {
+        composer.resetPipeline();
+        cas.reset();
+
+        composer.add(
+                new DUUIRemoteDriver.Component(url)
+                        .withParameter("model_name", model)
+                        .withParameter("selection", "de.tudarmstadt.ukp.dkpro.core.api.segmentation.type.Sentence")
+                        .withParameter("columnar", String.valueOf(columnar))
+        );
+
+        createCas("en", sentences);
+        composer.run(cas);
+
+        List<String> results = new ArrayList<>();
+        for (Sentiment sentiment : JCasUtil.select(cas, Sentiment.class)) {
+            if (sentiment instanceof CategorizedSentiment) {
+                CategorizedSentiment categorized = (CategorizedSentiment) sentiment;
+                results.add(String.format("categorized %d %d %f %f %f %f", categorized.getBegin(), categorized.getEnd(), categorized.getSentiment(), categorized.getPos(), categorized.getNeu(), categorized.getNeg()));
+            }
+            else {
+                results.add(String.format("sentiment %d %d %f", sentiment.getBegin(), sentiment.getEnd(), sentiment.getSentiment()));
+            }
+        }
+
+        results.addAll(JCasUtil.select(cas, AnnotationComment.class)
+                .stream()
+                .filter(c -> !c.getKey().equals("sentiment_ref"))
+                .map(c -> c.getKey() + "=" + c.getValue())
+                .sorted()
+                .collect(Collectors.toList()));
+
+        return results;
+    }
+
+    @Test
+    public void columnarEqualsSentencesTest() throws Exception {
+        List<String> expected = runSentiments(false);
+        List<String> actual = runSentiments(true);
+
+        // 1 sentiment and 1 categorized sentiment per sentence, +1 each for average
+        assertEquals(2*(sentences.size()+1), expected.stream().filter(r -> !r.contains("=")).count());
+
+        assertArrayEquals(expected.toArray(), actual.toArray());
+    }
+}
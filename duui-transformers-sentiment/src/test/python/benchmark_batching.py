@@ -0,0 +1,67 @@
+"""
+Compares padded tokens and inference time of batches in document order with length sorted batches
+bounded by padded tokens, on a synthetic corpus of mixed sentence lengths and a small randomly
+initialised BERT model.
+
+Run from the component root: python src/test/python/benchmark_batching.py
+"""
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+import torch
+from transformers import BertConfig, BertForSequenceClassification
+
+sys.path.insert(0, str(Path(__file__).parents[3]))
+from src.main.python.batching import token_budget_batches, padded_tokens
+
+BATCH_SIZE = 128
+MAX_TOKENS = 16384
+SENTENCES = 2000
+
+
+def run(model, lengths, batches):
+    start = perf_counter()
+    with torch.no_grad():
+        for batch in batches:
+            max_length = max(lengths[i] for i in batch)
+            input_ids = torch.zeros((len(batch), max_length), dtype=torch.long)
+            attention_mask = torch.zeros((len(batch), max_length), dtype=torch.long)
+            for row, i in enumerate(batch):
+                input_ids[row, :lengths[i]] = torch.randint(1, 1000, (lengths[i],))
+                attention_mask[row, :lengths[i]] = 1
+            model(input_ids=input_ids, attention_mask=attention_mask)
+    return perf_counter() - start
+
+
+def main():
+    random.seed(0)
+    torch.manual_seed(0)
+    torch.set_num_threads(1)
+
+    # mostly short sentences with some long ones, as in tweets or news
+    lengths = [
+        random.randint(5, 30) if random.random() < 0.9 else random.randint(100, 512)
+        for _ in range(SENTENCES)
+    ]
+
+    model = BertForSequenceClassification(BertConfig(
+        vocab_size=1000, hidden_size=128, num_hidden_layers=2, num_attention_heads=2,
+        intermediate_size=256, max_position_embeddings=512, num_labels=3
+    )).eval()
+
+    document_order = [
+        list(range(i, min(i+BATCH_SIZE, len(lengths))))
+        for i in range(0, len(lengths), BATCH_SIZE)
+    ]
+    sorted_batches = token_budget_batches(lengths, MAX_TOKENS, BATCH_SIZE)
+
+    print(f"{SENTENCES} sentences, {sum(lengths)} real tokens")
+    for name, batches in [("document order", document_order), ("sorted by length", sorted_batches)]:
+        seconds = run(model, lengths, batches)
+        print(f"{name:>16}: {len(batches):4d} batches, {padded_tokens(lengths, batches):8d} padded tokens, {seconds:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
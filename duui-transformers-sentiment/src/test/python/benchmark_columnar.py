@@ -0,0 +1,98 @@
+"""
+Encoding and decoding time and size of the per-sentence and the columnar response of one selection of 50000
+sentences with 3 labels. Encoding is what the service does after inference: the per-sentence response goes through
+the generic encoder of fastapi and json.dumps, the columnar response is serialized by pydantic directly. Decoding
+parses the JSON and reads every annotation like the Lua script does.
+
+Run from the component root: python src/test/python/benchmark_columnar.py
+"""
+import json
+import os
+import random
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import COMPONENT_ROOT, selection_annotations, tiny_model_data
+
+SENTENCES = 50000
+LABELS = ["positive", "neutral", "negative"]
+REPEAT = 3
+
+
+def import_service():
+    os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_NAME", "benchmark")
+    os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_VERSION", "benchmark")
+    os.environ.setdefault("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_SIZE", "1")
+    os.chdir(COMPONENT_ROOT)
+    from src.main.python import textimager_duui_transformers_sentiment
+    return textimager_duui_transformers_sentiment
+
+
+def processed_sentences(service):
+    from src.main.python.duui.uima import UimaSentence, UimaSentenceSelection
+
+    random.seed(0)
+    sentences, results = [], []
+    for i in range(SENTENCES):
+        sentences.append(UimaSentence(text="", begin=i * 100, end=i * 100 + 99))
+        scores = [random.random() for _ in LABELS]
+        results.append(sorted(
+            ({"label": label, "score": score / sum(scores)} for label, score in zip(LABELS, scores)),
+            key=lambda r: -r["score"]
+        ))
+    selection = UimaSentenceSelection(selection="text", sentences=sentences)
+    return service.map_selection(results, tiny_model_data("unused"), selection, SENTENCES * 100)
+
+
+def encode(service, sentences, columnar):
+    from fastapi.encoders import jsonable_encoder
+
+    response = service.TextImagerResponse(
+        selections=[service.create_selection("text", sentences, columnar)],
+        meta=None,
+        modification_meta=None,
+        cache_stats=None
+    )
+    if columnar:
+        return response.json().encode("utf-8")
+    # what fastapi does with a returned model
+    return json.dumps(jsonable_encoder(response), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode(content):
+    return [
+        annotation
+        for selection in json.loads(content)["selections"]
+        for annotation in selection_annotations(selection)
+    ]
+
+
+def best_of(function):
+    durations = []
+    for _ in range(REPEAT):
+        start = perf_counter()
+        result = function()
+        durations.append(perf_counter() - start)
+    return min(durations), result
+
+
+def main():
+    service = import_service()
+    sentences = processed_sentences(service)
+
+    annotations = {}
+    for columnar in [False, True]:
+        encode_seconds, content = best_of(lambda: encode(service, sentences, columnar))
+        decode_seconds, annotations[columnar] = best_of(lambda: decode(content))
+        print(
+            f"{'columnar' if columnar else 'per sentence'}: encode {encode_seconds:.2f} s, "
+            f"decode {decode_seconds:.2f} s, {len(content) / 1024 / 1024:.1f} MB"
+        )
+
+    assert annotations[True] == annotations[False]
+
+
+if __name__ == "__main__":
+    main()
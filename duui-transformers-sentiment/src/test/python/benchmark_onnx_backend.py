@@ -0,0 +1,88 @@
+"""
+Compares accuracy and latency of the torch, onnx and onnx-int8 backends on a small randomly
+initialised local BERT checkpoint and synthetic sentences.
+
+Run from the component root: python src/test/python/benchmark_onnx_backend.py
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import torch
+import transformers
+
+sys.path.insert(0, str(Path(__file__).parents[3]))
+sys.path.insert(0, str(Path(__file__).parent))
+from conftest import VOCAB
+from src.main.python.onnx_backend import load_onnx_sentiment_analysis
+
+SENTENCES = 512
+BATCH_SIZE = 32
+RUNS = 3
+
+
+def create_checkpoint(model_dir: Path):
+    vocab_filename = model_dir / "vocab.txt"
+    vocab_filename.write_text("\n".join(VOCAB) + "\n", encoding="utf-8")
+    transformers.BertTokenizerFast(vocab_file=str(vocab_filename)).save_pretrained(model_dir)
+
+    # about the width of distilbert, with fewer layers
+    config = transformers.BertConfig(
+        vocab_size=len(VOCAB), hidden_size=768, num_hidden_layers=2, num_attention_heads=12,
+        intermediate_size=3072, max_position_embeddings=128, num_labels=3,
+        id2label={0: "negative", 1: "neutral", 2: "positive"}, label2id={"negative": 0, "neutral": 1, "positive": 2}
+    )
+    transformers.BertForSequenceClassification(config).save_pretrained(model_dir)
+
+
+def run(sentiment_analysis, texts):
+    times = []
+    for _ in range(RUNS):
+        start = perf_counter()
+        results = sentiment_analysis(texts, truncation=True, padding=True, max_length=128, batch_size=BATCH_SIZE)
+        times.append(perf_counter() - start)
+    return results, min(times)
+
+
+def main():
+    random.seed(0)
+    torch.manual_seed(0)
+    torch.set_num_threads(1)
+
+    words = VOCAB[5:]
+    texts = [" ".join(random.choices(words, k=random.randint(5, 40))) for _ in range(SENTENCES)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_dir = Path(tmp_dir) / "model"
+        model_dir.mkdir()
+        create_checkpoint(model_dir)
+
+        backends = {
+            "torch": transformers.pipeline("sentiment-analysis", model=str(model_dir), tokenizer=str(model_dir), top_k=3, device=-1),
+            "onnx": load_onnx_sentiment_analysis(str(model_dir), None, 3, False, tmp_dir),
+            "onnx-int8": load_onnx_sentiment_analysis(str(model_dir), None, 3, True, tmp_dir),
+        }
+
+        print(f"{SENTENCES} sentences, batch size {BATCH_SIZE}, 1 thread, best of {RUNS}")
+        torch_results = None
+        for name, sentiment_analysis in backends.items():
+            results, seconds = run(sentiment_analysis, texts)
+            scores = [{r["label"]: r["score"] for r in text_results} for text_results in results]
+            if torch_results is None:
+                torch_results = scores
+            max_diff = max(
+                abs(s[label] - t[label])
+                for s, t in zip(scores, torch_results)
+                for label in t
+            )
+            same_label = sum(
+                max(s, key=s.get) == max(t, key=t.get)
+                for s, t in zip(scores, torch_results)
+            )
+            print(f"{name:>10}: {seconds:6.2f} s, {SENTENCES / seconds:7.1f} sentences/s, max score diff {max_diff:.6f}, same top label {same_label}/{SENTENCES}")
+
+
+if __name__ == "__main__":
+    main()
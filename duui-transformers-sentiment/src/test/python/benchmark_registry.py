@@ -0,0 +1,68 @@
+"""
+Compares the time and memory to get the model configs at startup: importing all enabled config
+modules, as the service did before, against loading the build-time manifest. Each variant runs
+in a fresh interpreter, memory is the growth of the resident set size (Linux only).
+
+Run from the component root: python src/test/python/benchmark_registry.py
+"""
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parents[3]
+RUNS = 5
+
+SETUP = """
+import sys, time
+sys.path.insert(0, {root!r})
+def rss_kb():
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+rss_before = rss_kb()
+start = time.perf_counter()
+"""
+
+VARIANTS = {
+    "import all modules": """
+from src.main.python.models.registry import MODEL_MODULES
+from importlib import import_module
+models = {{}}
+for module_name in MODEL_MODULES:
+    models.update(import_module("src.main.python.models." + module_name).SUPPORTED_MODEL)
+""",
+    "load manifest": """
+from src.main.python.models.registry import ModelRegistry
+models = ModelRegistry.load({manifest!r})
+""",
+}
+
+REPORT = """
+seconds = time.perf_counter() - start
+print(seconds, rss_kb() - rss_before, len(models))
+"""
+
+
+def main():
+    sys.path.insert(0, str(ROOT))
+    from src.main.python.models.registry import build_manifest
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest = Path(tmp_dir) / "manifest.json"
+        manifest.write_text(json.dumps(build_manifest()), encoding="utf-8")
+
+        for name, code in VARIANTS.items():
+            script = (SETUP + code + REPORT).format(root=str(ROOT), manifest=str(manifest))
+            results = []
+            for _ in range(RUNS):
+                output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+                seconds, rss_kb, count = output.split()
+                results.append((float(seconds), int(rss_kb), int(count)))
+            seconds = sorted(r[0] for r in results)[RUNS // 2]
+            rss_kb = sorted(r[1] for r in results)[RUNS // 2]
+            print(f"{name:>18}: {results[0][2]} models, {seconds*1000:7.2f} ms, +{rss_kb} KB RSS (median of {RUNS})")
+
+
+if __name__ == "__main__":
+    main()
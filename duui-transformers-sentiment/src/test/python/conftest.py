@@ -0,0 +1,166 @@
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+# the service modules are imported as "src.main.python...", like uvicorn does from the component root
+COMPONENT_ROOT = Path(__file__).parents[3]
+sys.path.insert(0, str(COMPONENT_ROOT))
+
+VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [
+    "this", "is", "a", "great", "bad", "example", "sentence", "i", "hate", "love", "the", "movie", "!", ".",
+]
+
+
+def import_service(monkeypatch):
+    """
+    Import the service module with the required settings, from the component root like uvicorn does.
+    """
+    pytest.importorskip("fastapi")
+    pytest.importorskip("cassis")
+
+    monkeypatch.setenv("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_NAME", "test")
+    monkeypatch.setenv("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_ANNOTATOR_VERSION", "test")
+    monkeypatch.setenv("TEXTIMAGER_DUUI_TRANSFORMERS_SENTIMENT_MODEL_CACHE_SIZE", "4")
+    # the typesystem and Lua script are loaded relative to the component root
+    monkeypatch.chdir(COMPONENT_ROOT)
+    return import_module("src.main.python.textimager_duui_transformers_sentiment")
+
+
+def save_bert_model(model_dir: Path, **config) -> Path:
+    """
+    Save a randomly initialised BERT sequence classifier with 3 labels and its tokenizer to model_dir.
+    """
+    import torch
+    import transformers
+
+    vocab_filename = model_dir / "vocab.txt"
+    vocab_filename.write_text("\n".join(VOCAB) + "\n", encoding="utf-8")
+    transformers.BertTokenizerFast(vocab_file=str(vocab_filename)).save_pretrained(model_dir)
+
+    torch.manual_seed(0)
+    config = transformers.BertConfig(
+        vocab_size=len(VOCAB), max_position_embeddings=64, num_labels=3,
+        id2label={0: "negative", 1: "neutral", 2: "positive"}, label2id={"negative": 0, "neutral": 1, "positive": 2},
+        **config
+    )
+    transformers.BertForSequenceClassification(config).save_pretrained(model_dir)
+
+    return model_dir
+
+
+@pytest.fixture(scope="session")
+def tiny_model_dir(tmp_path_factory):
+    """
+    Local checkpoint of a tiny randomly initialised BERT sequence classifier with 3 labels.
+    """
+    pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+
+    return save_bert_model(
+        tmp_path_factory.mktemp("tiny-bert"),
+        hidden_size=32, num_hidden_layers=2, num_attention_heads=2, intermediate_size=64
+    )
+
+
+def tiny_model_data(model_dir, **kwargs) -> dict:
+    # model config like in the "models" package, for the local tiny model
+    model_data = {
+        "type": "local",
+        "path": str(model_dir),
+        "version": "local",
+        "max_length": 64,
+        "mapping": {
+            "positive": 1,
+            "neutral": 0,
+            "negative": -1
+        },
+        "3sentiment": {
+            "pos": ["positive"],
+            "neu": ["neutral"],
+            "neg": ["negative"]
+        },
+        "preprocess": lambda text: text,
+        "languages": ["en"]
+    }
+    model_data.update(kwargs)
+    return model_data
+
+
+@pytest.fixture
+def service(monkeypatch, tiny_model_dir):
+    """
+    The service with the local tiny models "tiny/a", "tiny/b" and an adapter model "tiny/adapter".
+    """
+    from src.main.python.models.registry import ModelRegistry
+
+    service = import_service(monkeypatch)
+
+    models = {
+        "tiny/a": tiny_model_data(tiny_model_dir),
+        "tiny/b": tiny_model_data(tiny_model_dir),
+        "tiny/adapter": tiny_model_data(tiny_model_dir, type="adapter"),
+    }
+    registry = ModelRegistry({
+        model_name: {"module": None, "version": model_data["version"], "max_length": model_data["max_length"], "languages": model_data["languages"]}
+        for model_name, model_data in models.items()
+    })
+    registry.models = models
+    monkeypatch.setattr(service, "SUPPORTED_MODELS", registry)
+
+    return service
+
+
+def process(service, **parameters):
+    from fastapi.testclient import TestClient
+
+    request = {
+        "selections": [{
+            "selection": "text",
+            "sentences": [
+                {"text": "this is a great example sentence !", "begin": 0, "end": 34},
+                {"text": "i hate the movie .", "begin": 35, "end": 53},
+            ],
+        }],
+        "lang": "en",
+        "doc_len": 53,
+        "model_name": "",
+        "batch_size": 8,
+        "ignore_max_length_truncation_padding": False,
+    }
+    request.update(parameters)
+
+    with TestClient(service.app) as client:
+        response = client.post("/v1/process", json=request)
+    assert response.status_code == 200
+    return response.json()
+
+
+def selection_annotations(selection: dict) -> list:
+    """
+    The sentiment annotations of a selection of a JSON response, read like the Lua script reads the per-sentence
+    and the columnar format.
+    """
+    if selection.get("columns") is None:
+        return [
+            (
+                s["sentence"]["begin"], s["sentence"]["end"], s["sentiment"], s["score"], s["details"],
+                s["polarity"], s["pos"], s["neu"], s["neg"]
+            )
+            for s in selection["sentences"]
+        ]
+
+    columns = selection["columns"]
+    return [
+        (
+            begin, columns["end"][j], columns["sentiment"][j], columns["score"][j],
+            {
+                label: scores[j]
+                for label, scores in zip(columns["labels"], columns["details"])
+                if scores[j] is not None
+            },
+            columns["polarity"][j], columns["pos"][j], columns["neu"][j], columns["neg"][j]
+        )
+        for j, begin in enumerate(columns["begin"])
+    ]
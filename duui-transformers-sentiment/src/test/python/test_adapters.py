@@ -0,0 +1,121 @@
+import gc
+import os
+
+import pytest
+
+from conftest import import_service, save_bert_model, tiny_model_data
+from src.main.python.model_cache import model_bytes
+
+transformers = pytest.importorskip("transformers")
+if not hasattr(transformers, "AutoAdapterModel"):
+    # the service pins adapter-transformers, which installs as "transformers"
+    pytest.skip("adapter-transformers is not installed", allow_module_level=True)
+
+LABELS = {0: "negative", 1: "neutral", 2: "positive"}
+SENTENCE = "this is a great example sentence !"
+
+
+def save_adapter(model_dir, adapter_dir, name, reduction_factor):
+    model = transformers.AutoAdapterModel.from_pretrained(model_dir)
+    model.add_adapter(name, config=transformers.PfeifferConfig(reduction_factor=reduction_factor))
+    model.add_classification_head(name, num_labels=len(LABELS), id2label=LABELS)
+    model.save_adapter(str(adapter_dir), name)
+
+
+def save_adapters(model_dir, tmp_path_factory):
+    adapter_dirs = []
+    for name, reduction_factor in [("first", 4), ("second", 8)]:
+        adapter_dir = tmp_path_factory.mktemp(name)
+        save_adapter(model_dir, adapter_dir, name, reduction_factor)
+        adapter_dirs.append(str(adapter_dir))
+    return adapter_dirs
+
+
+def adapter_model_data(model_dir, adapter_dir):
+    # model config of an adapter on top of a local base model, like in the "models" package
+    return tiny_model_data(model_dir, type="adapter", model_type="local", model_path=str(model_dir), adapter_path=adapter_dir)
+
+
+def resident_bytes():
+    # current, not peak, resident memory of this process
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.fixture(scope="module")
+def adapter_dirs(tiny_model_dir, tmp_path_factory):
+    return save_adapters(tiny_model_dir, tmp_path_factory)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = import_service(monkeypatch)
+
+    service.model_cache.entries.clear()
+    yield service
+    service.model_cache.entries.clear()
+
+
+def test_two_adapters_share_one_base_model(service, tiny_model_dir, adapter_dirs):
+    first = service.get_sentiment_analysis("tiny/first", adapter_model_data(tiny_model_dir, adapter_dirs[0]))
+    base_model = first.model
+    base_parameters = {id(p) for p in base_model.base_model.parameters()}
+    first_results = first([SENTENCE])
+
+    second = service.get_sentiment_analysis("tiny/second", adapter_model_data(tiny_model_dir, adapter_dirs[1]))
+    second_results = second([SENTENCE])
+
+    # one pipeline and one model object, loaded once and cached by the base model only
+    assert first is second
+    assert second.model is base_model
+    assert list(service.model_cache.entries) == [("load_adapter_base_model", str(tiny_model_dir), None)]
+    assert service.load_adapter_base_model(str(tiny_model_dir), None) is first
+
+    # the base parameters are not copied, the adapters only add their own
+    assert base_parameters <= {id(p) for p in base_model.base_model.parameters()}
+    assert set(first.adapters.values()) == {"first", "second"}
+
+    # each adapter is used with its own head
+    assert len(first_results[0]) == len(second_results[0]) == len(LABELS)
+    assert first_results != second_results
+
+
+def test_adapters_are_loaded_once(service, tiny_model_dir, adapter_dirs):
+    sentiment_analysis = service.get_sentiment_analysis("tiny/first", adapter_model_data(tiny_model_dir, adapter_dirs[0]))
+    first_parameters = [id(p) for p in sentiment_analysis.model.heads["first"].parameters()]
+    service.get_sentiment_analysis("tiny/second", adapter_model_data(tiny_model_dir, adapter_dirs[1]))
+
+    loaded_bytes = model_bytes(sentiment_analysis)
+    again = service.get_sentiment_analysis("tiny/first", adapter_model_data(tiny_model_dir, adapter_dirs[0]))
+
+    # activating a loaded adapter again reuses its modules
+    assert again is sentiment_analysis
+    assert again.active_adapter == "first"
+    assert len(again.adapters) == 2
+    assert [id(p) for p in again.model.heads["first"].parameters()] == first_parameters
+    assert model_bytes(again) == loaded_bytes
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc to measure the resident memory")
+def test_second_adapter_does_not_copy_base_model_memory(service, tmp_path_factory):
+    # a base model of about 50 MB, large enough to see a copy of it in the resident memory
+    model_dir = save_bert_model(
+        tmp_path_factory.mktemp("base-bert"),
+        hidden_size=512, num_hidden_layers=4, num_attention_heads=8, intermediate_size=2048
+    )
+    adapter_dirs = save_adapters(model_dir, tmp_path_factory)
+
+    first = service.get_sentiment_analysis("base/first", adapter_model_data(model_dir, adapter_dirs[0]))
+    first([SENTENCE])
+    base_bytes = model_bytes(first)
+    gc.collect()
+    rss_before = resident_bytes()
+
+    second = service.get_sentiment_analysis("base/second", adapter_model_data(model_dir, adapter_dirs[1]))
+    second([SENTENCE])
+    gc.collect()
+    rss_growth = resident_bytes() - rss_before
+
+    assert second is first
+    # a second base model would add at least its own size
+    assert rss_growth < base_bytes / 2
@@ -0,0 +1,50 @@
+from src.main.python.batching import token_budget_batches, padded_tokens
+
+
+def test_sorted_by_length():
+    lengths = [5, 1, 4, 2, 3]
+
+    batches = token_budget_batches(lengths, max_tokens=100, max_batch_size=2)
+
+    assert batches == [[1, 3], [4, 2], [0]]
+
+
+def test_token_budget_boundary():
+    # 3 texts of length 4 fit exactly into 12 padded tokens, the 4th does not
+    lengths = [4, 4, 4, 4]
+
+    batches = token_budget_batches(lengths, max_tokens=12, max_batch_size=100)
+
+    assert batches == [[0, 1, 2], [3]]
+    assert padded_tokens(lengths, batches) == 16
+
+
+def test_budget_counts_padding_to_longest_text():
+    # 2+2 = 4 real tokens, but the batch of both would be padded to 2*10 = 20
+    lengths = [2, 10]
+
+    assert token_budget_batches(lengths, max_tokens=19, max_batch_size=100) == [[0], [1]]
+    assert token_budget_batches(lengths, max_tokens=20, max_batch_size=100) == [[0, 1]]
+
+
+def test_text_longer_than_budget_gets_own_batch():
+    lengths = [3, 50, 3]
+
+    batches = token_budget_batches(lengths, max_tokens=10, max_batch_size=100)
+
+    assert batches == [[0, 2], [1]]
+
+
+def test_every_text_in_exactly_one_batch():
+    lengths = [(i * 37) % 101 + 1 for i in range(1000)]
+
+    batches = token_budget_batches(lengths, max_tokens=512, max_batch_size=32)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        assert len(batch) <= 32
+        assert len(batch) == 1 or len(batch) * max(lengths[i] for i in batch) <= 512
+
+
+def test_empty():
+    assert token_budget_batches([], max_tokens=10, max_batch_size=10) == []
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from conftest import process, selection_annotations, tiny_model_data
+
+TEXTS = ["this is a great example sentence !", "i hate the movie .", "the movie is bad ."]
+
+
+def model_results(sentences_count):
+    # pipeline results with all labels, except the last sentence without "neutral"
+    results = []
+    for i in range(sentences_count):
+        result = [
+            {"label": "positive", "score": 0.6 - 0.1 * i},
+            {"label": "neutral", "score": 0.3},
+            {"label": "negative", "score": 0.1 + 0.1 * i},
+        ]
+        if i == sentences_count - 1 and sentences_count > 1:
+            result = [r for r in result if r["label"] != "neutral"]
+        results.append(result)
+    return results
+
+
+def selections(service, sentences_count):
+    from src.main.python.duui.uima import UimaSentence, UimaSentenceSelection
+
+    sentences, begin = [], 0
+    for text in TEXTS[:sentences_count]:
+        sentences.append(UimaSentence(text=text, begin=begin, end=begin + len(text)))
+        begin += len(text) + 1
+    selection = UimaSentenceSelection(selection="text", sentences=sentences)
+
+    model_data = tiny_model_data("unused")
+    processed_sentences = service.map_selection(model_results(sentences_count), model_data, selection, begin)
+    return [
+        json.loads(service.create_selection("text", processed_sentences, columnar).json())
+        for columnar in [False, True]
+    ]
+
+
+@pytest.mark.parametrize("sentences_count", [0, 1, 3])
+def test_columnar_selection_matches_sentences(service, sentences_count):
+    sentence_selection, columnar_selection = selections(service, sentences_count)
+
+    assert columnar_selection["sentences"] == []
+    assert columnar_selection["columns"] is not None
+    assert sentence_selection["columns"] is None
+    assert selection_annotations(columnar_selection) == selection_annotations(sentence_selection)
+    # the sentences and their average, if there is more than one sentence
+    assert len(selection_annotations(columnar_selection)) == {0: 0, 1: 1, 3: 4}[sentences_count]
+
+
+def test_columnar_selection_marks_missing_labels(service):
+    _, columnar_selection = selections(service, 3)
+    columns = columnar_selection["columns"]
+
+    assert columns["labels"] == ["positive", "neutral", "negative"]
+    assert columns["details"][1][2] is None
+    assert all(len(scores) == len(columns["begin"]) for scores in columns["details"])
+
+
+def test_empty_columnar_selection(service):
+    _, columnar_selection = selections(service, 0)
+
+    assert columnar_selection["columns"] == {
+        "begin": [], "end": [], "sentiment": [], "score": [], "polarity": [], "pos": [], "neu": [], "neg": [],
+        "labels": [], "details": [],
+    }
+
+
+@pytest.mark.parametrize("model_names", [None, ["tiny/a", "tiny/b"]])
+def test_columnar_response_matches_sentences(service, model_names):
+    parameters = {"model_name": "tiny/a"} if model_names is None else {"model_names": model_names}
+    sentence_response = process(service, **parameters)
+    columnar_response = process(service, columnar=True, **parameters)
+
+    assert columnar_response["meta"] == sentence_response["meta"]
+    assert len(columnar_response["selections"]) == len(sentence_response["selections"])
+    for columnar_selection, sentence_selection in zip(columnar_response["selections"], sentence_response["selections"]):
+        assert columnar_selection["meta"] == sentence_selection["meta"]
+        assert selection_annotations(columnar_selection) == selection_annotations(sentence_selection)
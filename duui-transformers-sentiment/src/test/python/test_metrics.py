@@ -0,0 +1,108 @@
+import re
+
+from conftest import process
+from src.main.python.metrics import MetricsRegistry
+
+SAMPLE = re.compile(r'^(?P<name>[a-z_]+)(?:\{(?P<labels>[^}]*)\})? (?P<value>\S+)$')
+
+SINGLE_MODEL_PHASES = ["parse", "preprocess", "cache", "lock_wait", "load_model", "tokenize", "inference", "map_sentiment", "aggregate", "total"]
+SWEEP_PHASES = ["parse", "preprocess", "lock_wait", "load_model", "tokenize", "inference", "map_sentiment", "aggregate", "total"]
+
+
+def parse_samples(text):
+    # (name, labels) -> value of all samples in the Prometheus text format
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        labels = tuple(re.findall(r'(\w+)="([^"]*)"', match["labels"] or ""))
+        samples[(match["name"], labels)] = float(match["value"])
+    return samples
+
+
+def scrape(service):
+    from fastapi.testclient import TestClient
+
+    with TestClient(service.app) as client:
+        response = client.get("/v1/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    return response.text, parse_samples(response.text)
+
+
+def phase_counts(samples):
+    return {
+        dict(labels)["phase"]: value
+        for (name, labels), value in samples.items()
+        if name == "duui_sentiment_phase_seconds_count"
+    }
+
+
+def check_phase_histogram(service, samples, phase):
+    buckets = service.phase_seconds.buckets
+    bucket_counts = [
+        samples[("duui_sentiment_phase_seconds_bucket", (("phase", phase), ("le", str(le))))]
+        for le in buckets + ["+Inf"]
+    ]
+    # buckets are cumulative, the last one counts all observations
+    assert bucket_counts == sorted(bucket_counts)
+    assert bucket_counts[-1] == samples[("duui_sentiment_phase_seconds_count", (("phase", phase),))]
+    assert samples[("duui_sentiment_phase_seconds_sum", (("phase", phase),))] >= 0
+
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter")
+    histogram = registry.histogram("test_seconds", "Test histogram", [0.1, 1])
+    counter.inc(2, kind="a")
+    histogram.observe(0.05, phase="x")
+    histogram.observe(0.5, phase="x")
+    histogram.observe(5, phase="x")
+
+    assert registry.render().splitlines() == [
+        "# HELP test_total Test counter",
+        "# TYPE test_total counter",
+        'test_total{kind="a"} 2',
+        "# HELP test_seconds Test histogram",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{phase="x",le="0.1"} 1',
+        'test_seconds_bucket{phase="x",le="1"} 2',
+        'test_seconds_bucket{phase="x",le="+Inf"} 3',
+        'test_seconds_sum{phase="x"} 5.55',
+        'test_seconds_count{phase="x"} 3',
+    ]
+
+
+def test_single_model_request_records_each_phase(service):
+    _, before = scrape(service)
+    process(service, model_name="tiny/a")
+    text, after = scrape(service)
+
+    assert "# TYPE duui_sentiment_phase_seconds histogram" in text
+    counts_before, counts_after = phase_counts(before), phase_counts(after)
+    for phase in SINGLE_MODEL_PHASES:
+        assert counts_after[phase] - counts_before.get(phase, 0) == 1, phase
+        check_phase_histogram(service, after, phase)
+
+    # both sentences ran through the model
+    assert after[("duui_sentiment_sentences_total", ())] - before.get(("duui_sentiment_sentences_total", ()), 0) == 2
+
+
+def test_sweep_records_each_phase(service):
+    _, before = scrape(service)
+    process(service, model_names=["tiny/a", "tiny/b"])
+    _, after = scrape(service)
+
+    counts_before, counts_after = phase_counts(before), phase_counts(after)
+    added = {phase: counts_after[phase] - counts_before.get(phase, 0) for phase in SWEEP_PHASES}
+    # the tokenizer is loaded and the sentences are tokenized once, each model loads and runs once
+    assert added == {
+        "parse": 1, "preprocess": 1, "lock_wait": 3, "load_model": 3, "tokenize": 1, "inference": 2,
+        "map_sentiment": 2, "aggregate": 2, "total": 1,
+    }
+    for phase in SWEEP_PHASES:
+        check_phase_histogram(service, after, phase)
+
+    assert after[("duui_sentiment_sentences_total", ())] - before.get(("duui_sentiment_sentences_total", ()), 0) == 4
@@ -0,0 +1,79 @@
+from src.main.python.model_cache import ModelCache
+
+
+class FakeModel:
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+
+
+class Loader:
+    def __init__(self, cache, nbytes=100):
+        self.loads = []
+        self.nbytes = nbytes
+
+        @cache.cached
+        def load_model(name):
+            self.loads.append(name)
+            return FakeModel(self.nbytes)
+
+        self.load_model = load_model
+
+
+def cached_names(cache):
+    return [key[1] for key in cache.entries]
+
+
+def test_size_0_disables_caching():
+    cache = ModelCache(0, 0)
+    loader = Loader(cache)
+
+    first = loader.load_model("a")
+    second = loader.load_model("a")
+
+    assert first is not second
+    assert loader.loads == ["a", "a"]
+    assert cached_names(cache) == []
+
+
+def test_count_limit():
+    cache = ModelCache(0, 2)
+    loader = Loader(cache)
+
+    for name in ["a", "b", "a", "c", "a"]:
+        loader.load_model(name)
+
+    # "b" is least recently used when "c" is loaded
+    assert loader.loads == ["a", "b", "c"]
+    assert cached_names(cache) == ["c", "a"]
+
+
+def test_negative_size_has_no_count_limit():
+    cache = ModelCache(0, -1)
+    loader = Loader(cache)
+
+    for name in ["a", "b", "c", "d"]:
+        loader.load_model(name)
+
+    assert cached_names(cache) == ["a", "b", "c", "d"]
+
+
+def test_memory_limit():
+    cache = ModelCache(250, -1)
+    loader = Loader(cache)
+
+    for name in ["a", "b", "c"]:
+        loader.load_model(name)
+
+    assert cached_names(cache) == ["b", "c"]
+    assert cache.used_bytes() == 200
+
+
+def test_model_larger_than_memory_limit_is_kept():
+    cache = ModelCache(50, -1)
+    loader = Loader(cache)
+
+    loader.load_model("a")
+    loader.load_model("a")
+
+    assert loader.loads == ["a"]
+    assert cache.stats()["used_bytes"] == 100
@@ -0,0 +1,50 @@
+import pytest
+
+from src.main.python.onnx_backend import load_onnx_sentiment_analysis, onnx_filename
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+transformers = pytest.importorskip("transformers")
+
+TEXTS = [
+    "this is a great example sentence !",
+    "i hate the movie .",
+    "this is a",
+    "i love the movie ! this is a great example .",
+]
+
+
+def scores(results):
+    # label -> score per text
+    return [{r["label"]: r["score"] for r in text_results} for text_results in results]
+
+
+@pytest.fixture(scope="module")
+def torch_results(tiny_model_dir):
+    sentiment_analysis = transformers.pipeline(
+        "sentiment-analysis", model=str(tiny_model_dir), tokenizer=str(tiny_model_dir), top_k=3, device=-1
+    )
+    return scores(sentiment_analysis(TEXTS, truncation=True, padding=True, max_length=64, batch_size=2))
+
+
+@pytest.mark.parametrize("quantize, tolerance", [(False, 1e-5), (True, 0.05)])
+def test_onnx_matches_torch(tiny_model_dir, tmp_path, torch_results, quantize, tolerance):
+    sentiment_analysis = load_onnx_sentiment_analysis(str(tiny_model_dir), None, 3, quantize, str(tmp_path))
+    onnx_results = scores(sentiment_analysis(TEXTS, truncation=True, padding=True, max_length=64, batch_size=2))
+
+    assert len(onnx_results) == len(torch_results)
+    for onnx_scores, torch_scores in zip(onnx_results, torch_results):
+        assert onnx_scores.keys() == torch_scores.keys()
+        for label, score in torch_scores.items():
+            assert onnx_scores[label] == pytest.approx(score, abs=tolerance)
+
+
+def test_export_is_cached(tiny_model_dir, tmp_path):
+    load_onnx_sentiment_analysis(str(tiny_model_dir), None, 3, True, str(tmp_path))
+    filename = onnx_filename(str(tmp_path), str(tiny_model_dir), None, True)
+    modified = (tmp_path / filename).stat().st_mtime_ns
+
+    sentiment_analysis = load_onnx_sentiment_analysis(str(tiny_model_dir), None, 3, True, str(tmp_path))
+
+    assert (tmp_path / filename).stat().st_mtime_ns == modified
+    assert sentiment_analysis.nbytes > 0
@@ -0,0 +1,83 @@
+import json
+import sys
+
+import pytest
+
+from src.main.python.models import registry
+from src.main.python.models.registry import ModelRegistry
+
+MODEL_NAME = "cardiffnlp/twitter-roberta-base-sentiment"
+MODEL_MODULE = "cardiffnlp_twitter_roberta_base_sentiment"
+
+
+def imported_model_modules():
+    prefix = f"{registry.__package__}."
+    return {
+        name[len(prefix):]
+        for name in sys.modules
+        if name.startswith(prefix) and name != registry.__name__
+    }
+
+
+@pytest.fixture
+def manifest_filename(tmp_path):
+    # forget model modules imported by other tests
+    for module_name in imported_model_modules():
+        del sys.modules[f"{registry.__package__}.{module_name}"]
+
+    manifest = {
+        MODEL_NAME: {
+            "module": MODEL_MODULE,
+            "version": "b636d90b2ed53d7ba6006cefd76f29cd354dd9da",
+            "max_length": 512,
+            "languages": ["en"],
+        },
+        "oliverguhr/german-sentiment-bert": {
+            "module": "oliverguhr_german_sentiment_bert",
+            "version": "f75bd74c8349ba1b0fb7f5ca9b6bce19ba7e7ba5",
+            "max_length": 512,
+            "languages": ["de"],
+        },
+    }
+    filename = tmp_path / "manifest.json"
+    filename.write_text(json.dumps(manifest), encoding="utf-8")
+    return filename
+
+
+def test_load_does_not_import_model_modules(manifest_filename):
+    models = ModelRegistry.load(manifest_filename)
+
+    assert len(models) == 2
+    assert MODEL_NAME in models
+    assert "unknown/model" not in models
+    assert models.manifest[MODEL_NAME]["languages"] == ["en"]
+    assert imported_model_modules() == set()
+
+
+def test_model_module_imported_on_first_access(manifest_filename):
+    models = ModelRegistry.load(manifest_filename)
+
+    model_data = models[MODEL_NAME]
+
+    assert model_data["max_length"] == 512
+    assert model_data["preprocess"]("@someone see http://example.com") == "@user see http"
+    assert imported_model_modules() == {MODEL_MODULE}
+    assert models[MODEL_NAME] is model_data
+
+
+def test_unknown_model(manifest_filename):
+    models = ModelRegistry.load(manifest_filename)
+
+    with pytest.raises(KeyError):
+        models["unknown/model"]
+
+
+def test_manifest_matches_model_modules():
+    pytest.importorskip("emoji")
+
+    manifest = registry.build_manifest()
+
+    assert len(manifest) >= len(registry.MODEL_MODULES)
+    for model_name, model_info in manifest.items():
+        assert model_info["module"] in registry.MODEL_MODULES
+        assert set(model_info) == {"module", "version", "max_length", "languages"}
@@ -0,0 +1,38 @@
+from src.main.python.result_cache import SentenceResultCache
+
+RESULT = [{"label": "positive", "score": 0.9}]
+
+
+def test_key_depends_on_model_and_text():
+    key = SentenceResultCache.key("model", "v1", "torch", False, "text")
+
+    assert key == SentenceResultCache.key("model", "v1", "torch", False, "text")
+    assert key != SentenceResultCache.key("model", "v2", "torch", False, "text")
+    assert key != SentenceResultCache.key("model", "v1", "onnx", False, "text")
+    assert key != SentenceResultCache.key("model", "v1", "torch", True, "text")
+    assert key != SentenceResultCache.key("model", "v1", "torch", False, "other text")
+    # lone surrogates, see "fix_unicode_problems"
+    assert SentenceResultCache.key("model", "v1", "torch", False, "\udce2")
+
+
+def test_lru_eviction():
+    cache = SentenceResultCache(2)
+    cache.put_many([("a", RESULT), ("b", RESULT)])
+    cache.get_many(["a"])
+    cache.put_many([("c", RESULT)])
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+def test_size_0_keeps_nothing_in_memory():
+    cache = SentenceResultCache(0)
+    cache.put_many([("a", RESULT)])
+
+    assert cache.get_many(["a"]) == {}
+
+
+def test_database_survives_restart(tmp_path):
+    db_filename = str(tmp_path / "results.db")
+    SentenceResultCache(0, db_filename).put_many([("a", RESULT)])
+
+    assert SentenceResultCache(0, db_filename).get_many(["a", "b"]) == {"a": RESULT}
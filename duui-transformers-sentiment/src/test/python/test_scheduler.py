@@ -0,0 +1,76 @@
+from threading import Lock
+
+from src.main.python.scheduler import BatchScheduler
+
+
+class RecordingBatch:
+    def __init__(self):
+        self.calls = []
+        self.lock = Lock()
+
+    def __call__(self, key, texts, context):
+        with self.lock:
+            self.calls.append((key, list(texts), context))
+        return [f"{key}:{text}" for text in texts]
+
+
+def submit_all(scheduler, requests):
+    futures = [scheduler.submit(key, texts, context) for key, texts, context in requests]
+    return [future.result(timeout=5) for future in futures]
+
+
+def test_merges_requests_with_same_key():
+    process_batch = RecordingBatch()
+    scheduler = BatchScheduler(process_batch, max_sentences=10, max_wait_ms=200)
+
+    results = submit_all(scheduler, [
+        ("a", ["1", "2"], None),
+        ("a", ["3"], None),
+        ("a", ["4", "5"], None),
+    ])
+
+    assert results == [["a:1", "a:2"], ["a:3"], ["a:4", "a:5"]]
+    assert [texts for _, texts, _ in process_batch.calls] == [["1", "2", "3", "4", "5"]]
+
+
+def test_does_not_merge_different_keys():
+    # e.g. requests with a different batch size
+    process_batch = RecordingBatch()
+    scheduler = BatchScheduler(process_batch, max_sentences=10, max_wait_ms=200)
+
+    results = submit_all(scheduler, [
+        (("model", 8), ["1"], None),
+        (("model", 16), ["2"], None),
+        (("model", 8), ["3"], None),
+    ])
+
+    assert results == [["('model', 8):1"], ["('model', 16):2"], ["('model', 8):3"]]
+    assert sorted((key, texts) for key, texts, _ in process_batch.calls) == [
+        (("model", 8), ["1", "3"]),
+        (("model", 16), ["2"]),
+    ]
+
+
+def test_sentence_budget():
+    process_batch = RecordingBatch()
+    scheduler = BatchScheduler(process_batch, max_sentences=3, max_wait_ms=200)
+
+    results = submit_all(scheduler, [
+        ("a", ["1", "2"], None),
+        ("a", ["3", "4"], None),
+        ("a", ["5"], None),
+    ])
+
+    assert results == [["a:1", "a:2"], ["a:3", "a:4"], ["a:5"]]
+    assert [texts for _, texts, _ in process_batch.calls] == [["1", "2", "5"], ["3", "4"]]
+
+
+def test_errors_are_passed_to_all_requests():
+    def process_batch(key, texts, context):
+        raise ValueError("model failed")
+
+    scheduler = BatchScheduler(process_batch, max_sentences=10, max_wait_ms=200)
+    futures = [scheduler.submit("a", ["1"], None), scheduler.submit("a", ["2"], None)]
+
+    for future in futures:
+        assert isinstance(future.exception(timeout=5), ValueError)
@@ -0,0 +1,30 @@
+import pytest
+
+from conftest import process
+
+
+def test_sweep_does_not_need_model_name(service):
+    response = process(service, model_name="unknown/model", model_names=["tiny/a", "tiny/b"])
+
+    assert [s["meta"]["modelName"] for s in response["selections"]] == ["tiny/a", "tiny/b"]
+    assert response["meta"]["modelName"] == "tiny/a"
+    # two sentences and the average
+    assert all(len(s["sentences"]) == 3 for s in response["selections"])
+
+
+def test_sweep_equals_single_model(service):
+    sweep = process(service, model_names=["tiny/a", "tiny/b"])
+    single = process(service, model_name="tiny/a")
+
+    for sweep_sentence, single_sentence in zip(sweep["selections"][0]["sentences"], single["selections"][0]["sentences"]):
+        assert sweep_sentence["sentiment"] == single_sentence["sentiment"]
+        assert sweep_sentence["details"].keys() == single_sentence["details"].keys()
+        for label, score in single_sentence["details"].items():
+            assert sweep_sentence["details"][label] == pytest.approx(score, abs=1e-5)
+
+
+def test_sweep_rejects_adapter_models(service):
+    response = process(service, model_names=["tiny/a", "tiny/adapter"])
+
+    assert response["selections"] == []
+    assert response["meta"] is None